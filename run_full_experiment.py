@@ -19,10 +19,11 @@ import time
 script_dir = os.path.dirname(os.path.abspath(__file__))
 src_dir = os.path.join(script_dir, 'src')
 sys.path.insert(0, src_dir)
-os.chdir(script_dir)
 
+# Only the simulation modules are imported here: worker processes that
+# re-import this script must not pay for matplotlib, so the visualizer
+# is loaded lazily once the runs are done.
 from experiment_runner import ExperimentRunner, ExperimentConfig, DifficultyLevel
-from experiment_visualizer import ExperimentVisualizer, MATPLOTLIB_AVAILABLE
 
 
 def run_full_experiment():
@@ -35,7 +36,8 @@ def run_full_experiment():
     - Hard: 20 runs (challenging difficulty)
     - Extreme: 20 runs (maximum difficulty)
     
-    Total: 80 simulations across 4 difficulty levels
+    Total: 80 simulations across 4 difficulty levels, spread over
+    all CPU cores since every run is independent.
     """
     
     print("\n" + "=" * 70)
@@ -45,6 +47,7 @@ def run_full_experiment():
     print("╚════════════════════════════════════════════════════════════════════╝")
     print("=" * 70)
     
+    os.chdir(script_dir)
     output_dir = "data/experiments"
     runner = ExperimentRunner(output_dir)
     
@@ -124,7 +127,7 @@ def run_full_experiment():
     print("-" * 50)
     
     start_time = time.time()
-    results = runner.run_all_experiments()
+    results = runner.run_all_experiments(parallel=True)
     duration = time.time() - start_time
     
     print(f"\n\n✓ Experiments completed in {duration:.1f}s")
@@ -141,6 +144,8 @@ def run_full_experiment():
     runner.print_summary()
     
     # Generate plots
+    from experiment_visualizer import ExperimentVisualizer, MATPLOTLIB_AVAILABLE
+    
     if MATPLOTLIB_AVAILABLE:
         print("\n📊 GENERATING VISUALIZATION PLOTS...")
         print("-" * 50)
@@ -34,6 +34,7 @@ Phase 9: Procedural Generation
 Phase 10: Experiments & Data Collection
     - metrics: Metrics collection and analysis
     - data_collector: CSV/JSON data persistence
+    - json_stream: Shared streaming JSON encoder
     - experiment_runner: Automated experiment execution
     - experiment_visualizer: Matplotlib visualization
 
@@ -27,8 +27,13 @@ class Direction(Enum):
     SOUTHWEST = (-1, 1)
 
 
+DIRECTION_OFFSETS = {direction: direction.value for direction in Direction}
+
+
 class CombatResult:
     
+    __slots__ = ('attacker', 'defender', 'damage_dealt', 'kill', 'timestamp')
+    
     def __init__(self, attacker, defender, damage_dealt, kill=False):
         self.attacker = attacker
         self.defender = defender
@@ -50,29 +55,33 @@ class CombatResult:
 
 class Trophy:
     
+    HONOUR_MULTIPLIERS = {
+        'skull': 2.0,
+        'spine': 1.5,
+        'claw': 1.0,
+        'artifact': 3.0,
+        'boss_part': 5.0
+    }
+    
+    __slots__ = ('name', 'trophy_type', 'value', 'origin_creature', 'collected_at', '_honour_value')
+    
     def __init__(self, name, trophy_type, value, origin_creature=None):
         self.name = name
         self.trophy_type = trophy_type
         self.value = value
         self.origin_creature = origin_creature
         self.collected_at = 0
+        self._honour_value = int(value * self.HONOUR_MULTIPLIERS.get(trophy_type, 1.0))
     
     def get_honour_value(self):
-        multipliers = {
-            'skull': 2.0,
-            'spine': 1.5,
-            'claw': 1.0,
-            'artifact': 3.0,
-            'boss_part': 5.0
-        }
-        return int(self.value * multipliers.get(self.trophy_type, 1.0))
+        return self._honour_value
     
     def to_dict(self):
         return {
             'name': self.name,
             'type': self.trophy_type,
             'value': self.value,
-            'honour_value': self.get_honour_value(),
+            'honour_value': self._honour_value,
             'origin': self.origin_creature,
             'collected_at': self.collected_at
         }
@@ -80,6 +89,8 @@ class Trophy:
 
 class ActionResult:
     
+    __slots__ = ('action_type', 'success', 'stamina_cost', 'message', 'combat_result', 'trophy_collected')
+    
     def __init__(self, action_type, success, stamina_cost=0, message=""):
         self.action_type = action_type
         self.success = success
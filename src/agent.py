@@ -2,8 +2,19 @@ from abc import ABC, abstractmethod
 import random
 
 
+_ADJACENT_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
 class Agent(ABC):
     
+    is_innocent = False
+    is_worthy_prey = True
+    can_detect_stealth = True
+    is_wildlife_threat = False
+    is_boss_target = False
+    is_creature = False
+    hostile = False
+    
     def __init__(self, name, x=0, y=0, max_health=100, max_stamina=100):
         self.name = name
         self.x = x
@@ -15,6 +26,11 @@ class Agent(ABC):
         self.is_alive = True
         self.age = 0
         self.grid = None
+        self.rng = random
+        self._moves_key = None
+        self._moves_cache = None
+        self._detect_key = None
+        self._detect_cache = None
     
     @property
     def position(self):
@@ -35,6 +51,13 @@ class Agent(ABC):
     def set_grid(self, grid):
         self.grid = grid
     
+    def set_rng(self, rng):
+        self.rng = rng
+    
+    def roll(self, low, high):
+        # One C-level draw instead of randint's randrange/_randbelow chain
+        return low + int(self.rng.random() * (high - low + 1))
+    
     def take_damage(self, amount):
         self.health = max(0, self.health - amount)
         if self.health <= 0:
@@ -60,53 +83,67 @@ class Agent(ABC):
         if not self.can_move() or not self.grid:
             return False
         
-        if self.grid.move_agent(self, new_x, new_y):
-            movement_cost = self.get_movement_cost(new_x, new_y)
-            self.consume_stamina(movement_cost)
-            self.handle_terrain_effects()
-            return True
-        return False
+        landing_cell = self.grid.move_agent(self, new_x, new_y)
+        if landing_cell is None:
+            return False
+        
+        self.consume_stamina(self.get_movement_cost(new_x, new_y))
+        damage = landing_cell.terrain.damage
+        if damage > 0:
+            self.take_damage(damage)
+        return True
     
     def get_movement_cost(self, x, y):
         if not self.grid:
             return 1
-        cell = self.grid.get_cell(x, y)
-        return cell.movement_cost
+        return self.grid.get_cell(x, y).terrain.movement_cost
     
     def handle_terrain_effects(self):
         if not self.grid:
             return
         
-        cell = self.grid.get_cell(self.x, self.y)
-        if cell.terrain_damage > 0:
-            self.take_damage(cell.terrain_damage)
+        damage = self.grid.get_cell(self.x, self.y).terrain.damage
+        if damage > 0:
+            self.take_damage(damage)
     
     def get_adjacent_positions(self):
         if not self.grid:
             return []
         
-        positions = []
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                new_x, new_y = self.grid.wrap_coordinates(self.x + dx, self.y + dy)
-                positions.append((new_x, new_y))
-        return positions
+        wrap = self.grid.wrap_coordinates
+        x, y = self.x, self.y
+        return [wrap(x + dx, y + dy) for dx, dy in _ADJACENT_OFFSETS]
+    
+    def _scan_key(self, radius=None):
+        grid = self.grid
+        return (grid, grid.occupancy_version, self.x, self.y, radius)
     
     def get_valid_moves(self):
-        valid_moves = []
-        for x, y in self.get_adjacent_positions():
-            cell = self.grid.get_cell(x, y)
-            if not cell.is_occupied:
-                valid_moves.append((x, y))
-        return valid_moves
+        key = self._scan_key()
+        if key != self._moves_key:
+            get_cell = self.grid.get_cell
+            self._moves_cache = tuple(
+                (x, y) for x, y in self.get_adjacent_positions() if not get_cell(x, y).is_occupied
+            )
+            self._moves_key = key
+        # Callers get their own list so edits never reach the cache
+        return list(self._moves_cache)
     
     def distance_to(self, other_agent):
         if not self.grid:
             return float('inf')
         return self.grid.calculate_distance(self.x, self.y, other_agent.x, other_agent.y)
     
+    def distances_to(self, others):
+        if not self.grid:
+            return [float('inf')] * len(others)
+        return self.grid.distances_from(self.x, self.y, others)
+    
+    def nearest_agent(self, others):
+        if not self.grid:
+            return (others[0] if others else None), float('inf')
+        return self.grid.nearest_agent(self.x, self.y, others)
+    
     def distance_to_position(self, x, y):
         if not self.grid:
             return float('inf')
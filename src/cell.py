@@ -3,6 +3,8 @@ from terrain import Terrain, TerrainType
 
 class Cell:
     
+    __slots__ = ('x', 'y', 'terrain', 'occupant', 'items', 'teleport_destination')
+    
     def __init__(self, x, y, terrain_type=TerrainType.EMPTY):
         self.x = x
         self.y = y
@@ -57,6 +59,6 @@ class Cell:
     def get_display_symbol(self):
         if self.occupant is not None:
             return self.occupant.symbol
-        if len(self.items) > 0:
+        if self.items:
             return '*'
         return self.terrain.symbol
@@ -1,7 +1,32 @@
-from enum import Enum
+from bisect import bisect_right
+from collections import deque
+from itertools import islice
+from types import MappingProxyType
 
 
-class ClanCodeViolation(Enum):
+HONOUR_THRESHOLDS = (0, 20, 40, 60, 80, 100)
+
+STANDING_THRESHOLDS = (0, 20, 40, 60, 80)
+
+CLAN_STANDINGS = ("exiled", "shamed", "probationary", "accepted", "respected", "exemplary")
+
+HONOUR_HISTORY_LIMIT = 1024
+
+EVENT_REWARD = 'reward'
+EVENT_VIOLATION = 'violation'
+
+CLAN_JUDGMENTS = (
+    "Exile - Cast out from clan",
+    "Dishonoured - Barely tolerated",
+    "Unblooded - Must prove themselves",
+    "Young Blood - Proving worth",
+    "Blooded - Respected warrior",
+    "Elder - Revered by all",
+    "Legendary Hunter - Songs will be sung of your deeds"
+)
+
+
+class ClanCodeViolation:
     HUNT_UNWORTHY = "hunting_unworthy"
     UNFAIR_ADVANTAGE = "unfair_advantage"
     TERRITORY_VIOLATION = "territory_violation"
@@ -12,9 +37,22 @@ class ClanCodeViolation(Enum):
     ABANDON_ALLY = "abandon_ally"
     EXCESSIVE_FORCE = "excessive_force"
     RETREAT_FROM_WORTHY = "retreat_from_worthy"
+    
+    VALUES = (
+        HUNT_UNWORTHY,
+        UNFAIR_ADVANTAGE,
+        TERRITORY_VIOLATION,
+        TROPHY_THEFT,
+        HARM_INNOCENT,
+        COWARDICE,
+        DISHONOUR_CLAN,
+        ABANDON_ALLY,
+        EXCESSIVE_FORCE,
+        RETREAT_FROM_WORTHY
+    )
 
 
-class HonourableAction(Enum):
+class HonourableAction:
     WORTHY_KILL = "worthy_kill"
     PROTECT_ALLY = "protect_ally"
     FACE_SUPERIOR_FOE = "face_superior_foe"
@@ -25,39 +63,58 @@ class HonourableAction(Enum):
     CLAN_SERVICE = "clan_service"
     TROPHY_OFFERING = "trophy_offering"
     SELF_SACRIFICE = "self_sacrifice"
+    
+    VALUES = (
+        WORTHY_KILL,
+        PROTECT_ALLY,
+        FACE_SUPERIOR_FOE,
+        COMPLETE_TRIAL,
+        DEFEAT_BOSS,
+        SAVE_THIA,
+        HONOURABLE_COMBAT,
+        CLAN_SERVICE,
+        TROPHY_OFFERING,
+        SELF_SACRIFICE
+    )
 
 
 class ClanCodeRule:
     
+    __slots__ = ('rule_type', 'description', 'honour_penalty', 'severity', '_message')
+    
     def __init__(self, rule_type, description, honour_penalty, severity="medium"):
         self.rule_type = rule_type
         self.description = description
         self.honour_penalty = honour_penalty
         self.severity = severity
+        self._message = f"Violated {rule_type}: -{honour_penalty} honour"
     
     def apply_penalty(self, predator):
         predator.lose_honour(self.honour_penalty)
-        return f"Violated {self.rule_type.value}: -{self.honour_penalty} honour"
+        return self._message
 
 
 class HonourReward:
     
+    __slots__ = ('action_type', 'description', 'honour_gain', 'reputation_gain', '_message')
+    
     def __init__(self, action_type, description, honour_gain, reputation_gain=0):
         self.action_type = action_type
         self.description = description
         self.honour_gain = honour_gain
         self.reputation_gain = reputation_gain
+        self._message = f"Honourable: {action_type}: +{honour_gain} honour"
     
     def apply_reward(self, predator):
         predator.gain_honour(self.honour_gain)
         if hasattr(predator, 'reputation'):
             predator.reputation += self.reputation_gain
-        return f"Honourable: {self.action_type.value}: +{self.honour_gain} honour"
+        return self._message
 
 
 class YautjaClanCode:
     
-    RULES = {
+    RULES = MappingProxyType({
         ClanCodeViolation.HUNT_UNWORTHY: ClanCodeRule(
             ClanCodeViolation.HUNT_UNWORTHY,
             "Only hunt creatures capable of defending themselves",
@@ -118,9 +175,9 @@ class YautjaClanCode:
             15,
             "high"
         )
-    }
+    })
     
-    REWARDS = {
+    REWARDS = MappingProxyType({
         HonourableAction.WORTHY_KILL: HonourReward(
             HonourableAction.WORTHY_KILL,
             "Defeated a worthy opponent in fair combat",
@@ -181,31 +238,28 @@ class YautjaClanCode:
             25,
             15
         )
-    }
+    })
     
     @classmethod
     def evaluate_action(cls, predator, action_result):
         violations = []
         
-        if hasattr(action_result, 'combat_result') and action_result.combat_result:
-            combat = action_result.combat_result
+        combat = getattr(action_result, 'combat_result', None)
+        if combat:
+            rules = cls.RULES
+            add_violation = violations.append
             target = combat.defender
             
-            if hasattr(target, 'is_innocent') and target.is_innocent:
-                violations.append(cls.RULES[ClanCodeViolation.HARM_INNOCENT])
+            if getattr(target, 'is_innocent', False):
+                add_violation(rules[ClanCodeViolation.HARM_INNOCENT])
             
-            if hasattr(target, 'is_worthy_prey') and not target.is_worthy_prey:
-                violations.append(cls.RULES[ClanCodeViolation.HUNT_UNWORTHY])
+            if not getattr(target, 'is_worthy_prey', True):
+                add_violation(rules[ClanCodeViolation.HUNT_UNWORTHY])
             
-            if predator.stealth_active and hasattr(target, 'can_detect_stealth') and not target.can_detect_stealth:
-                violations.append(cls.RULES[ClanCodeViolation.UNFAIR_ADVANTAGE])
-        
-        penalty_messages = []
-        for violation in violations:
-            message = violation.apply_penalty(predator)
-            penalty_messages.append(message)
+            if predator.stealth_active and not getattr(target, 'can_detect_stealth', True):
+                add_violation(rules[ClanCodeViolation.UNFAIR_ADVANTAGE])
         
-        return penalty_messages
+        return [violation.apply_penalty(predator) for violation in violations]
     
     @classmethod
     def evaluate_combat_honour(cls, predator, target, combat_result):
@@ -214,44 +268,44 @@ class YautjaClanCode:
         if not combat_result:
             return honour_events
         
+        rewards = cls.REWARDS
         target_strength = cls.assess_target_strength(target)
         
         if combat_result.kill:
             if target_strength >= 3:
-                reward = cls.REWARDS[HonourableAction.WORTHY_KILL]
+                reward = rewards[HonourableAction.WORTHY_KILL]
                 message = reward.apply_reward(predator)
-                honour_events.append(('reward', message))
+                honour_events.append((EVENT_REWARD, message))
             elif target_strength <= 1:
                 violation = cls.RULES[ClanCodeViolation.HUNT_UNWORTHY]
                 message = violation.apply_penalty(predator)
-                honour_events.append(('violation', message))
+                honour_events.append((EVENT_VIOLATION, message))
         
-        if hasattr(target, 'name') and 'Boss' in target.__class__.__name__:
-            reward = cls.REWARDS[HonourableAction.FACE_SUPERIOR_FOE]
+        if hasattr(target, 'name') and getattr(target, 'IS_BOSS', False):
+            reward = rewards[HonourableAction.FACE_SUPERIOR_FOE]
             message = reward.apply_reward(predator)
-            honour_events.append(('reward', message))
+            honour_events.append((EVENT_REWARD, message))
         
         return honour_events
     
     @classmethod
     def assess_target_strength(cls, target):
-        strength = 0
+        max_health = getattr(target, 'max_health', None)
+        weapons = getattr(target, 'weapons', None)
+        strength = len(weapons) if weapons else 0
         
-        if hasattr(target, 'max_health'):
-            if target.max_health >= 200:
+        if max_health is not None:
+            if max_health >= 200:
                 strength += 3
-            elif target.max_health >= 100:
+            elif max_health >= 100:
                 strength += 2
             else:
                 strength += 1
         
-        if hasattr(target, 'weapons') and target.weapons:
-            strength += len(target.weapons)
-        
-        if hasattr(target, 'special_abilities') and target.special_abilities:
+        if getattr(target, 'special_abilities', None):
             strength += 2
         
-        if 'Boss' in target.__class__.__name__:
+        if getattr(target, 'IS_BOSS', False):
             strength += 5
         
         return strength
@@ -291,37 +345,11 @@ class YautjaClanCode:
     
     @classmethod
     def get_clan_judgment(cls, predator):
-        if predator.honour >= 100:
-            return "Legendary Hunter - Songs will be sung of your deeds"
-        elif predator.honour >= 80:
-            return "Elder - Revered by all"
-        elif predator.honour >= 60:
-            return "Blooded - Respected warrior"
-        elif predator.honour >= 40:
-            return "Young Blood - Proving worth"
-        elif predator.honour >= 20:
-            return "Unblooded - Must prove themselves"
-        elif predator.honour >= 0:
-            return "Dishonoured - Barely tolerated"
-        else:
-            return "Exile - Cast out from clan"
+        return CLAN_JUDGMENTS[bisect_right(HONOUR_THRESHOLDS, predator.honour)]
     
     @classmethod
     def get_honour_tier(cls, honour):
-        if honour >= 100:
-            return 6
-        elif honour >= 80:
-            return 5
-        elif honour >= 60:
-            return 4
-        elif honour >= 40:
-            return 3
-        elif honour >= 20:
-            return 2
-        elif honour >= 0:
-            return 1
-        else:
-            return 0
+        return bisect_right(HONOUR_THRESHOLDS, honour)
     
     @classmethod
     def can_challenge_for_rank(cls, challenger_honour, target_honour):
@@ -330,17 +358,28 @@ class YautjaClanCode:
         return challenger_tier >= target_tier - 1
 
 
-class ClanRelationship(Enum):
+class ClanRelationship:
     FATHER = "father"
     BROTHER = "brother"
     ELDER = "elder"
     RIVAL = "rival"
     MENTOR = "mentor"
     OUTCAST = "outcast"
+    
+    VALUES = (
+        FATHER,
+        BROTHER,
+        ELDER,
+        RIVAL,
+        MENTOR,
+        OUTCAST
+    )
 
 
 class ClanReaction:
     
+    __slots__ = ('relationship', 'opinion_change', 'message', 'action_required', 'timestamp')
+    
     def __init__(self, relationship, opinion_change, message, action_required=None):
         self.relationship = relationship
         self.opinion_change = opinion_change
@@ -350,7 +389,7 @@ class ClanReaction:
     
     def to_dict(self):
         return {
-            'relationship': self.relationship.value,
+            'relationship': self.relationship,
             'opinion_change': self.opinion_change,
             'message': self.message,
             'action_required': self.action_required
@@ -359,9 +398,15 @@ class ClanReaction:
 
 class HonourTracker:
     
+    __slots__ = (
+        'agent', 'honour_history', 'change_count', 'violation_count',
+        'reward_count', 'highest_honour', 'lowest_honour', 'clan_standing'
+    )
+    
     def __init__(self, agent):
         self.agent = agent
-        self.honour_history = []
+        self.honour_history = deque(maxlen=HONOUR_HISTORY_LIMIT)
+        self.change_count = 0
         self.violation_count = 0
         self.reward_count = 0
         self.highest_honour = 0
@@ -369,23 +414,26 @@ class HonourTracker:
         self.clan_standing = "neutral"
     
     def record_change(self, change_type, amount, reason):
+        current_honour = getattr(self.agent, 'honour', 0)
         entry = {
             'type': change_type,
             'amount': amount,
             'reason': reason,
-            'honour_after': self.agent.honour if hasattr(self.agent, 'honour') else 0,
-            'timestamp': len(self.honour_history)
+            'honour_after': current_honour,
+            'timestamp': self.change_count
         }
         self.honour_history.append(entry)
+        self.change_count += 1
         
-        if change_type == 'violation':
+        if change_type == EVENT_VIOLATION:
             self.violation_count += 1
-        elif change_type == 'reward':
+        elif change_type == EVENT_REWARD:
             self.reward_count += 1
         
-        current_honour = self.agent.honour if hasattr(self.agent, 'honour') else 0
-        self.highest_honour = max(self.highest_honour, current_honour)
-        self.lowest_honour = min(self.lowest_honour, current_honour)
+        if current_honour > self.highest_honour:
+            self.highest_honour = current_honour
+        if current_honour < self.lowest_honour:
+            self.lowest_honour = current_honour
         
         self.update_clan_standing()
     
@@ -393,21 +441,16 @@ class HonourTracker:
         if not hasattr(self.agent, 'honour'):
             return
         
-        honour = self.agent.honour
-        violation_ratio = self.violation_count / max(1, self.reward_count + self.violation_count)
+        standing = bisect_right(STANDING_THRESHOLDS, self.agent.honour)
         
-        if honour >= 80 and violation_ratio < 0.1:
-            self.clan_standing = "exemplary"
-        elif honour >= 60 and violation_ratio < 0.2:
-            self.clan_standing = "respected"
-        elif honour >= 40:
-            self.clan_standing = "accepted"
-        elif honour >= 20:
-            self.clan_standing = "probationary"
-        elif honour >= 0:
-            self.clan_standing = "shamed"
-        else:
-            self.clan_standing = "exiled"
+        if standing >= 4:
+            violation_ratio = self.violation_count / max(1, self.reward_count + self.violation_count)
+            if standing == 5 and violation_ratio >= 0.1:
+                standing = 4
+            if violation_ratio >= 0.2:
+                standing = 3
+        
+        self.clan_standing = CLAN_STANDINGS[standing]
     
     def get_summary(self):
         return {
@@ -417,23 +460,41 @@ class HonourTracker:
             'total_violations': self.violation_count,
             'total_rewards': self.reward_count,
             'clan_standing': self.clan_standing,
-            'history_length': len(self.honour_history)
+            'history_length': self.change_count
         }
     
     def get_recent_history(self, count=5):
-        return self.honour_history[-count:]
+        history = self.honour_history
+        return list(islice(history, max(0, len(history) - count), None))
 
 
-class ClanTrialType(Enum):
+class ClanTrialType:
     COMBAT_TRIAL = "combat_trial"
     HUNT_TRIAL = "hunt_trial"
     ENDURANCE_TRIAL = "endurance_trial"
     HONOUR_TRIAL = "honour_trial"
     RETRIEVAL_TRIAL = "retrieval_trial"
+    
+    VALUES = (
+        COMBAT_TRIAL,
+        HUNT_TRIAL,
+        ENDURANCE_TRIAL,
+        HONOUR_TRIAL,
+        RETRIEVAL_TRIAL
+    )
 
 
 class ClanTrial:
     
+    __slots__ = (
+        'trial_type', 'issuer', 'target', 'requirements', 'is_active',
+        'is_completed', 'is_failed', 'progress', 'max_progress', 'time_limit',
+        'elapsed_time', 'honour_reward', 'honour_penalty'
+    )
+    
+    COMPLETION_REWARD = YautjaClanCode.REWARDS[HonourableAction.COMPLETE_TRIAL]
+    FAILURE_RULE = YautjaClanCode.RULES[ClanCodeViolation.DISHONOUR_CLAN]
+    
     def __init__(self, trial_type, issuer, target, requirements):
         self.trial_type = trial_type
         self.issuer = issuer
@@ -472,18 +533,18 @@ class ClanTrial:
         self.is_completed = True
         if hasattr(self.target, 'gain_honour'):
             self.target.gain_honour(self.honour_reward)
-        return YautjaClanCode.REWARDS[HonourableAction.COMPLETE_TRIAL]
+        return self.COMPLETION_REWARD
     
     def fail_trial(self):
         self.is_active = False
         self.is_failed = True
         if hasattr(self.target, 'lose_honour'):
             self.target.lose_honour(self.honour_penalty)
-        return YautjaClanCode.RULES[ClanCodeViolation.DISHONOUR_CLAN]
+        return self.FAILURE_RULE
     
     def get_status(self):
         return {
-            'trial_type': self.trial_type.value,
+            'trial_type': self.trial_type,
             'issuer': self.issuer.name if self.issuer else 'Unknown',
             'progress': f"{self.progress}/{self.max_progress}",
             'time_remaining': self.time_limit - self.elapsed_time,
@@ -499,6 +560,18 @@ class ClanTrialManager:
         self.active_trials = []
         self.completed_trials = []
         self.failed_trials = []
+        self._by_agent_type = {}
+    
+    def _add_trial(self, trial):
+        self.active_trials.append(trial)
+        self._by_agent_type.setdefault((id(trial.target), trial.trial_type), []).append(trial)
+    
+    def _unindex_trial(self, trial):
+        key = (id(trial.target), trial.trial_type)
+        trials = self._by_agent_type[key]
+        trials.remove(trial)
+        if not trials:
+            del self._by_agent_type[key]
     
     def create_combat_trial(self, issuer, target, kill_count=3, time_limit=50):
         requirements = {
@@ -509,7 +582,7 @@ class ClanTrialManager:
             'description': f"Defeat {kill_count} worthy opponents"
         }
         trial = ClanTrial(ClanTrialType.COMBAT_TRIAL, issuer, target, requirements)
-        self.active_trials.append(trial)
+        self._add_trial(trial)
         return trial
     
     def create_hunt_trial(self, issuer, target, trophy_value=10, time_limit=60):
@@ -521,7 +594,7 @@ class ClanTrialManager:
             'description': f"Collect trophies worth {trophy_value} honour"
         }
         trial = ClanTrial(ClanTrialType.HUNT_TRIAL, issuer, target, requirements)
-        self.active_trials.append(trial)
+        self._add_trial(trial)
         return trial
     
     def create_endurance_trial(self, issuer, target, survival_turns=30):
@@ -533,7 +606,7 @@ class ClanTrialManager:
             'description': f"Survive {survival_turns} turns in hostile territory"
         }
         trial = ClanTrial(ClanTrialType.ENDURANCE_TRIAL, issuer, target, requirements)
-        self.active_trials.append(trial)
+        self._add_trial(trial)
         return trial
     
     def create_honour_trial(self, issuer, target, honour_gain=15, time_limit=40):
@@ -545,7 +618,7 @@ class ClanTrialManager:
             'description': f"Gain {honour_gain} honour through worthy deeds"
         }
         trial = ClanTrial(ClanTrialType.HONOUR_TRIAL, issuer, target, requirements)
-        self.active_trials.append(trial)
+        self._add_trial(trial)
         return trial
     
     def create_retrieval_trial(self, issuer, target, target_x, target_y, time_limit=45):
@@ -558,48 +631,50 @@ class ClanTrialManager:
             'description': f"Reach location ({target_x}, {target_y}) and return"
         }
         trial = ClanTrial(ClanTrialType.RETRIEVAL_TRIAL, issuer, target, requirements)
-        self.active_trials.append(trial)
+        self._add_trial(trial)
         return trial
     
     def update_trials(self):
-        for trial in self.active_trials[:]:
+        trials = self.active_trials
+        write_index = 0
+        for trial in trials:
             trial.tick_time()
             if trial.is_completed:
-                self.active_trials.remove(trial)
+                self._unindex_trial(trial)
                 self.completed_trials.append(trial)
             elif trial.is_failed:
-                self.active_trials.remove(trial)
+                self._unindex_trial(trial)
                 self.failed_trials.append(trial)
+            else:
+                trials[write_index] = trial
+                write_index += 1
+        del trials[write_index:]
     
     def notify_kill(self, agent, target):
-        for trial in self.active_trials:
-            if trial.target == agent and trial.trial_type == ClanTrialType.COMBAT_TRIAL:
-                if YautjaClanCode.assess_target_strength(target) >= 2:
-                    trial.update_progress(1)
+        trials = self._by_agent_type.get((id(agent), ClanTrialType.COMBAT_TRIAL))
+        if trials and YautjaClanCode.assess_target_strength(target) >= 2:
+            for trial in trials:
+                trial.update_progress(1)
     
     def notify_trophy(self, agent, trophy):
-        for trial in self.active_trials:
-            if trial.target == agent and trial.trial_type == ClanTrialType.HUNT_TRIAL:
-                trophy_value = trophy.get_honour_value() if hasattr(trophy, 'get_honour_value') else trophy.get('value', 1)
-                trial.update_progress(trophy_value)
+        for trial in self._by_agent_type.get((id(agent), ClanTrialType.HUNT_TRIAL), ()):
+            trophy_value = trophy.get_honour_value() if hasattr(trophy, 'get_honour_value') else trophy.get('value', 1)
+            trial.update_progress(trophy_value)
     
     def notify_survival(self, agent):
-        for trial in self.active_trials:
-            if trial.target == agent and trial.trial_type == ClanTrialType.ENDURANCE_TRIAL:
-                trial.update_progress(1)
+        for trial in self._by_agent_type.get((id(agent), ClanTrialType.ENDURANCE_TRIAL), ()):
+            trial.update_progress(1)
     
     def notify_honour_change(self, agent, amount):
         if amount > 0:
-            for trial in self.active_trials:
-                if trial.target == agent and trial.trial_type == ClanTrialType.HONOUR_TRIAL:
-                    trial.update_progress(amount)
+            for trial in self._by_agent_type.get((id(agent), ClanTrialType.HONOUR_TRIAL), ()):
+                trial.update_progress(amount)
     
     def notify_location_reached(self, agent, x, y):
-        for trial in self.active_trials:
-            if trial.target == agent and trial.trial_type == ClanTrialType.RETRIEVAL_TRIAL:
-                target_loc = trial.requirements.get('target_location')
-                if target_loc and target_loc == (x, y):
-                    trial.update_progress(1)
+        for trial in self._by_agent_type.get((id(agent), ClanTrialType.RETRIEVAL_TRIAL), ()):
+            target_loc = trial.requirements.get('target_location')
+            if target_loc and target_loc == (x, y):
+                trial.update_progress(1)
     
     def get_active_trials_for(self, agent):
         return [t for t in self.active_trials if t.target == agent]
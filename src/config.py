@@ -24,22 +24,47 @@ DEFAULT_CONFIG = {
     }
 }
 
+_parsed_configs = {}
+
 
 class GameConfig:
     
+    ATTRIBUTES = {
+        'grid_width': ("grid", "width", 30),
+        'grid_height': ("grid", "height", 30),
+        'boss_health_multiplier': ("difficulty", "boss_health_multiplier", 1.0),
+        'wildlife_count': ("difficulty", "wildlife_count", 4),
+        'resource_count': ("difficulty", "resource_count", 15),
+        'max_turns': ("simulation", "max_turns", 200),
+        'turn_delay': ("simulation", "turn_delay_ms", 300),
+        'cell_size': ("display", "cell_size", 22),
+        'thermal_vision': ("display", "thermal_vision", True)
+    }
+    
     def __init__(self, config_path=None):
-        self.config = DEFAULT_CONFIG.copy()
+        self.config = {section: dict(values) for section, values in DEFAULT_CONFIG.items()}
         self.config_path = config_path or "config.json"
         self.load()
     
     def load(self):
-        if os.path.exists(self.config_path):
-            try:
-                with open(self.config_path, 'r') as f:
-                    loaded = json.load(f)
-                    self._merge_config(loaded)
-            except (json.JSONDecodeError, IOError):
-                pass
+        try:
+            stat = os.stat(self.config_path)
+        except OSError:
+            stat = None
+        
+        if stat is not None:
+            key = (os.path.abspath(self.config_path), stat.st_mtime_ns, stat.st_size)
+            loaded = _parsed_configs.get(key)
+            if loaded is None:
+                try:
+                    with open(self.config_path, 'r') as f:
+                        loaded = json.load(f)
+                    _parsed_configs[key] = loaded
+                except (json.JSONDecodeError, IOError):
+                    loaded = None
+            if loaded is not None:
+                self._merge_config(loaded)
+        self._materialize()
     
     def save(self):
         with open(self.config_path, 'w') as f:
@@ -49,49 +74,23 @@ class GameConfig:
         for section, values in loaded.items():
             if section in self.config and isinstance(values, dict):
                 self.config[section].update(values)
+            elif isinstance(values, dict):
+                self.config[section] = dict(values)
             else:
                 self.config[section] = values
     
+    def _materialize(self):
+        for name, (section, key, default) in self.ATTRIBUTES.items():
+            setattr(self, name, self.get(section, key, default))
+    
     def get(self, section, key, default=None):
-        return self.config.get(section, {}).get(key, default)
+        try:
+            return self.config[section][key]
+        except KeyError:
+            return default
     
     def set(self, section, key, value):
         if section not in self.config:
             self.config[section] = {}
         self.config[section][key] = value
-    
-    @property
-    def grid_width(self):
-        return self.get("grid", "width", 30)
-    
-    @property
-    def grid_height(self):
-        return self.get("grid", "height", 30)
-    
-    @property
-    def boss_health_multiplier(self):
-        return self.get("difficulty", "boss_health_multiplier", 1.0)
-    
-    @property
-    def wildlife_count(self):
-        return self.get("difficulty", "wildlife_count", 4)
-    
-    @property
-    def resource_count(self):
-        return self.get("difficulty", "resource_count", 15)
-    
-    @property
-    def max_turns(self):
-        return self.get("simulation", "max_turns", 200)
-    
-    @property
-    def turn_delay(self):
-        return self.get("simulation", "turn_delay_ms", 300)
-    
-    @property
-    def cell_size(self):
-        return self.get("display", "cell_size", 22)
-    
-    @property
-    def thermal_vision(self):
-        return self.get("display", "thermal_vision", True)
+        self._materialize()
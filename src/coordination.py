@@ -1,10 +1,34 @@
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
+from weakref import WeakKeyDictionary
+import bisect
 from typing import List, Tuple, Dict, Optional, Any
 import random
 import math
 
 
+THREAT_HISTORY_LIMIT = 100
+FORMATION_HISTORY_LIMIT = 100
+COMMUNICATION_LOG_LIMIT = 50
+
+RETREAT_SCAN_RADIUS = 5
+
+NEIGHBOUR_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+MELEE_RANGE_SQ = 1.5 * 1.5
+SUPPORT_ENGAGE_RANGE_SQ = 2 * 2
+SUPPORT_ATTACK_RANGE_SQ = 3 * 3
+FORMATION_NEAR_SQ = 3 * 3
+FORMATION_MID_SQ = 6 * 6
+
+# Formation choice does not change past this enemy distance; clamping
+# keeps inf (no enemy visible) and far distances in one bucket
+FORMATION_FAR_DISTANCE = 5
+
+
 class Role(Enum):
     LEADER = "leader"
     SUPPORT = "support"
@@ -34,7 +58,7 @@ class ActionPriority(Enum):
     LOW = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class SharedGoal:
     goal_type: GoalType
     priority: ActionPriority
@@ -43,13 +67,26 @@ class SharedGoal:
     assigned_agents: List[str] = None
     progress: float = 0.0
     completed: bool = False
+    priority_value: int = field(init=False, repr=False, compare=False)
+    _assigned_set: set = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.assigned_agents is None:
             self.assigned_agents = []
+        self._assigned_set = set(self.assigned_agents)
+        self.priority_value = self.priority.value
+    
+    def __lt__(self, other):
+        if self.priority_value != other.priority_value:
+            return self.priority_value < other.priority_value
+        return self.progress > other.progress
+    
+    def set_priority(self, priority: ActionPriority):
+        self.priority = priority
+        self.priority_value = priority.value
 
 
-@dataclass
+@dataclass(slots=True)
 class CoordinatedAction:
     agent_name: str
     action_type: str
@@ -64,47 +101,88 @@ class CoordinatedAction:
             self.sync_with = []
 
 
+@dataclass(frozen=True, slots=True)
+class RoleCapabilities:
+    can_command: bool = False
+    can_heal: bool = False
+    can_scout: bool = False
+    can_absorb: bool = False
+    can_attack: bool = False
+    priority_actions: Tuple[str, ...] = ()
+    priority_action_set: frozenset = field(init=False, repr=False, compare=False)
+    stat_bonus: Any = field(default_factory=dict)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'priority_actions', tuple(self.priority_actions))
+        object.__setattr__(self, 'priority_action_set', frozenset(self.priority_actions))
+        object.__setattr__(self, 'stat_bonus', MappingProxyType(dict(self.stat_bonus)))
+
+
+NO_CAPABILITIES = RoleCapabilities()
+
+
+@dataclass(frozen=True, slots=True)
+class Formation:
+    leader_offset: Tuple[int, int]
+    support_offset: Tuple[int, int]
+    spacing: int
+
+
+@dataclass(slots=True)
+class TurnContext:
+    nearest: Any = None
+    nearest_distance_sq: float = float('inf')
+    boss: Any = None
+    boss_distance_sq: float = float('inf')
+    leader_health: float = 100.0
+    support_health: float = 100.0
+    support_active: bool = False
+    ally_distance_sq: float = 0.0
+    formation_positions: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+
+
 class ThreatAssessment:
     
     def __init__(self):
-        self.threat_levels = {}
-        self.threat_history = []
+        self.threat_levels = WeakKeyDictionary()
+        self.threat_history = deque(maxlen=THREAT_HISTORY_LIMIT)
         self.danger_zones = set()
         
     def assess_threat(self, enemy, observer_position: Tuple[int, int]) -> float:
         if not enemy or not enemy.is_alive:
             return 0.0
         
-        distance = math.sqrt(
-            (enemy.x - observer_position[0])**2 + 
-            (enemy.y - observer_position[1])**2
-        )
-        
-        base_threat = 0.0
+        threat_score = self._score(enemy, observer_position[0], observer_position[1])
+        self._record(enemy, threat_score)
+        return threat_score
+    
+    def _score(self, enemy, observer_x, observer_y) -> float:
+        distance = math.hypot(enemy.x - observer_x, enemy.y - observer_y)
         
-        if hasattr(enemy, 'phase'):
-            base_threat = 100.0 if enemy.phase == 2 else 80.0
-        elif hasattr(enemy, 'is_enraged') and enemy.is_enraged:
+        phase = getattr(enemy, 'phase', None)
+        if phase is not None:
+            base_threat = 100.0 if phase == 2 else 80.0
+        elif getattr(enemy, 'is_enraged', False):
             base_threat = 60.0
-        elif hasattr(enemy, 'aggression_level'):
-            base_threat = 30.0 + enemy.aggression_level * 20
         else:
-            base_threat = 20.0
-        
-        health_factor = enemy.health / enemy.max_health if hasattr(enemy, 'max_health') else 0.5
-        
-        distance_modifier = max(0.1, 1.0 - (distance / 15.0))
-        
-        threat_score = base_threat * health_factor * distance_modifier
+            aggression_level = getattr(enemy, 'aggression_level', None)
+            if aggression_level is not None:
+                base_threat = 30.0 + aggression_level * 20
+            else:
+                base_threat = 20.0
         
-        enemy_id = id(enemy)
-        self.threat_levels[enemy_id] = threat_score
-        self.threat_history.append((enemy_id, threat_score))
+        max_health = getattr(enemy, 'max_health', None)
+        health_factor = enemy.health / max_health if max_health is not None else 0.5
         
-        if len(self.threat_history) > 100:
-            self.threat_history = self.threat_history[-100:]
+        distance_modifier = 1.0 - distance / 15.0
+        if distance_modifier < 0.1:
+            distance_modifier = 0.1
         
-        return threat_score
+        return base_threat * health_factor * distance_modifier
+    
+    def _record(self, enemy, threat_score):
+        self.threat_levels[enemy] = threat_score
+        self.threat_history.append((id(enemy), threat_score))
     
     def get_highest_threat(self, enemies: List, observer_position: Tuple[int, int]):
         if not enemies:
@@ -112,19 +190,31 @@ class ThreatAssessment:
         
         max_threat = 0.0
         highest_threat_enemy = None
+        score = self._score
+        observer_x, observer_y = observer_position
         
         for enemy in enemies:
-            threat = self.assess_threat(enemy, observer_position)
+            if not enemy or not enemy.is_alive:
+                continue
+            threat = score(enemy, observer_x, observer_y)
             if threat > max_threat:
                 max_threat = threat
                 highest_threat_enemy = enemy
         
+        if highest_threat_enemy is not None:
+            self._record(highest_threat_enemy, max_threat)
+        
         return highest_threat_enemy, max_threat
     
     def mark_danger_zone(self, position: Tuple[int, int], radius: int = 2):
-        for dx in range(-radius, radius + 1):
-            for dy in range(-radius, radius + 1):
-                self.danger_zones.add((position[0] + dx, position[1] + dy))
+        x, y = position
+        self.danger_zones.update([(x + dx, y + dy) for dx, dy in self._square_offsets(radius)])
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _square_offsets(radius: int) -> Tuple[Tuple[int, int], ...]:
+        span = range(-radius, radius + 1)
+        return tuple((dx, dy) for dx in span for dy in span)
     
     def is_position_dangerous(self, position: Tuple[int, int]) -> bool:
         return position in self.danger_zones
@@ -137,7 +227,7 @@ class SharedGoalPlanner:
     
     def __init__(self):
         self.goals = []
-        self.completed_goals = []
+        self.completed_goal_count = 0
         self.goal_history = []
         self.agents = {}
         self.threat_assessment = ThreatAssessment()
@@ -153,27 +243,26 @@ class SharedGoalPlanner:
     def add_goal(self, goal: SharedGoal):
         for existing in self.goals:
             if existing.goal_type == goal.goal_type and existing.target == goal.target:
-                if goal.priority.value < existing.priority.value:
-                    existing.priority = goal.priority
+                if goal.priority_value < existing.priority_value:
+                    self.goals.remove(existing)
+                    existing.set_priority(goal.priority)
+                    bisect.insort(self.goals, existing)
                 return
         
-        self.goals.append(goal)
-        self._sort_goals()
-    
-    def _sort_goals(self):
-        self.goals.sort(key=lambda g: (g.priority.value, -g.progress))
+        bisect.insort(self.goals, goal)
     
     def remove_goal(self, goal: SharedGoal):
         if goal in self.goals:
             self.goals.remove(goal)
-            self.completed_goals.append(goal)
+            self.completed_goal_count += 1
             self.goal_history.append(goal)
     
     def get_active_goals(self) -> List[SharedGoal]:
         return [g for g in self.goals if not g.completed]
     
     def assign_goal(self, goal: SharedGoal, agent_name: str):
-        if agent_name not in goal.assigned_agents:
+        if agent_name not in goal._assigned_set:
+            goal._assigned_set.add(agent_name)
             goal.assigned_agents.append(agent_name)
         
         if agent_name in self.agents:
@@ -238,38 +327,38 @@ class SharedGoalPlanner:
 
 class RoleManager:
     
-    ROLE_CAPABILITIES = {
-        Role.LEADER: {
-            'can_command': True,
-            'priority_actions': ['coordinate', 'attack', 'strategize'],
-            'stat_bonus': {'damage': 1.1, 'honour': 1.2}
-        },
-        Role.SUPPORT: {
-            'can_heal': True,
-            'priority_actions': ['heal', 'buff', 'scan'],
-            'stat_bonus': {'healing': 1.3, 'scan_range': 1.5}
-        },
-        Role.SCOUT: {
-            'can_scout': True,
-            'priority_actions': ['scan', 'move', 'report'],
-            'stat_bonus': {'speed': 1.3, 'detection': 1.5}
-        },
-        Role.TANK: {
-            'can_absorb': True,
-            'priority_actions': ['block', 'taunt', 'defend'],
-            'stat_bonus': {'health': 1.3, 'armor': 1.2}
-        },
-        Role.HEALER: {
-            'can_heal': True,
-            'priority_actions': ['heal', 'restore', 'protect'],
-            'stat_bonus': {'healing': 1.5, 'support': 1.3}
-        },
-        Role.ATTACKER: {
-            'can_attack': True,
-            'priority_actions': ['attack', 'flank', 'charge'],
-            'stat_bonus': {'damage': 1.4, 'critical': 1.2}
-        }
-    }
+    ROLE_CAPABILITIES = MappingProxyType({
+        Role.LEADER: RoleCapabilities(
+            can_command=True,
+            priority_actions=('coordinate', 'attack', 'strategize'),
+            stat_bonus={'damage': 1.1, 'honour': 1.2}
+        ),
+        Role.SUPPORT: RoleCapabilities(
+            can_heal=True,
+            priority_actions=('heal', 'buff', 'scan'),
+            stat_bonus={'healing': 1.3, 'scan_range': 1.5}
+        ),
+        Role.SCOUT: RoleCapabilities(
+            can_scout=True,
+            priority_actions=('scan', 'move', 'report'),
+            stat_bonus={'speed': 1.3, 'detection': 1.5}
+        ),
+        Role.TANK: RoleCapabilities(
+            can_absorb=True,
+            priority_actions=('block', 'taunt', 'defend'),
+            stat_bonus={'health': 1.3, 'armor': 1.2}
+        ),
+        Role.HEALER: RoleCapabilities(
+            can_heal=True,
+            priority_actions=('heal', 'restore', 'protect'),
+            stat_bonus={'healing': 1.5, 'support': 1.3}
+        ),
+        Role.ATTACKER: RoleCapabilities(
+            can_attack=True,
+            priority_actions=('attack', 'flank', 'charge'),
+            stat_bonus={'damage': 1.4, 'critical': 1.2}
+        )
+    })
     
     def __init__(self):
         self.agent_roles = {}
@@ -288,33 +377,30 @@ class RoleManager:
             return self.agent_roles[agent_name]['role']
         return None
     
-    def get_capabilities(self, agent_name: str) -> Dict:
+    def get_capabilities(self, agent_name: str) -> RoleCapabilities:
         if agent_name in self.agent_roles:
             return self.agent_roles[agent_name]['capabilities']
-        return {}
+        return NO_CAPABILITIES
     
     def get_stat_bonus(self, agent_name: str, stat: str) -> float:
         if agent_name in self.agent_roles:
-            bonuses = self.agent_roles[agent_name]['capabilities'].get('stat_bonus', {})
-            return bonuses.get(stat, 1.0)
+            return self.agent_roles[agent_name]['capabilities'].stat_bonus.get(stat, 1.0)
         return 1.0
     
     def can_perform(self, agent_name: str, action: str) -> bool:
-        if agent_name not in self.agent_roles:
+        role_data = self.agent_roles.get(agent_name)
+        if role_data is None:
             return True
         
-        capabilities = self.agent_roles[agent_name]['capabilities']
-        priority_actions = capabilities.get('priority_actions', [])
-        
-        return action in priority_actions or len(priority_actions) == 0
+        priority_action_set = role_data['capabilities'].priority_action_set
+        return action in priority_action_set or not priority_action_set
     
     def recommend_action(self, agent_name: str, available_actions: List[str]) -> str:
-        if agent_name not in self.agent_roles:
+        role_data = self.agent_roles.get(agent_name)
+        if role_data is None:
             return available_actions[0] if available_actions else None
         
-        priority_actions = self.agent_roles[agent_name]['capabilities'].get('priority_actions', [])
-        
-        for action in priority_actions:
+        for action in role_data['capabilities'].priority_actions:
             if action in available_actions:
                 return action
         
@@ -325,12 +411,12 @@ class RoleManager:
             return 1.0
         
         role_data = self.agent_roles[agent.name]
-        priority_actions = role_data['capabilities'].get('priority_actions', [])
+        priority_action_set = role_data['capabilities'].priority_action_set
         
         if not recent_actions:
             return 1.0
         
-        matching_actions = sum(1 for a in recent_actions if a in priority_actions)
+        matching_actions = sum(1 for a in recent_actions if a in priority_action_set)
         effectiveness = matching_actions / len(recent_actions) if recent_actions else 1.0
         
         role_data['effectiveness'] = effectiveness
@@ -339,37 +425,17 @@ class RoleManager:
 
 class FormationManager:
     
-    FORMATIONS = {
-        'defensive': {
-            'leader_offset': (0, 0),
-            'support_offset': (-1, 1),
-            'spacing': 2
-        },
-        'aggressive': {
-            'leader_offset': (1, 0),
-            'support_offset': (0, 0),
-            'spacing': 1
-        },
-        'flanking': {
-            'leader_offset': (0, 2),
-            'support_offset': (0, -2),
-            'spacing': 4
-        },
-        'retreat': {
-            'leader_offset': (-1, 0),
-            'support_offset': (-2, 0),
-            'spacing': 1
-        },
-        'surround': {
-            'leader_offset': (2, 0),
-            'support_offset': (-2, 0),
-            'spacing': 4
-        }
-    }
+    FORMATIONS = MappingProxyType({
+        'defensive': Formation(leader_offset=(0, 0), support_offset=(-1, 1), spacing=2),
+        'aggressive': Formation(leader_offset=(1, 0), support_offset=(0, 0), spacing=1),
+        'flanking': Formation(leader_offset=(0, 2), support_offset=(0, -2), spacing=4),
+        'retreat': Formation(leader_offset=(-1, 0), support_offset=(-2, 0), spacing=1),
+        'surround': Formation(leader_offset=(2, 0), support_offset=(-2, 0), spacing=4)
+    })
     
     def __init__(self):
         self.current_formation = 'defensive'
-        self.formation_history = []
+        self.formation_history = deque(maxlen=FORMATION_HISTORY_LIMIT)
         
     def set_formation(self, formation_name: str):
         if formation_name in self.FORMATIONS:
@@ -382,30 +448,36 @@ class FormationManager:
         if target_pos:
             dx = target_pos[0] - leader_pos[0]
             dy = target_pos[1] - leader_pos[1]
-            distance = math.sqrt(dx*dx + dy*dy)
-            if distance > 0:
-                dx, dy = dx/distance, dy/distance
-            else:
-                dx, dy = 1, 0
         else:
             dx, dy = 1, 0
         
-        leader_offset = formation['leader_offset']
-        support_offset = formation['support_offset']
+        (leader_dx, leader_dy), (support_dx, support_dy) = self._rotated_offsets(
+            formation.leader_offset, formation.support_offset, dx, dy
+        )
         
         positions = {
-            'leader': (
-                leader_pos[0] + int(leader_offset[0] * dx - leader_offset[1] * dy),
-                leader_pos[1] + int(leader_offset[0] * dy + leader_offset[1] * dx)
-            ),
-            'support': (
-                leader_pos[0] + int(support_offset[0] * dx - support_offset[1] * dy),
-                leader_pos[1] + int(support_offset[0] * dy + support_offset[1] * dx)
-            )
+            'leader': (leader_pos[0] + leader_dx, leader_pos[1] + leader_dy),
+            'support': (leader_pos[0] + support_dx, leader_pos[1] + support_dy)
         }
         
         return positions
     
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _rotated_offsets(leader_offset, support_offset, dx, dy):
+        distance = math.sqrt(dx*dx + dy*dy)
+        if distance > 0:
+            dx, dy = dx/distance, dy/distance
+        else:
+            dx, dy = 1, 0
+        
+        return (
+            (int(leader_offset[0] * dx - leader_offset[1] * dy),
+             int(leader_offset[0] * dy + leader_offset[1] * dx)),
+            (int(support_offset[0] * dx - support_offset[1] * dy),
+             int(support_offset[0] * dy + support_offset[1] * dx))
+        )
+    
     def recommend_formation(self, situation: Dict) -> str:
         leader_health = situation.get('leader_health', 100)
         support_health = situation.get('support_health', 100)
@@ -413,11 +485,22 @@ class FormationManager:
         enemy_distance = situation.get('enemy_distance', 10)
         boss_present = situation.get('boss_present', False)
         
-        if leader_health < 30 or support_health < 30:
+        return self._recommend(
+            int(leader_health // 10),
+            int(support_health // 10),
+            min(enemy_count, 3),
+            int(min(enemy_distance, FORMATION_FAR_DISTANCE) // 1),
+            bool(boss_present)
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _recommend(leader_bucket, support_bucket, enemy_count, distance_bucket, boss_present):
+        if leader_bucket < 3 or support_bucket < 3:
             return 'retreat'
         
         if boss_present:
-            if enemy_distance < 3:
+            if distance_bucket < 3:
                 return 'flanking'
             else:
                 return 'surround'
@@ -425,7 +508,7 @@ class FormationManager:
         if enemy_count > 2:
             return 'defensive'
         
-        if enemy_distance < 5:
+        if distance_bucket < 5:
             return 'aggressive'
         
         return 'defensive'
@@ -438,9 +521,14 @@ class CoordinationProtocol:
         self.role_manager = RoleManager()
         self.formation_manager = FormationManager()
         self.action_queue = []
-        self.sync_actions = []
-        self.communication_log = []
+        self.sync_action_count = 0
+        self.communication_log = deque(maxlen=COMMUNICATION_LOG_LIMIT)
         self.coordination_score = 0.0
+        self._last_enemies = None
+        self.rng = random
+    
+    def set_rng(self, rng):
+        self.rng = rng
         
     def initialize(self, dek, thia):
         self.goal_planner.register_agent(dek, Role.LEADER)
@@ -459,9 +547,6 @@ class CoordinationProtocol:
         }
         self.communication_log.append(comm)
         
-        if len(self.communication_log) > 50:
-            self.communication_log = self.communication_log[-50:]
-        
         return comm
     
     def request_help(self, requester, situation: str) -> CoordinatedAction:
@@ -472,11 +557,12 @@ class CoordinationProtocol:
             requires_sync=True
         )
         
-        for agent_name, data in self.goal_planner.agents.items():
-            if agent_name != requester.name:
-                help_action.sync_with.append(agent_name)
+        requester_name = requester.name
+        help_action.sync_with.extend(
+            agent_name for agent_name in self.goal_planner.agents if agent_name != requester_name
+        )
         
-        self.sync_actions.append(help_action)
+        self.sync_action_count += 1
         return help_action
     
     def provide_cover(self, provider, target) -> CoordinatedAction:
@@ -506,61 +592,70 @@ class CoordinationProtocol:
             )
             actions.append(action)
         
-        self.sync_actions.extend(actions)
+        self.sync_action_count += len(actions)
         return actions
     
     def plan_coordinated_turn(self, dek, thia, enemies: List, grid) -> Dict[str, CoordinatedAction]:
         planned_actions = {}
         
         self.goal_planner.evaluate_situation(dek, thia, enemies, grid)
+        self._last_enemies = (grid, getattr(grid, 'occupancy_version', None), enemies)
+        
+        ctx = self._scan_enemies(dek, enemies)
+        boss_target = ctx.boss
+        ctx.leader_health = dek.health_percentage
+        ctx.support_active = bool(thia and thia.is_alive)
+        if ctx.support_active:
+            ctx.support_health = thia.health_percentage
+            ctx.ally_distance_sq = (thia.x - dek.x)**2 + (thia.y - dek.y)**2
         
         situation = {
-            'leader_health': dek.health_percentage,
-            'support_health': thia.health_percentage if thia and thia.is_alive else 100,
+            'leader_health': ctx.leader_health,
+            'support_health': ctx.support_health,
             'enemy_count': len(enemies),
-            'enemy_distance': self._min_enemy_distance(dek, enemies),
-            'boss_present': any(hasattr(e, 'phase') for e in enemies)
+            'enemy_distance': math.sqrt(ctx.nearest_distance_sq) if enemies else 100.0,
+            'boss_present': boss_target is not None
         }
         
         recommended_formation = self.formation_manager.recommend_formation(situation)
         self.formation_manager.set_formation(recommended_formation)
         
-        boss_target = None
-        for enemy in enemies:
-            if hasattr(enemy, 'phase'):
-                boss_target = enemy
-                break
-        
-        formation_positions = self.formation_manager.get_formation_positions(
+        ctx.formation_positions = self.formation_manager.get_formation_positions(
             (dek.x, dek.y),
             (boss_target.x, boss_target.y) if boss_target else None
         )
         
-        dek_action = self._plan_dek_action(dek, thia, enemies, formation_positions, situation)
+        dek_action = self._plan_dek_action(dek, thia, ctx)
         planned_actions[dek.name] = dek_action
         
-        if thia and thia.is_alive:
-            thia_action = self._plan_thia_action(dek, thia, enemies, formation_positions, situation)
+        if ctx.support_active:
+            thia_action = self._plan_thia_action(dek, thia, ctx)
             planned_actions[thia.name] = thia_action
         
         self._update_coordination_score(dek, thia, planned_actions)
         
         return planned_actions
     
-    def _min_enemy_distance(self, agent, enemies: List) -> float:
-        if not enemies:
-            return 100.0
+    def _scan_enemies(self, agent, enemies: List) -> TurnContext:
+        ctx = TurnContext()
+        ax, ay = agent.x, agent.y
         
-        min_dist = float('inf')
         for enemy in enemies:
-            dist = math.sqrt((enemy.x - agent.x)**2 + (enemy.y - agent.y)**2)
-            min_dist = min(min_dist, dist)
-        
-        return min_dist
-    
-    def _plan_dek_action(self, dek, thia, enemies, formation_positions, situation) -> CoordinatedAction:
-        if dek.health_percentage < 30:
-            if thia and thia.is_alive:
+            dx = enemy.x - ax
+            dy = enemy.y - ay
+            d2 = dx * dx + dy * dy
+            if d2 < ctx.nearest_distance_sq:
+                ctx.nearest_distance_sq = d2
+                ctx.nearest = enemy
+            if ctx.boss is None and hasattr(enemy, 'phase'):
+                ctx.boss = enemy
+                ctx.boss_distance_sq = d2
+        
+        return ctx
+    
+    def _plan_dek_action(self, dek, thia, ctx: TurnContext) -> CoordinatedAction:
+        if ctx.leader_health < 30:
+            if ctx.support_active:
                 self.communicate(dek, thia, 'request_help', {'reason': 'low_health'})
             return CoordinatedAction(
                 agent_name=dek.name,
@@ -568,13 +663,10 @@ class CoordinationProtocol:
                 priority=ActionPriority.CRITICAL
             )
         
-        boss_targets = [e for e in enemies if hasattr(e, 'phase')]
-        if boss_targets:
-            boss = boss_targets[0]
-            distance = math.sqrt((boss.x - dek.x)**2 + (boss.y - dek.y)**2)
-            
-            if distance <= 1.5:
-                if thia and thia.is_alive:
+        boss = ctx.boss
+        if boss is not None:
+            if ctx.boss_distance_sq <= MELEE_RANGE_SQ:
+                if ctx.support_active:
                     self.communicate(dek, thia, 'attack_signal', {'target': boss})
                     return CoordinatedAction(
                         agent_name=dek.name,
@@ -591,7 +683,7 @@ class CoordinationProtocol:
                     priority=ActionPriority.HIGH
                 )
             else:
-                target_pos = formation_positions.get('leader', (boss.x, boss.y))
+                target_pos = ctx.formation_positions.get('leader', (boss.x, boss.y))
                 return CoordinatedAction(
                     agent_name=dek.name,
                     action_type='move_to',
@@ -599,11 +691,9 @@ class CoordinationProtocol:
                     priority=ActionPriority.MEDIUM
                 )
         
-        if enemies:
-            nearest = min(enemies, key=lambda e: math.sqrt((e.x - dek.x)**2 + (e.y - dek.y)**2))
-            distance = math.sqrt((nearest.x - dek.x)**2 + (nearest.y - dek.y)**2)
-            
-            if distance <= 1.5:
+        nearest = ctx.nearest
+        if nearest is not None:
+            if ctx.nearest_distance_sq <= MELEE_RANGE_SQ:
                 return CoordinatedAction(
                     agent_name=dek.name,
                     action_type='attack',
@@ -624,11 +714,9 @@ class CoordinationProtocol:
             priority=ActionPriority.LOW
         )
     
-    def _plan_thia_action(self, dek, thia, enemies, formation_positions, situation) -> CoordinatedAction:
-        if dek.health_percentage < 50:
-            distance_to_dek = math.sqrt((thia.x - dek.x)**2 + (thia.y - dek.y)**2)
-            
-            if distance_to_dek <= 1.5:
+    def _plan_thia_action(self, dek, thia, ctx: TurnContext) -> CoordinatedAction:
+        if ctx.leader_health < 50:
+            if ctx.ally_distance_sq <= MELEE_RANGE_SQ:
                 return CoordinatedAction(
                     agent_name=thia.name,
                     action_type='heal_ally',
@@ -643,19 +731,16 @@ class CoordinationProtocol:
                     priority=ActionPriority.HIGH
                 )
         
-        if thia.health_percentage < 30:
+        if ctx.support_health < 30:
             return CoordinatedAction(
                 agent_name=thia.name,
                 action_type='self_repair',
                 priority=ActionPriority.HIGH
             )
         
-        boss_targets = [e for e in enemies if hasattr(e, 'phase')]
-        if boss_targets and dek.health_percentage > 60:
-            boss = boss_targets[0]
-            dek_distance = math.sqrt((dek.x - boss.x)**2 + (dek.y - boss.y)**2)
-            
-            if dek_distance <= 2:
+        boss = ctx.boss
+        if boss is not None and ctx.leader_health > 60:
+            if ctx.boss_distance_sq <= SUPPORT_ENGAGE_RANGE_SQ:
                 self.communicate(thia, dek, 'supporting_attack', {'target': boss})
                 return CoordinatedAction(
                     agent_name=thia.name,
@@ -666,7 +751,7 @@ class CoordinationProtocol:
                     sync_with=[dek.name]
                 )
         
-        target_pos = formation_positions.get('support', (dek.x - 1, dek.y))
+        target_pos = ctx.formation_positions.get('support', (dek.x - 1, dek.y))
         return CoordinatedAction(
             agent_name=thia.name,
             action_type='maintain_formation',
@@ -681,10 +766,10 @@ class CoordinationProtocol:
         score += synced_actions * 10
         
         if thia and thia.is_alive:
-            distance = math.sqrt((dek.x - thia.x)**2 + (dek.y - thia.y)**2)
-            if distance <= 3:
+            distance_sq = (dek.x - thia.x)**2 + (dek.y - thia.y)**2
+            if distance_sq <= FORMATION_NEAR_SQ:
                 score += 20
-            elif distance <= 6:
+            elif distance_sq <= FORMATION_MID_SQ:
                 score += 10
         
         dek_action = planned_actions.get(dek.name)
@@ -722,13 +807,33 @@ class CoordinationProtocol:
         
         return False
     
+    def _planned_enemies(self, grid):
+        # The planned enemy list is only trusted while the grid is unchanged
+        if self._last_enemies is None:
+            return None
+        planned_grid, version, enemies = self._last_enemies
+        if planned_grid is not grid or version != getattr(grid, 'occupancy_version', None):
+            self._last_enemies = None
+            return None
+        return enemies
+    
+    def _nearby_enemies(self, agent, grid, radius):
+        planned = self._planned_enemies(grid)
+        if planned is not None:
+            candidates = [e for e in planned if e is not agent and e.is_alive]
+            distances = grid.distances_from(agent.x, agent.y, candidates)
+            return [e for e, d in zip(candidates, distances) if d <= radius]
+        
+        return [
+            other for other in grid.get_agents_in_radius(agent.x, agent.y, radius)
+            if other is not agent and other.is_alive and other.is_creature
+        ]
+    
     def _execute_retreat(self, agent, grid):
-        enemies = []
-        if grid:
-            for cell in grid.get_cells_in_radius(agent.x, agent.y, 5):
-                if cell.occupant and cell.occupant != agent and cell.occupant.is_alive:
-                    if hasattr(cell.occupant, 'aggression_level') or hasattr(cell.occupant, 'phase'):
-                        enemies.append(cell.occupant)
+        if not grid:
+            return False
+        
+        enemies = self._nearby_enemies(agent, grid, RETREAT_SCAN_RADIUS)
         
         if not enemies:
             return False
@@ -736,21 +841,7 @@ class CoordinationProtocol:
         avg_enemy_x = sum(e.x for e in enemies) / len(enemies)
         avg_enemy_y = sum(e.y for e in enemies) / len(enemies)
         
-        best_move = None
-        best_distance = -1
-        
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                new_x, new_y = agent.x + dx, agent.y + dy
-                if grid:
-                    new_x, new_y = grid.wrap_coordinates(new_x, new_y)
-                
-                dist = math.sqrt((new_x - avg_enemy_x)**2 + (new_y - avg_enemy_y)**2)
-                if dist > best_distance:
-                    best_distance = dist
-                    best_move = (new_x, new_y)
+        best_move = self._best_neighbour(agent, avg_enemy_x, avg_enemy_y, grid, farthest=True)
         
         if best_move and agent.can_move():
             return agent.move_to(best_move[0], best_move[1])
@@ -762,12 +853,11 @@ class CoordinationProtocol:
         if not target or not target.is_alive:
             return False
         
-        distance = math.sqrt((agent.x - target.x)**2 + (agent.y - target.y)**2)
-        if distance > 1.5:
+        if (agent.x - target.x)**2 + (agent.y - target.y)**2 > MELEE_RANGE_SQ:
             return False
         
         sync_bonus = len(action.sync_with) * 5
-        base_damage = random.randint(35, 55) + sync_bonus
+        base_damage = self.rng.randint(35, 55) + sync_bonus
         
         target.take_damage(base_damage)
         
@@ -788,11 +878,10 @@ class CoordinationProtocol:
         if not target or not target.is_alive:
             return False
         
-        distance = math.sqrt((agent.x - target.x)**2 + (agent.y - target.y)**2)
-        if distance > 1.5:
+        if (agent.x - target.x)**2 + (agent.y - target.y)**2 > MELEE_RANGE_SQ:
             return False
         
-        damage = random.randint(35, 55)
+        damage = self.rng.randint(35, 55)
         target.take_damage(damage)
         
         # Track damage stats for Dek
@@ -814,27 +903,34 @@ class CoordinationProtocol:
         
         target_x, target_y = position
         
-        best_move = None
-        best_distance = float('inf')
-        
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                new_x, new_y = agent.x + dx, agent.y + dy
-                if grid:
-                    new_x, new_y = grid.wrap_coordinates(new_x, new_y)
-                
-                dist = math.sqrt((new_x - target_x)**2 + (new_y - target_y)**2)
-                if dist < best_distance:
-                    best_distance = dist
-                    best_move = (new_x, new_y)
+        best_move = self._best_neighbour(agent, target_x, target_y, grid, farthest=False)
         
         if best_move:
             return agent.move_to(best_move[0], best_move[1])
         
         return False
     
+    def _best_neighbour(self, agent, target_x, target_y, grid, farthest):
+        ax, ay = agent.x, agent.y
+        wrap = grid.wrap_coordinates if grid else None
+        
+        best_move = None
+        best_d2 = -1 if farthest else float('inf')
+        
+        for dx, dy in NEIGHBOUR_OFFSETS:
+            new_x, new_y = ax + dx, ay + dy
+            if wrap:
+                new_x, new_y = wrap(new_x, new_y)
+            
+            ddx = new_x - target_x
+            ddy = new_y - target_y
+            d2 = ddx * ddx + ddy * ddy
+            if (d2 > best_d2) if farthest else (d2 < best_d2):
+                best_d2 = d2
+                best_move = (new_x, new_y)
+        
+        return best_move
+    
     def _execute_move_towards(self, agent, target, grid):
         if not target:
             return False
@@ -856,11 +952,10 @@ class CoordinationProtocol:
         if not target or not target.is_alive:
             return False
         
-        distance = math.sqrt((agent.x - target.x)**2 + (agent.y - target.y)**2)
-        if distance > 3:
+        if (agent.x - target.x)**2 + (agent.y - target.y)**2 > SUPPORT_ATTACK_RANGE_SQ:
             return False
         
-        damage = random.randint(10, 20)
+        damage = self.rng.randint(10, 20)
         target.take_damage(damage)
         
         return True
@@ -878,15 +973,16 @@ class CoordinationProtocol:
         if not agent.can_move() or not grid:
             return False
         
+        wrap = grid.wrap_coordinates
+        get_cell = grid.get_cell
+        ax, ay = agent.x, agent.y
+        
         valid_moves = []
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                new_x, new_y = grid.wrap_coordinates(agent.x + dx, agent.y + dy)
-                cell = grid.get_cell(new_x, new_y)
-                if cell and not cell.terrain.is_hazardous:
-                    valid_moves.append((new_x, new_y))
+        for dx, dy in NEIGHBOUR_OFFSETS:
+            new_x, new_y = wrap(ax + dx, ay + dy)
+            cell = get_cell(new_x, new_y)
+            if cell and not cell.terrain.is_hazardous:
+                valid_moves.append((new_x, new_y))
         
         if valid_moves:
             target = random.choice(valid_moves)
@@ -898,8 +994,8 @@ class CoordinationProtocol:
         return {
             'coordination_score': self.coordination_score,
             'active_goals': len(self.goal_planner.get_active_goals()),
-            'completed_goals': len(self.goal_planner.completed_goals),
+            'completed_goals': self.goal_planner.completed_goal_count,
             'current_formation': self.formation_manager.current_formation,
             'communication_count': len(self.communication_log),
-            'synced_actions_pending': len(self.sync_actions)
+            'synced_actions_pending': self.sync_action_count
         }
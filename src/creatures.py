@@ -1,16 +1,23 @@
 from agent import Agent
-import random
 
 
 class WildlifeAgent(Agent):
     
+    is_creature = True
+    
     def __init__(self, name, species, x=0, y=0, max_health=50, max_stamina=80):
         super().__init__(name, x, y, max_health, max_stamina)
         self.species = species
         self.aggression_level = 0.2
         self.territory_size = 3
-        self.pack_members = []
+        self.pack_members = set()
         self.is_prey = True
+        self._actions = {
+            "rest": self.rest,
+            "flee": self.flee_behavior,
+            "fight": self.fight_behavior,
+            "forage": self.forage_behavior,
+        }
         
     @property
     def symbol(self):
@@ -20,22 +27,22 @@ class WildlifeAgent(Agent):
         self.aggression_level = max(0.0, min(1.0, level))
     
     def add_pack_member(self, member):
-        self.pack_members.append(member)
-        member.pack_members.append(self)
+        self.pack_members.add(member)
+        member.pack_members.add(self)
     
     def detect_threats(self):
         if not self.grid:
             return []
         
-        threats = []
-        nearby_cells = self.grid.get_cells_in_radius(self.x, self.y, 2)
-        
-        for cell in nearby_cells:
-            if cell.occupant and cell.occupant != self:
-                agent = cell.occupant
-                if hasattr(agent, 'weapons') or 'predator' in agent.__class__.__name__.lower():
-                    threats.append(agent)
-        
+        key = self._scan_key(2)
+        if key == self._detect_key:
+            return self._detect_cache
+        threats = [
+            agent for agent in self.grid.get_agents_in_radius(self.x, self.y, 2)
+            if agent is not self and agent.is_wildlife_threat
+        ]
+        self._detect_key = key
+        self._detect_cache = threats
         return threats
     
     def decide_action(self):
@@ -45,7 +52,7 @@ class WildlifeAgent(Agent):
         threats = self.detect_threats()
         
         if threats:
-            if random.random() < self.aggression_level:
+            if self.rng.random() < self.aggression_level:
                 return "fight"
             else:
                 return "flee"
@@ -60,16 +67,11 @@ class WildlifeAgent(Agent):
         if not threats:
             return
         
-        nearest_threat = min(threats, key=lambda t: self.distance_to(t))
-        
-        best_escape = None
-        best_distance = 0
+        nearest_threat, _ = self.nearest_agent(threats)
         
-        for x, y in self.get_valid_moves():
-            distance = self.distance_to_position(x, y)
-            if distance > best_distance:
-                best_distance = distance
-                best_escape = (x, y)
+        best_escape = self.grid.best_move(
+            self.get_valid_moves(), nearest_threat.x, nearest_threat.y, farthest=True
+        )
         
         if best_escape:
             self.move_to(best_escape[0], best_escape[1])
@@ -77,57 +79,46 @@ class WildlifeAgent(Agent):
     def fight_behavior(self):
         threats = self.detect_threats()
         if threats:
-            target = min(threats, key=lambda t: self.distance_to(t))
-            if self.distance_to(target) == 1:
-                damage = random.randint(5, 15)
+            target, distance = self.nearest_agent(threats)
+            if distance == 1:
+                damage = self.roll(5, 15)
                 target.take_damage(damage)
-                if hasattr(target, 'consume_stamina') and random.random() < 0.4:
-                    target.consume_stamina(random.randint(5, 12))
+                if hasattr(target, 'consume_stamina') and self.rng.random() < 0.4:
+                    target.consume_stamina(self.roll(5, 12))
             else:
                 self.move_towards(target)
     
     def forage_behavior(self):
         valid_moves = self.get_valid_moves()
         if valid_moves:
-            preferred_terrain = []
-            for x, y in valid_moves:
-                cell = self.grid.get_cell(x, y)
-                if not cell.terrain.is_hazardous:
-                    preferred_terrain.append((x, y))
-            
-            if preferred_terrain:
-                self.move_to(*random.choice(preferred_terrain))
-            else:
-                self.move_to(*random.choice(valid_moves))
+            get_cell = self.grid.get_cell
+            preferred_terrain = [
+                move for move in valid_moves
+                if not get_cell(move[0], move[1]).terrain.is_hazardous
+            ]
+            self.move_to(*self.rng.choice(preferred_terrain or valid_moves))
     
     def move_towards(self, target):
-        best_move = None
-        best_distance = float('inf')
+        if not self.grid:
+            return
         
-        for x, y in self.get_valid_moves():
-            distance = self.distance_to_position(x, y)
-            if distance < best_distance:
-                best_distance = distance
-                best_move = (x, y)
+        best_move = self.grid.best_move(self.get_valid_moves(), target.x, target.y)
         
         if best_move:
             self.move_to(best_move[0], best_move[1])
     
+    def rest(self):
+        self.restore_stamina(8)
+    
     def update(self):
-        action = self.decide_action()
-        
-        if action == "rest":
-            self.restore_stamina(8)
-        elif action == "flee":
-            self.flee_behavior()
-        elif action == "fight":
-            self.fight_behavior()
-        elif action == "forage":
-            self.forage_behavior()
+        self._actions[self.decide_action()]()
 
 
 class BossAdversary(Agent):
     
+    IS_BOSS = True
+    is_creature = True
+    
     def __init__(self, name="Ultimate Adversary", x=10, y=10):
         super().__init__(name, x, y, max_health=150, max_stamina=300)
         self.size = 3
@@ -139,6 +130,15 @@ class BossAdversary(Agent):
         self.territory_center = (x, y)
         self.territory_radius = 7
         self.focus_target = None
+        # Callables in the same order as special_abilities
+        self._special_attacks = (self.earthquake_attack, self.energy_blast_attack, self.regenerate_health)
+        self._actions = {
+            "rest": self.rest,
+            "patrol": self.hunt_or_patrol,
+            "regenerate": self.regenerate_health,
+            "special_attack": self.special_attack,
+            "attack": self.basic_attack,
+        }
         
     @property
     def symbol(self):
@@ -160,17 +160,20 @@ class BossAdversary(Agent):
         if not self.grid:
             return []
         
-        enemies = []
         # Much larger scan radius - Boss can see whole battlefield
         scan_radius = 20 if self.is_enraged else 15
-        nearby_cells = self.grid.get_cells_in_radius(self.x, self.y, scan_radius)
-        
-        for cell in nearby_cells:
-            if cell.occupant and cell.occupant != self:
-                # Only target Dek and Thia (allies)
-                if hasattr(cell.occupant, 'is_exiled') or hasattr(cell.occupant, 'battery_level'):
-                    enemies.append(cell.occupant)
         
+        key = self._scan_key(scan_radius)
+        if key == self._detect_key:
+            return self._detect_cache
+        
+        # Only target Dek and Thia (allies)
+        enemies = [
+            agent for agent in self.grid.get_agents_in_radius(self.x, self.y, scan_radius)
+            if agent is not self and agent.is_boss_target
+        ]
+        self._detect_key = key
+        self._detect_cache = enemies
         return enemies
     
     def decide_action(self):
@@ -185,37 +188,31 @@ class BossAdversary(Agent):
         if self.health < self.max_health * 0.3:
             return "regenerate"
         
-        if self.is_enraged and random.random() < 0.5:
+        if self.is_enraged and self.rng.random() < 0.5:
             return "special_attack"
         
         return "attack"
     
     def special_attack(self):
-        ability = random.choice(self.special_abilities)
-        
-        if ability == "earthquake":
-            self.earthquake_attack()
-        elif ability == "energy_blast":
-            self.energy_blast_attack()
-        elif ability == "regeneration":
-            self.regenerate_health()
+        self.rng.choice(self._special_attacks)()
     
     def earthquake_attack(self):
         if not self.grid:
             return
         
-        affected_cells = self.grid.get_cells_in_radius(self.x, self.y, 4 if self.phase == 1 else 6)
+        # Only occupied cells matter, so visit the agents in range directly
+        affected_agents = self.grid.get_agents_in_radius(self.x, self.y, 4 if self.phase == 1 else 6)
         
-        for cell in affected_cells:
-            if cell.occupant and cell.occupant != self:
-                damage = random.randint(15, 25) if self.phase == 1 else random.randint(25, 40)
-                cell.occupant.take_damage(damage)
+        for agent in affected_agents:
+            if agent is not self:
+                damage = self.roll(15, 25) if self.phase == 1 else self.roll(25, 40)
+                agent.take_damage(damage)
     
     def energy_blast_attack(self):
         enemies = self.detect_enemies()
         if enemies:
-            target = random.choice(enemies)
-            damage = random.randint(35, 55) if self.phase == 1 else random.randint(45, 70)
+            target = self.rng.choice(enemies)
+            damage = self.roll(35, 55) if self.phase == 1 else self.roll(45, 70)
             target.take_damage(damage)
     
     def regenerate_health(self):
@@ -228,32 +225,26 @@ class BossAdversary(Agent):
         if not enemies:
             return
         
-        targets_in_range = [e for e in enemies if self.distance_to(e) <= self.attack_range]
+        distances = self.distances_to(enemies)
+        targets_in_range = [e for e, d in zip(enemies, distances) if d <= self.attack_range]
         
         if targets_in_range:
-            target = random.choice(targets_in_range)
-            damage = random.randint(18, 30) if self.phase == 1 else random.randint(28, 45)
+            target = self.rng.choice(targets_in_range)
+            damage = self.roll(18, 30) if self.phase == 1 else self.roll(28, 45)
             if self.is_enraged:
                 damage = int(damage * 1.3)
             target.take_damage(damage)
             self.last_attacker = target
         else:
-            nearest_enemy = min(enemies, key=lambda e: self.distance_to(e))
+            nearest_enemy = enemies[distances.index(min(distances))]
             self.move_towards_enemy(nearest_enemy)
     
     def move_towards_enemy(self, enemy):
-        best_move = None
-        best_distance = float('inf')
+        if not self.grid:
+            return
         
-        for x, y in self.get_valid_moves():
-            # Calculate distance from NEW position to enemy
-            if self.grid:
-                distance = self.grid.calculate_distance(x, y, enemy.x, enemy.y)
-            else:
-                distance = abs(x - enemy.x) + abs(y - enemy.y)
-            if distance < best_distance:
-                best_distance = distance
-                best_move = (x, y)
+        # Distance is measured from each NEW position to the enemy
+        best_move = self.grid.best_move(self.get_valid_moves(), enemy.x, enemy.y)
         
         if best_move:
             self.move_to(best_move[0], best_move[1])
@@ -273,27 +264,22 @@ class BossAdversary(Agent):
         if best_move:
             self.move_to(*best_move)
         else:
-            self.move_to(*random.choice(valid_moves))
+            self.move_to(*self.rng.choice(valid_moves))
+    
+    def rest(self):
+        self.restore_stamina(15)
+    
+    def hunt_or_patrol(self):
+        # Instead of patrolling, actively hunt for enemies
+        enemies = self.detect_enemies()
+        if enemies:
+            nearest, _ = self.nearest_agent(enemies)
+            self.move_towards_enemy(nearest)
+        else:
+            self.patrol_behavior()
     
     def update(self):
-        action = self.decide_action()
-        
-        if action == "rest":
-            self.restore_stamina(15)
-        elif action == "patrol":
-            # Instead of patrolling, actively hunt for enemies
-            enemies = self.detect_enemies()
-            if enemies:
-                nearest = min(enemies, key=lambda e: self.distance_to(e))
-                self.move_towards_enemy(nearest)
-            else:
-                self.patrol_behavior()
-        elif action == "regenerate":
-            self.regenerate_health()
-        elif action == "special_attack":
-            self.special_attack()
-        elif action == "attack":
-            self.basic_attack()
+        self._actions[self.decide_action()]()
         
         if self.rage_level > 0:
             self.rage_level = max(0, self.rage_level - 1)
\ No newline at end of file
@@ -10,15 +10,51 @@ import csv
 import json
 import os
 import sys
+import time
+import weakref
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterable, Optional
 from pathlib import Path
 
 # Handle imports for both package and standalone use
 try:
     from .metrics import SimulationMetrics, AgentMetrics, MetricsCollector
+    from .json_stream import write_json_stream
 except ImportError:
     from metrics import SimulationMetrics, AgentMetrics, MetricsCollector
+    from json_stream import write_json_stream
+
+
+# Large write buffer so each CSV export reaches the OS in a few big writes
+CSV_BUFFER_SIZE = 1 << 20
+
+# Write buffer for the experiment log file handle
+LOG_BUFFER_SIZE = 8192
+
+HONOUR_PROGRESSION_HEADERS = ('run_id', 'config_name', 'agent_id', 'agent_type', 'step', 'honour')
+
+
+def _parse_bool(value: str) -> bool:
+    return value.lower() == 'true'
+
+
+def _keep_str(value: str) -> str:
+    return value
+
+
+# Typed columns of a simulation results CSV; other columns stay strings
+SIMULATION_RESULT_CONVERTERS = {
+    'run_id': int,
+    'total_steps': int,
+    'total_combats': int,
+    'total_kills': int,
+    'num_agents': int,
+    'duration_seconds': float,
+    'team_survival_rate': float,
+    'average_survival_time': float,
+    'resource_efficiency': float,
+    'boss_defeated': _parse_bool,
+}
 
 
 class DataCollector:
@@ -67,20 +103,25 @@ class DataCollector:
         
     def save_simulation_results_csv(
         self, 
-        results: List[SimulationMetrics], 
+        results: Iterable[SimulationMetrics], 
         filename: str = None
     ) -> str:
         """
         Save multiple simulation results to CSV.
         
+        Results may be a list or any iterator, such as runs arriving from
+        worker processes; each row is written as soon as it is produced.
+        
         Args:
-            results: List of SimulationMetrics objects
+            results: SimulationMetrics objects to write, in file order
             filename: Optional custom filename
             
         Returns:
             Path to the saved CSV file
         """
-        if not results:
+        results = iter(results)
+        first = next(results, None)
+        if first is None:
             return ""
             
         if filename is None:
@@ -88,14 +129,13 @@ class DataCollector:
             
         filepath = self.csv_dir / filename
         
-        # Get headers from first result
-        headers = list(results[0].to_dict().keys())
+        first_row = first.to_dict()
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=headers)
-            writer.writeheader()
-            for result in results:
-                writer.writerow(result.to_dict())
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(first_row)
+            writer.writerow(first_row.values())
+            writer.writerows(result.to_dict().values() for result in results)
                 
         print(f"[DataCollector] Saved simulation results to: {filepath}")
         return str(filepath)
@@ -126,14 +166,12 @@ class DataCollector:
         filepath = self.csv_dir / filename
         
         # Get headers
-        headers = ['run_id'] + list(metrics[0].to_dict().keys())
+        headers = ['run_id', *metrics[0].to_dict()]
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=headers)
-            writer.writeheader()
-            for m in metrics:
-                row = {'run_id': run_id, **m.to_dict()}
-                writer.writerow(row)
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(headers)
+            writer.writerows((run_id, *m.to_dict().values()) for m in metrics)
                 
         print(f"[DataCollector] Saved agent metrics to: {filepath}")
         return str(filepath)
@@ -161,26 +199,20 @@ class DataCollector:
             
         filepath = self.csv_dir / filename
         
-        # Collect all agent metrics with run info
-        all_metrics = []
-        for run in all_runs:
-            for agent_id, metrics in run.agent_metrics.items():
-                row = {
-                    'run_id': run.run_id,
-                    'config_name': run.config_name,
-                    **metrics.to_dict()
-                }
-                all_metrics.append(row)
-                
-        if not all_metrics:
+        first = next((m for run in all_runs for m in run.agent_metrics.values()), None)
+        if first is None:
             return ""
             
-        # Write CSV
-        headers = list(all_metrics[0].keys())
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=headers)
-            writer.writeheader()
-            writer.writerows(all_metrics)
+        # Stream agent metrics with run info straight into the writer
+        headers = ['run_id', 'config_name', *first.to_dict()]
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(headers)
+            writer.writerows(
+                (run.run_id, run.config_name, *metrics.to_dict().values())
+                for run in all_runs
+                for metrics in run.agent_metrics.values()
+            )
             
         print(f"[DataCollector] Saved all agent metrics to: {filepath}")
         return str(filepath)
@@ -208,32 +240,23 @@ class DataCollector:
             
         filepath = self.csv_dir / filename
         
-        # Find max steps across all runs
-        max_steps = max(run.total_steps for run in all_runs) if all_runs else 0
-        
-        # Collect honour data
-        rows = []
-        for run in all_runs:
-            for agent_id, metrics in run.agent_metrics.items():
-                for step, honour in enumerate(metrics.honour_history):
-                    rows.append({
-                        'run_id': run.run_id,
-                        'config_name': run.config_name,
-                        'agent_id': agent_id,
-                        'agent_type': metrics.agent_type,
-                        'step': step,
-                        'honour': honour
-                    })
-                    
-        if not rows:
+        if not any(
+            metrics.honour_history
+            for run in all_runs
+            for metrics in run.agent_metrics.values()
+        ):
             return ""
             
-        # Write CSV
-        headers = ['run_id', 'config_name', 'agent_id', 'agent_type', 'step', 'honour']
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=headers)
-            writer.writeheader()
-            writer.writerows(rows)
+        # Stream one row per recorded honour value
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(HONOUR_PROGRESSION_HEADERS)
+            writer.writerows(
+                (run.run_id, run.config_name, agent_id, metrics.agent_type, step, honour)
+                for run in all_runs
+                for agent_id, metrics in run.agent_metrics.items()
+                for step, honour in enumerate(metrics.honour_history)
+            )
             
         print(f"[DataCollector] Saved honour progression to: {filepath}")
         return str(filepath)
@@ -272,7 +295,7 @@ class DataCollector:
             
         # Write CSV
         headers = list(rows[0].keys())
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as f:
             writer = csv.DictWriter(f, fieldnames=headers)
             writer.writeheader()
             writer.writerows(rows)
@@ -302,30 +325,33 @@ class DataCollector:
             
         filepath = self.json_dir / filename
         
-        # Build JSON structure
-        data = {
+        # Header fields; the runs list is streamed after them
+        header = {
             'session_id': self.session_id,
             'timestamp': datetime.now().isoformat(),
             'experiment_config': experiment_config,
             'total_runs': len(all_runs),
-            'runs': []
         }
         
-        for run in all_runs:
-            run_data = run.to_dict()
-            run_data['agent_details'] = {
-                agent_id: metrics.to_dict()
-                for agent_id, metrics in run.agent_metrics.items()
-            }
-            data['runs'].append(run_data)
-            
-        # Write JSON
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        # Write JSON one run at a time
+        with open(filepath, 'wb') as f:
+            write_json_stream(f, header, 'runs', (
+                self._run_export_data(run) for run in all_runs
+            ))
             
         print(f"[DataCollector] Saved experiment JSON to: {filepath}")
         return str(filepath)
         
+    @staticmethod
+    def _run_export_data(run: SimulationMetrics) -> Dict[str, Any]:
+        """Build the JSON entry for one run, including per-agent details."""
+        run_data = run.to_dict()
+        run_data['agent_details'] = {
+            agent_id: metrics.to_dict()
+            for agent_id, metrics in run.agent_metrics.items()
+        }
+        return run_data
+        
     def load_simulation_results_csv(self, filepath: str) -> List[Dict[str, Any]]:
         """
         Load simulation results from CSV.
@@ -336,22 +362,20 @@ class DataCollector:
         Returns:
             List of dictionaries containing simulation data
         """
-        results = []
-        with open(filepath, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Convert numeric fields
-                for key in ['run_id', 'total_steps', 'total_combats', 'total_kills', 'num_agents']:
-                    if key in row:
-                        row[key] = int(row[key])
-                for key in ['duration_seconds', 'team_survival_rate', 'average_survival_time', 'resource_efficiency']:
-                    if key in row:
-                        row[key] = float(row[key])
-                for key in ['boss_defeated']:
-                    if key in row:
-                        row[key] = row[key].lower() == 'true'
-                results.append(row)
-        return results
+        with open(filepath, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            headers = next(reader, None)
+            if headers is None:
+                return []
+            
+            # Resolve one converter per column before reading any rows
+            converters = [SIMULATION_RESULT_CONVERTERS.get(key, _keep_str) for key in headers]
+            columns = list(zip(headers, converters))
+            return [
+                {key: convert(value) for (key, convert), value in zip(columns, row)}
+                for row in reader
+                if row
+            ]
         
     def load_experiment_json(self, filepath: str) -> Dict[str, Any]:
         """
@@ -398,23 +422,45 @@ class ExperimentLogger:
         self.verbose = verbose
         self.log_file = log_file
         self.logs: List[str] = []
+        self._log_handle = None
+        
+        # Formatted timestamp of the last second that logged anything
+        self._stamp_second = None
+        self._stamp = ""
         
         if log_file:
             # Ensure directory exists
             Path(log_file).parent.mkdir(parents=True, exist_ok=True)
             
+            # Keep one buffered handle open; it is closed when the logger goes away
+            self._log_handle = open(log_file, 'a', encoding='utf-8', buffering=LOG_BUFFER_SIZE)
+            self._closer = weakref.finalize(self, self._log_handle.close)
+            
+    def flush(self) -> None:
+        """Push buffered log lines to the log file."""
+        if self._log_handle is not None:
+            self._log_handle.flush()
+            
+    def close(self) -> None:
+        """Close the log file; later messages are kept in memory only."""
+        if self._log_handle is not None:
+            self._closer()
+            self._log_handle = None
+            
     def _log(self, level: str, message: str) -> None:
         """Internal logging method."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        formatted = f"[{timestamp}] [{level}] {message}"
+        second = int(time.time())
+        if second != self._stamp_second:
+            self._stamp_second = second
+            self._stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+        formatted = f"[{self._stamp}] [{level}] {message}"
         self.logs.append(formatted)
         
         if self.verbose:
             print(formatted)
             
-        if self.log_file:
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(formatted + "\n")
+        if self._log_handle is not None:
+            self._log_handle.write(formatted + "\n")
                 
     def info(self, message: str) -> None:
         """Log an info message."""
@@ -440,9 +486,10 @@ class ExperimentLogger:
         """Log simulation run start."""
         self.info(f"Run {run_id}/{total_runs} started")
         
-    def run_complete(self, run_id: int, steps: int, winner: str) -> None:
-        """Log simulation run completion."""
-        self.success(f"Run {run_id} complete: {steps} steps, winner: {winner}")
+    def run_complete(self, run_id: int, steps: int, winner: str, config_name: str = None) -> None:
+        """Log simulation run completion, optionally tagged with its config."""
+        run = f"{config_name} run {run_id}" if config_name else f"Run {run_id}"
+        self.success(f"{run} complete: {steps} steps, winner: {winner}")
         
     def experiment_complete(self, config_name: str, duration: float) -> None:
         """Log experiment completion."""
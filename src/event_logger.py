@@ -1,47 +1,207 @@
-import json
 import os
+import copy
 from datetime import datetime
 from collections import defaultdict
+from itertools import accumulate
+from array import array
+from types import MappingProxyType
+
+# Handle imports for both package and standalone use
+try:
+    from .json_stream import encode_json, write_json_stream
+except ImportError:
+    from json_stream import encode_json, write_json_stream
+
+# pyarrow is only needed for Parquet export
+try:
+    import pyarrow
+    import pyarrow.parquet
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Read-only stand-in for events logged without details; the details
+# column stores None for them and the event view builds a fresh dict
+_NO_DETAILS = MappingProxyType({})
+
+# Position columns are array('h'); system events have no position
+NO_POSITION = -32768
+
+
+def _new_type_counts():
+    return defaultdict(int)
+
+
+# Detail keys promoted to their own Parquet columns
+PARQUET_DETAIL_COLUMNS = ('damage', 'stamina_cost', 'change')
 
 
 class EventLogger:
     
     def __init__(self):
-        self.events = []
         self.step_counter = 0
-        self.statistics = defaultdict(int)
-        self.agent_stats = defaultdict(lambda: defaultdict(int))
+        self.agent_stats = defaultdict(_new_type_counts)
         
-    def log_event(self, event_type, agent, details=None):
-        event = {
-            'timestamp': self.step_counter,
-            'type': event_type,
-            'agent': agent.name if agent else 'system',
-            'position': (agent.x, agent.y) if agent else None,
-            'details': details or {}
-        }
+        # Events are stored column-wise: row i of every column is event i
+        self._timestamps = array('i')
+        self._type_col = array('H')
+        self._agents = []
+        self._pos_x = array('h')
+        self._pos_y = array('h')
+        self._details = []
+        
+        # Event types are interned to small ints on first sight
+        self._type_ids = {}
+        self._type_names = []
+        
+        # Row numbers of each event type (by type id) and of each agent's events
+        self._by_type = []
+        self._by_agent = defaultdict(list)
         
-        self.events.append(event)
-        self.statistics[event_type] += 1
+        # Per-agent (agent_stats entry, row list) pairs for one-lookup updates
+        self._agent_slots = {}
+        
+        # get_simulation_summary snapshot, reused until a step or event is added;
+        # callers only ever see copies of it
+        self._summary_key = None
+        self._summary_cache = None
+        
+        # Running aggregates behind the statistics getters
+        self._combat_damage_total = 0
+        self._damage_by_agent = defaultdict(list)
+        self._kills_by_agent = defaultdict(int)
+        self._stamina_spent_total = 0
+        self._stamina_by_agent = defaultdict(int)
+        self._actions_by_cost = defaultdict(int)
+        self._trophies_by_agent = defaultdict(list)
+        self._trophy_types = defaultdict(int)
+        self._trophy_honour_total = 0
+        self._aggregators = {
+            'combat': self._aggregate_combat,
+            'kill': self._aggregate_kill,
+            'stamina_change': self._aggregate_stamina,
+            'action': self._aggregate_action,
+            'trophy_collected': self._aggregate_trophy
+        }
+    
+    @property
+    def statistics(self):
+        return defaultdict(int, {
+            event_type: len(rows) for event_type, rows in zip(self._type_names, self._by_type)
+        })
+    
+    @property
+    def events(self):
+        event = self._event
+        return [event(i) for i in range(len(self._type_col))]
+    
+    def _event(self, index):
+        return {
+            'timestamp': self._timestamps[index],
+            'type': self._type_names[self._type_col[index]],
+            'agent': self._agents[index],
+            'position': self._position(index),
+            'details': self._details[index] or {}
+        }
         
+    def _position(self, index):
+        x = self._pos_x[index]
+        if x == NO_POSITION:
+            return None
+        return (x, self._pos_y[index])
+    
+    def log_event(self, event_type, agent, details=None):
         if agent:
-            self.agent_stats[agent.name][event_type] += 1
+            name = agent.name
+            x = agent.x
+            y = agent.y
+            slot = self._agent_slots.get(name)
+            if slot is None:
+                slot = self._agent_slots[name] = (self.agent_stats[name], self._by_agent[name])
+            stats, agent_rows = slot
+            stats[event_type] += 1
+        else:
+            name = 'system'
+            x = y = NO_POSITION
+            agent_rows = self._by_agent[name]
+        if not details:
+            details = None
+        
+        type_id = self._type_ids.get(event_type)
+        if type_id is None:
+            type_id = self._intern_type(event_type)
+        
+        index = len(self._type_col)
+        self._timestamps.append(self.step_counter)
+        self._type_col.append(type_id)
+        self._agents.append(name)
+        self._pos_x.append(x)
+        self._pos_y.append(y)
+        self._details.append(details)
+        self._by_type[type_id].append(index)
+        agent_rows.append(index)
+        
+        aggregate = self._aggregators.get(event_type)
+        if aggregate is not None:
+            aggregate(name, details or _NO_DETAILS)
+    
+    def _intern_type(self, event_type):
+        type_id = len(self._type_names)
+        self._type_ids[event_type] = type_id
+        self._type_names.append(event_type)
+        self._by_type.append([])
+        return type_id
+    
+    def _rows_of_type(self, event_type):
+        type_id = self._type_ids.get(event_type)
+        if type_id is None:
+            return ()
+        return self._by_type[type_id]
+    
+    def _aggregate_combat(self, name, details):
+        damage = details.get('damage', 0)
+        self._combat_damage_total += damage
+        self._damage_by_agent[name].append(damage)
+    
+    def _aggregate_kill(self, name, details):
+        self._kills_by_agent[name] += 1
+    
+    def _aggregate_stamina(self, name, details):
+        change = details.get('change', 0)
+        if change < 0:
+            self._stamina_spent_total -= change
+            self._stamina_by_agent[name] -= change
+    
+    def _aggregate_action(self, name, details):
+        cost = details.get('stamina_cost', 0)
+        if cost > 0:
+            action_type = details.get('action', 'unknown')
+            self._actions_by_cost[f"{action_type}({cost})"] += 1
+    
+    def _aggregate_trophy(self, name, details):
+        self._trophies_by_agent[name].append(details or {})
+        self._trophy_types[details.get('type', 'unknown')] += 1
+        self._trophy_honour_total += details.get('honour_value', 0)
     
     def log_action(self, agent, action_result):
         details = action_result.to_dict()
         self.log_event('action', agent, details)
         
-        if action_result.combat_result:
-            self.log_combat(agent, action_result.combat_result)
+        combat_result = action_result.combat_result
+        if combat_result is not None:
+            self.log_combat(agent, combat_result, details['combat'])
         
-        if action_result.trophy_collected:
-            self.log_trophy(agent, action_result.trophy_collected)
+        trophy = action_result.trophy_collected
+        if trophy is not None:
+            self.log_trophy(agent, trophy, details['trophy'])
         
-        if action_result.stamina_cost > 0:
-            self.log_stamina_change(agent, -action_result.stamina_cost)
+        stamina_cost = details['stamina_cost']
+        if stamina_cost > 0:
+            self.log_stamina_change(agent, -stamina_cost)
     
-    def log_combat(self, agent, combat_result):
-        details = combat_result.to_dict()
+    def log_combat(self, agent, combat_result, details=None):
+        if details is None:
+            details = combat_result.to_dict()
         self.log_event('combat', agent, details)
         
         if combat_result.kill:
@@ -50,8 +210,9 @@ class EventLogger:
                 'damage': combat_result.damage_dealt
             })
     
-    def log_trophy(self, agent, trophy):
-        details = trophy.to_dict()
+    def log_trophy(self, agent, trophy, details=None):
+        if details is None:
+            details = trophy.to_dict()
         self.log_event('trophy_collected', agent, details)
     
     def log_stamina_change(self, agent, change):
@@ -81,7 +242,7 @@ class EventLogger:
     def log_clan_reaction(self, judge_agent, target_agent, reaction):
         self.log_event('clan_reaction', judge_agent, {
             'target': target_agent.name,
-            'relationship': reaction.relationship.value,
+            'relationship': reaction.relationship,
             'opinion_change': reaction.opinion_change,
             'message': reaction.message
         })
@@ -97,101 +258,71 @@ class EventLogger:
         self.step_counter += 1
     
     def get_events_by_type(self, event_type):
-        return [e for e in self.events if e['type'] == event_type]
+        event = self._event
+        return [event(i) for i in self._rows_of_type(event_type)]
     
     def get_agent_events(self, agent_name):
-        return [e for e in self.events if e['agent'] == agent_name]
+        event = self._event
+        return [event(i) for i in self._by_agent.get(agent_name, ())]
     
     def get_combat_statistics(self):
-        combats = self.get_events_by_type('combat')
-        kills = self.get_events_by_type('kill')
-        
-        stats = {
-            'total_combats': len(combats),
-            'total_kills': len(kills),
-            'average_damage': 0,
-            'kills_by_agent': defaultdict(int),
-            'damage_by_agent': defaultdict(list)
-        }
-        
-        total_damage = 0
-        for combat in combats:
-            damage = combat['details'].get('damage', 0)
-            total_damage += damage
-            agent = combat['agent']
-            stats['damage_by_agent'][agent].append(damage)
-        
-        if combats:
-            stats['average_damage'] = total_damage / len(combats)
+        combats = len(self._rows_of_type('combat'))
         
-        for kill in kills:
-            killer = kill['agent']
-            stats['kills_by_agent'][killer] += 1
-        
-        return stats
+        return {
+            'total_combats': combats,
+            'total_kills': len(self._rows_of_type('kill')),
+            'average_damage': self._combat_damage_total / combats if combats else 0,
+            'kills_by_agent': defaultdict(int, self._kills_by_agent),
+            'damage_by_agent': defaultdict(list, {
+                agent: list(damage) for agent, damage in self._damage_by_agent.items()
+            })
+        }
     
     def get_stamina_statistics(self):
-        stamina_events = self.get_events_by_type('stamina_change')
-        
-        stats = {
-            'total_stamina_spent': 0,
-            'stamina_by_agent': defaultdict(int),
-            'actions_by_cost': defaultdict(int)
+        return {
+            'total_stamina_spent': self._stamina_spent_total,
+            'stamina_by_agent': defaultdict(int, self._stamina_by_agent),
+            'actions_by_cost': defaultdict(int, self._actions_by_cost)
         }
-        
-        for event in stamina_events:
-            change = event['details']['change']
-            if change < 0:
-                stats['total_stamina_spent'] += abs(change)
-                stats['stamina_by_agent'][event['agent']] += abs(change)
-        
-        action_events = self.get_events_by_type('action')
-        for event in action_events:
-            cost = event['details'].get('stamina_cost', 0)
-            action_type = event['details'].get('action', 'unknown')
-            if cost > 0:
-                stats['actions_by_cost'][f"{action_type}({cost})"] += 1
-        
-        return stats
     
     def get_honour_progression(self, agent_name):
-        honour_events = [e for e in self.get_agent_events(agent_name) if e['type'] == 'honour_change']
-        
-        progression = []
-        current_honour = 0
-        
-        for event in honour_events:
-            current_honour += event['details']['change']
-            progression.append({
-                'timestamp': event['timestamp'],
-                'honour': current_honour,
-                'change': event['details']['change'],
-                'reason': event['details']['reason']
-            })
+        type_id = self._type_ids.get('honour_change')
+        agent_rows = self._by_agent.get(agent_name)
+        if type_id is None or not agent_rows:
+            return []
+        
+        # Filter whichever posting list is shorter; both are in log order
+        honour_rows = self._by_type[type_id]
+        if len(agent_rows) < len(honour_rows):
+            type_col = self._type_col
+            rows = [i for i in agent_rows if type_col[i] == type_id]
+        else:
+            agents = self._agents
+            rows = [i for i in honour_rows if agents[i] == agent_name]
+        
+        all_details = self._details
+        timestamps = self._timestamps
+        changes = [all_details[i]['change'] for i in rows]
         
-        return progression
+        return [
+            {
+                'timestamp': timestamps[i],
+                'honour': honour,
+                'change': change,
+                'reason': all_details[i]['reason']
+            }
+            for i, change, honour in zip(rows, changes, accumulate(changes))
+        ]
     
     def get_trophy_collection_summary(self):
-        trophy_events = self.get_events_by_type('trophy_collected')
-        
-        summary = {
-            'total_trophies': len(trophy_events),
-            'trophies_by_agent': defaultdict(list),
-            'trophy_types': defaultdict(int),
-            'total_honour_value': 0
+        return {
+            'total_trophies': len(self._rows_of_type('trophy_collected')),
+            'trophies_by_agent': defaultdict(list, {
+                agent: list(trophies) for agent, trophies in self._trophies_by_agent.items()
+            }),
+            'trophy_types': defaultdict(int, self._trophy_types),
+            'total_honour_value': self._trophy_honour_total
         }
-        
-        for event in trophy_events:
-            trophy_data = event['details']
-            agent = event['agent']
-            trophy_type = trophy_data.get('type', 'unknown')
-            honour_value = trophy_data.get('honour_value', 0)
-            
-            summary['trophies_by_agent'][agent].append(trophy_data)
-            summary['trophy_types'][trophy_type] += 1
-            summary['total_honour_value'] += honour_value
-        
-        return summary
     
     def log_item_pickup(self, agent, item):
         self.log_event('item_pickup', agent, {
@@ -222,30 +353,70 @@ class EventLogger:
         })
     
     def export_events_json(self, filename):
-        export_data = {
+        total_events = len(self._type_col)
+        header = {
             'metadata': {
                 'total_steps': self.step_counter,
-                'total_events': len(self.events),
+                'total_events': total_events,
                 'export_time': datetime.now().isoformat()
             },
             'statistics': dict(self.statistics),
-            'agent_statistics': dict(self.agent_stats),
-            'events': self.events
+            'agent_statistics': dict(self.agent_stats)
         }
         
         directory = os.path.dirname(filename)
         if directory and not os.path.exists(directory):
             os.makedirs(directory, exist_ok=True)
         
-        with open(filename, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        # Events are written one compact line each, so the full document
+        # is never built in memory
+        event = self._event
+        with open(filename, 'wb') as f:
+            write_json_stream(f, header, 'events', (
+                event(i) for i in range(total_events)
+            ), indent_items=False)
+    
+    def export_events_parquet(self, filename):
+        if not PYARROW_AVAILABLE:
+            print("[ERROR] pyarrow is not installed. Cannot export Parquet.")
+            return False
+        
+        all_details = self._details
+        columns = {
+            'timestamp': pyarrow.array(self._timestamps, type=pyarrow.int32()),
+            'type': pyarrow.DictionaryArray.from_arrays(
+                pyarrow.array(self._type_col, type=pyarrow.int32()),
+                pyarrow.array(self._type_names, type=pyarrow.string())
+            ),
+            'agent': pyarrow.array(self._agents, type=pyarrow.string()),
+            'x': pyarrow.array([None if x == NO_POSITION else x for x in self._pos_x],
+                               type=pyarrow.int16()),
+            'y': pyarrow.array([None if y == NO_POSITION else y for y in self._pos_y],
+                               type=pyarrow.int16())
+        }
+        for key in PARQUET_DETAIL_COLUMNS:
+            columns[key] = pyarrow.array([(d or _NO_DETAILS).get(key) for d in all_details])
+        columns['details'] = pyarrow.array(
+            [encode_json(d or {}).decode('utf-8') for d in all_details], type=pyarrow.string()
+        )
+        
+        directory = os.path.dirname(filename)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+        
+        pyarrow.parquet.write_table(pyarrow.table(columns), filename, compression='zstd')
+        return True
     
     def get_simulation_summary(self):
-        return {
-            'total_steps': self.step_counter,
-            'total_events': len(self.events),
-            'event_breakdown': dict(self.statistics),
-            'combat_stats': self.get_combat_statistics(),
-            'stamina_stats': self.get_stamina_statistics(),
-            'trophy_summary': self.get_trophy_collection_summary()
-        }
\ No newline at end of file
+        key = (self.step_counter, len(self._type_col))
+        if key != self._summary_key:
+            self._summary_cache = {
+                'total_steps': self.step_counter,
+                'total_events': key[1],
+                'event_breakdown': dict(self.statistics),
+                'combat_stats': self.get_combat_statistics(),
+                'stamina_stats': self.get_stamina_statistics(),
+                'trophy_summary': self.get_trophy_collection_summary()
+            }
+            self._summary_key = key
+        return copy.deepcopy(self._summary_cache)
\ No newline at end of file
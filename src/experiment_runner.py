@@ -10,7 +10,8 @@ import sys
 import os
 import time
 import random
-from typing import Dict, List, Any, Optional, Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Any, Iterator, Optional, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -27,6 +28,19 @@ from metrics import MetricsCollector, SimulationMetrics, AgentMetrics
 from data_collector import DataCollector, ExperimentLogger
 
 
+# Per-axis step choices for random movement
+STEP_DELTAS = (-1, 0, 1)
+
+# Class names each attacking class may target
+TEAM_CLASS_NAMES = frozenset({'Dek', 'Thia', 'PredatorFather', 'PredatorBrother'})
+HOSTILE_CLASS_NAMES = frozenset({'BossAdversary', 'WildlifeAgent'})
+TARGET_CLASS_NAMES = {
+    **dict.fromkeys(TEAM_CLASS_NAMES, HOSTILE_CLASS_NAMES),
+    'BossAdversary': TEAM_CLASS_NAMES,
+    'WildlifeAgent': frozenset({'Dek', 'Thia'}),
+}
+
+
 class DifficultyLevel(Enum):
     """Difficulty levels for experiments."""
     EASY = "easy"
@@ -151,20 +165,28 @@ class HeadlessSimulation:
     automated data collection.
     """
     
-    def __init__(self, config: ExperimentConfig, metrics_collector: MetricsCollector):
+    def __init__(
+        self,
+        config: ExperimentConfig,
+        metrics_collector: MetricsCollector,
+        rng: Optional[random.Random] = None
+    ):
         """
         Initialize headless simulation.
         
         Args:
             config: Experiment configuration
             metrics_collector: Metrics collector instance
+            rng: Random generator shared by the grid and every agent
+                 (defaults to the global random module)
         """
         self.config = config
         self.metrics = metrics_collector
+        self.rng = rng or random
         
         # Initialize grid
         self.grid = Grid(config.grid_size[0], config.grid_size[1])
-        self.grid.generate_terrain()
+        self.grid.generate_terrain(rng=self.rng)
         
         # Initialize agents
         self.agents: List[Any] = []
@@ -216,6 +238,7 @@ class HeadlessSimulation:
         # Place all agents on grid
         for agent in self.agents:
             agent.set_grid(self.grid)
+            agent.set_rng(self.rng)
             self.grid.place_agent(agent, agent.x, agent.y)
             
         # Register agents with metrics
@@ -297,28 +320,16 @@ class HeadlessSimulation:
             
     def _get_nearby_targets(self, agent: Any) -> List[Any]:
         """Get valid targets for an agent."""
-        targets = []
-        agent_class = agent.__class__.__name__
-        
-        for other in self.agents:
-            if other == agent or not other.is_alive:
-                continue
-                
-            # Define targeting logic
-            if agent_class in ['Dek', 'Thia', 'PredatorFather', 'PredatorBrother']:
-                # Team targets boss and wildlife
-                if other.__class__.__name__ in ['BossAdversary', 'WildlifeAgent']:
-                    targets.append(other)
-            elif agent_class == 'BossAdversary':
-                # Boss targets heroes
-                if other.__class__.__name__ in ['Dek', 'Thia', 'PredatorFather', 'PredatorBrother']:
-                    targets.append(other)
-            elif agent_class == 'WildlifeAgent':
-                # Wildlife targets randomly
-                if other.__class__.__name__ in ['Dek', 'Thia']:
-                    targets.append(other)
-                    
-        return targets
+        # Team targets boss and wildlife, boss targets heroes,
+        # wildlife targets Dek and Thia
+        wanted = TARGET_CLASS_NAMES.get(type(agent).__name__)
+        if not wanted:
+            return []
+        
+        return [
+            other for other in self.agents
+            if other is not agent and other.is_alive and type(other).__name__ in wanted
+        ]
         
     def _distance(self, a: Any, b: Any) -> float:
         """Calculate distance between two agents."""
@@ -326,8 +337,8 @@ class HeadlessSimulation:
         
     def _random_move(self, agent: Any) -> None:
         """Move agent in a random direction."""
-        dx = random.choice([-1, 0, 1])
-        dy = random.choice([-1, 0, 1])
+        dx = self.rng.choice(STEP_DELTAS)
+        dy = self.rng.choice(STEP_DELTAS)
         
         new_x = max(0, min(self.config.grid_size[0] - 1, agent.x + dx))
         new_y = max(0, min(self.config.grid_size[1] - 1, agent.y + dy))
@@ -434,6 +445,38 @@ class HeadlessSimulation:
             self.reason = 'Team eliminated'
 
 
+def _run_seed(config: ExperimentConfig, run_id: int) -> Optional[int]:
+    """Return the reproducible seed for a run, or None when unseeded."""
+    if config.random_seed is None:
+        return None
+    return config.random_seed + run_id
+
+
+def _run_single(config: ExperimentConfig, run_id: int, seed: Optional[int]) -> tuple:
+    """
+    Run one headless simulation in isolation.
+    
+    Kept at module level so it can be pickled and shipped to worker
+    processes by ExperimentRunner.run_all_experiments(parallel=True).
+    
+    Args:
+        config: Configuration to run
+        run_id: 1-based run index within the configuration
+        seed: Seed for the run's private random generator, or None
+              to seed it from the OS
+        
+    Returns:
+        Tuple of (run_id, outcome, SimulationMetrics)
+    """
+    metrics_collector = MetricsCollector()
+    metrics_collector.start_simulation(run_id, config.name)
+    
+    sim = HeadlessSimulation(config, metrics_collector, random.Random(seed))
+    outcome = sim.run()
+    
+    return run_id, outcome, metrics_collector.end_simulation()
+
+
 class ExperimentRunner:
     """
     Main experiment runner for automated simulations.
@@ -500,25 +543,12 @@ class ExperimentRunner:
         self.logger.experiment_start(config.name, config.num_runs)
         start_time = time.time()
         
-        metrics_collector = MetricsCollector()
         results = []
         
         for run_id in range(1, config.num_runs + 1):
-            # Set random seed if specified
-            if config.random_seed is not None:
-                random.seed(config.random_seed + run_id)
-                
             self.logger.run_start(run_id, config.num_runs)
             
-            # Start metrics collection
-            metrics_collector.start_simulation(run_id, config.name)
-            
-            # Run headless simulation
-            sim = HeadlessSimulation(config, metrics_collector)
-            outcome = sim.run()
-            
-            # End metrics collection
-            run_metrics = metrics_collector.end_simulation()
+            _, outcome, run_metrics = _run_single(config, run_id, _run_seed(config, run_id))
             results.append(run_metrics)
             
             self.logger.run_complete(run_id, run_metrics.total_steps, outcome)
@@ -538,10 +568,18 @@ class ExperimentRunner:
         
         return results
         
-    def run_all_experiments(self) -> Dict[str, List[SimulationMetrics]]:
+    def run_all_experiments(
+        self,
+        parallel: bool = False,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, List[SimulationMetrics]]:
         """
         Run all configured experiments.
         
+        Args:
+            parallel: Fan runs out to worker processes instead of running serially
+            max_workers: Worker process count (defaults to os.cpu_count())
+        
         Returns:
             Dictionary mapping config names to their results
         """
@@ -552,17 +590,114 @@ class ExperimentRunner:
         self.logger.info(f"Starting {len(self.configs)} experiments...")
         total_start = time.time()
         
-        for config in self.configs:
-            results = self.run_experiment(config)
-            self.results[config.name] = results
+        if parallel:
+            self.results.update(self.run_experiments_parallel(max_workers))
+        else:
+            for config in self.configs:
+                results = self.run_experiment(config)
+                self.results[config.name] = results
             
         total_duration = time.time() - total_start
         total_runs = sum(len(r) for r in self.results.values())
         
         self.logger.success(f"All experiments complete: {total_runs} runs in {total_duration:.1f}s")
+        self.logger.flush()
         
         return self.results
         
+    def run_experiments_parallel(
+        self,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, List[SimulationMetrics]]:
+        """
+        Run every configured run across a pool of worker processes.
+        
+        Each run is an independent simulation, so runs are submitted
+        individually and gathered back into per-config lists ordered
+        by run_id. Every run owns a private random.Random, so forked
+        workers never share RNG state.
+        
+        Args:
+            max_workers: Worker process count (defaults to os.cpu_count())
+            
+        Returns:
+            Dictionary mapping config names to their results
+        """
+        collected: Dict[str, Dict[int, SimulationMetrics]] = {
+            config.name: {} for config in self.configs
+        }
+        
+        for config, run_id, run_metrics in self.iter_runs_parallel(max_workers):
+            collected[config.name][run_id] = run_metrics
+            
+        return {
+            name: [runs[run_id] for run_id in sorted(runs)]
+            for name, runs in collected.items()
+        }
+        
+    def iter_runs_parallel(
+        self,
+        max_workers: Optional[int] = None
+    ) -> Iterator[Tuple[ExperimentConfig, int, SimulationMetrics]]:
+        """
+        Yield every configured run as soon as a worker process finishes it.
+        
+        Runs arrive in completion order, so callers can stream them
+        straight into an export such as
+        DataCollector.save_simulation_results_csv without holding the
+        whole experiment in memory.
+        
+        Every run is queued up front, so no run_start lines are logged;
+        run_complete lines carry the config name because runs from
+        different configs finish interleaved.
+        
+        Args:
+            max_workers: Worker process count (defaults to os.cpu_count())
+            
+        Yields:
+            Tuples of (config, run_id, SimulationMetrics)
+        """
+        jobs = []
+        for config in self.configs:
+            for run_id in range(1, config.num_runs + 1):
+                jobs.append((config, run_id, _run_seed(config, run_id)))
+                
+        total_runs = len(jobs)
+        remaining = {config.name: config.num_runs for config in self.configs}
+        
+        start_time = time.time()
+        for config in self.configs:
+            self.logger.experiment_start(config.name, config.num_runs)
+            if not config.num_runs:
+                self.logger.experiment_complete(config.name, 0.0)
+        
+        # Forked workers must not inherit unwritten log lines
+        self.logger.flush()
+        
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            futures = {
+                executor.submit(_run_single, config, run_id, seed): config
+                for config, run_id, seed in jobs
+            }
+            
+            for completed, future in enumerate(as_completed(futures), start=1):
+                config = futures[future]
+                run_id, outcome, run_metrics = future.result()
+                
+                self.logger.run_complete(
+                    run_id, run_metrics.total_steps, outcome, config_name=config.name
+                )
+                
+                # A config is complete once its last run comes back
+                remaining[config.name] -= 1
+                if not remaining[config.name]:
+                    self.logger.experiment_complete(config.name, time.time() - start_time)
+                
+                if self.progress_callback:
+                    self.progress_callback(completed, total_runs, f"{config.name} run {run_id}")
+                    
+                yield config, run_id, run_metrics
+        
     def save_results(self) -> Dict[str, str]:
         """
         Save all results to CSV and JSON files.
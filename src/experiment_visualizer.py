@@ -16,7 +16,7 @@ import statistics
 # Try to import matplotlib
 try:
     import matplotlib
-    matplotlib.use('Agg')  # Use non-interactive backend for saving
+    matplotlib.use('Agg', force=True)  # Use non-interactive backend for saving
     import matplotlib.pyplot as plt
     import matplotlib.patches as mpatches
     from matplotlib.ticker import MaxNLocator
@@ -118,6 +118,32 @@ class ExperimentVisualizer:
             return False
         return True
         
+    def _save_figure(self, fig: "plt.Figure", key: str, filename: str, label: str) -> str:
+        """
+        Save a finished figure and release it from pyplot.
+        
+        Closing right after saving keeps pyplot's figure registry from
+        growing across plots, so repeated report generation does not
+        accumulate open canvases.
+        
+        Args:
+            fig: Figure to save
+            key: Key under which the figure is recorded in self.figures
+            filename: Output filename inside the plots directory
+            label: Human-readable plot name for the log line
+            
+        Returns:
+            Path to the saved file
+        """
+        filepath = self.output_dir / filename
+        fig.savefig(filepath, dpi=150, bbox_inches='tight')
+        plt.close(fig)
+        self.figures[key] = fig
+        self.saved_files.append(str(filepath))
+        
+        print(f"[Visualizer] Saved {label} plot: {filepath}")
+        return str(filepath)
+        
     def plot_win_rates(
         self, 
         results_by_config: Dict[str, List[SimulationMetrics]],
@@ -170,13 +196,7 @@ class ExperimentVisualizer:
         
         plt.tight_layout()
         
-        filepath = self.output_dir / filename
-        fig.savefig(filepath, dpi=150, bbox_inches='tight')
-        self.figures['win_rates'] = fig
-        self.saved_files.append(str(filepath))
-        
-        print(f"[Visualizer] Saved win rates plot: {filepath}")
-        return str(filepath)
+        return self._save_figure(fig, 'win_rates', filename, "win rates")
         
     def plot_survival_distribution(
         self,
@@ -232,13 +252,7 @@ class ExperimentVisualizer:
         
         plt.tight_layout()
         
-        filepath = self.output_dir / filename
-        fig.savefig(filepath, dpi=150, bbox_inches='tight')
-        self.figures['survival_distribution'] = fig
-        self.saved_files.append(str(filepath))
-        
-        print(f"[Visualizer] Saved survival distribution plot: {filepath}")
-        return str(filepath)
+        return self._save_figure(fig, 'survival_distribution', filename, "survival distribution")
         
     def plot_honour_progression(
         self,
@@ -297,13 +311,7 @@ class ExperimentVisualizer:
         
         plt.tight_layout()
         
-        filepath = self.output_dir / filename
-        fig.savefig(filepath, dpi=150, bbox_inches='tight')
-        self.figures['honour_progression'] = fig
-        self.saved_files.append(str(filepath))
-        
-        print(f"[Visualizer] Saved honour progression plot: {filepath}")
-        return str(filepath)
+        return self._save_figure(fig, 'honour_progression', filename, "honour progression")
         
     def plot_average_honour_by_config(
         self,
@@ -366,13 +374,7 @@ class ExperimentVisualizer:
         
         plt.tight_layout()
         
-        filepath = self.output_dir / filename
-        fig.savefig(filepath, dpi=150, bbox_inches='tight')
-        self.figures['average_honour'] = fig
-        self.saved_files.append(str(filepath))
-        
-        print(f"[Visualizer] Saved average honour plot: {filepath}")
-        return str(filepath)
+        return self._save_figure(fig, 'average_honour', filename, "average honour")
         
     def plot_resource_efficiency(
         self,
@@ -427,13 +429,7 @@ class ExperimentVisualizer:
         
         plt.tight_layout()
         
-        filepath = self.output_dir / filename
-        fig.savefig(filepath, dpi=150, bbox_inches='tight')
-        self.figures['resource_efficiency'] = fig
-        self.saved_files.append(str(filepath))
-        
-        print(f"[Visualizer] Saved resource efficiency plot: {filepath}")
-        return str(filepath)
+        return self._save_figure(fig, 'resource_efficiency', filename, "resource efficiency")
         
     def plot_combat_statistics(
         self,
@@ -504,13 +500,7 @@ class ExperimentVisualizer:
         plt.suptitle('Combat Statistics by Configuration', fontweight='bold', fontsize=16, y=1.02)
         plt.tight_layout()
         
-        filepath = self.output_dir / filename
-        fig.savefig(filepath, dpi=150, bbox_inches='tight')
-        self.figures['combat_statistics'] = fig
-        self.saved_files.append(str(filepath))
-        
-        print(f"[Visualizer] Saved combat statistics plot: {filepath}")
-        return str(filepath)
+        return self._save_figure(fig, 'combat_statistics', filename, "combat statistics")
         
     def plot_team_survival_rates(
         self,
@@ -563,13 +553,7 @@ class ExperimentVisualizer:
         
         plt.tight_layout()
         
-        filepath = self.output_dir / filename
-        fig.savefig(filepath, dpi=150, bbox_inches='tight')
-        self.figures['team_survival'] = fig
-        self.saved_files.append(str(filepath))
-        
-        print(f"[Visualizer] Saved team survival plot: {filepath}")
-        return str(filepath)
+        return self._save_figure(fig, 'team_survival', filename, "team survival")
         
     def plot_comprehensive_summary(
         self,
@@ -651,13 +635,7 @@ class ExperimentVisualizer:
                     fontweight='bold', fontsize=18, y=1.02)
         plt.tight_layout()
         
-        filepath = self.output_dir / filename
-        fig.savefig(filepath, dpi=150, bbox_inches='tight')
-        self.figures['comprehensive_summary'] = fig
-        self.saved_files.append(str(filepath))
-        
-        print(f"[Visualizer] Saved comprehensive summary plot: {filepath}")
-        return str(filepath)
+        return self._save_figure(fig, 'comprehensive_summary', filename, "comprehensive summary")
         
     def plot_agent_performance_comparison(
         self,
@@ -727,13 +705,7 @@ class ExperimentVisualizer:
         plt.suptitle('Agent Performance Comparison', fontweight='bold', fontsize=16, y=1.02)
         plt.tight_layout()
         
-        filepath = self.output_dir / filename
-        fig.savefig(filepath, dpi=150, bbox_inches='tight')
-        self.figures['agent_performance'] = fig
-        self.saved_files.append(str(filepath))
-        
-        print(f"[Visualizer] Saved agent performance plot: {filepath}")
-        return str(filepath)
+        return self._save_figure(fig, 'agent_performance', filename, "agent performance")
         
     def generate_all_plots(
         self,
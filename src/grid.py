@@ -3,6 +3,9 @@ from cell import Cell
 from terrain import TerrainType
 
 
+AGENT_BUCKET_SIZE = 4
+
+
 class Grid:
     
     def __init__(self, width=20, height=20):
@@ -10,6 +13,9 @@ class Grid:
         self.height = height
         self.cells = self._create_grid()
         self.teleport_pairs = []
+        self.agent_positions = {}
+        self._agent_buckets = {}
+        self.occupancy_version = 0
     
     def _create_grid(self):
         grid = []
@@ -26,8 +32,7 @@ class Grid:
         return (wrapped_x, wrapped_y)
     
     def get_cell(self, x, y):
-        wrapped_x, wrapped_y = self.wrap_coordinates(x, y)
-        return self.cells[wrapped_y][wrapped_x]
+        return self.cells[y % self.height][x % self.width]
     
     def set_terrain(self, x, y, terrain_type):
         cell = self.get_cell(x, y)
@@ -89,17 +94,18 @@ class Grid:
         if cell and cell.place_occupant(agent):
             agent.x = cell.x
             agent.y = cell.y
+            self._index_agent(agent, cell.x, cell.y)
             return True
         return False
     
     def move_agent(self, agent, new_x, new_y):
-        old_cell = self.get_cell(agent.x, agent.y)
         new_x, new_y = self.wrap_coordinates(new_x, new_y)
-        new_cell = self.get_cell(new_x, new_y)
+        new_cell = self.cells[new_y][new_x]
         
-        if new_cell.is_occupied:
-            return False
+        if new_cell.occupant is not None:
+            return None
         
+        old_cell = self.get_cell(agent.x, agent.y)
         old_cell.remove_occupant()
         new_cell.place_occupant(agent)
         agent.x = new_x
@@ -114,17 +120,89 @@ class Grid:
                     dest_cell.place_occupant(agent)
                     agent.x = dest_x
                     agent.y = dest_y
+                    self._index_agent(agent, dest_cell.x, dest_cell.y)
+                    return dest_cell
         
-        return True
+        self._index_agent(agent, new_x, new_y)
+        return new_cell
+    
+    def _index_agent(self, agent, x, y):
+        self._unindex_agent(agent)
+        self.occupancy_version += 1
+        self.agent_positions[agent] = (x, y)
+        key = (x // AGENT_BUCKET_SIZE, y // AGENT_BUCKET_SIZE)
+        bucket = self._agent_buckets.get(key)
+        if bucket is None:
+            self._agent_buckets[key] = bucket = {}
+        bucket[agent] = None
+    
+    def _unindex_agent(self, agent):
+        position = self.agent_positions.pop(agent, None)
+        if position is None:
+            return
+        key = (position[0] // AGENT_BUCKET_SIZE, position[1] // AGENT_BUCKET_SIZE)
+        bucket = self._agent_buckets[key]
+        del bucket[agent]
+        if not bucket:
+            del self._agent_buckets[key]
     
     def calculate_distance(self, x1, y1, x2, y2):
         dx = abs(x2 - x1)
         dy = abs(y2 - y1)
         
-        dx = min(dx, self.width - dx)
-        dy = min(dy, self.height - dy)
+        if dx > self.width - dx:
+            dx = self.width - dx
+        if dy > self.height - dy:
+            dy = self.height - dy
         
-        return max(dx, dy)
+        return dx if dx > dy else dy
+    
+    def distances_from(self, x, y, agents):
+        width, height = self.width, self.height
+        distances = []
+        for other in agents:
+            dx = abs(other.x - x)
+            dy = abs(other.y - y)
+            if dx > width - dx:
+                dx = width - dx
+            if dy > height - dy:
+                dy = height - dy
+            distances.append(dx if dx > dy else dy)
+        return distances
+    
+    def nearest_agent(self, x, y, agents):
+        width, height = self.width, self.height
+        nearest = None
+        best = None
+        for other in agents:
+            dx = abs(other.x - x)
+            dy = abs(other.y - y)
+            if dx > width - dx:
+                dx = width - dx
+            if dy > height - dy:
+                dy = height - dy
+            distance = dx if dx > dy else dy
+            if best is None or distance < best:
+                best = distance
+                nearest = other
+        return nearest, best
+    
+    def best_move(self, moves, target_x, target_y, farthest=False):
+        width, height = self.width, self.height
+        best = None
+        best_distance = -1 if farthest else float('inf')
+        for move in moves:
+            dx = abs(move[0] - target_x)
+            dy = abs(move[1] - target_y)
+            if dx > width - dx:
+                dx = width - dx
+            if dy > height - dy:
+                dy = height - dy
+            distance = dx if dx > dy else dy
+            if (distance > best_distance) if farthest else (distance < best_distance):
+                best_distance = distance
+                best = move
+        return best
     
     def get_cells_in_radius(self, center_x, center_y, radius):
         cells_in_range = []
@@ -137,7 +215,38 @@ class Grid:
                     cells_in_range.append(self.get_cell(x, y))
         return cells_in_range
     
-    def generate_terrain(self, terrain_distribution=None):
+    def get_agents_in_radius(self, center_x, center_y, radius):
+        if not self.agent_positions:
+            return []
+        
+        width, height = self.width, self.height
+        center_x %= width
+        center_y %= height
+        span = range(-radius, radius + 1)
+        bucket_columns = {((center_x + d) % width) // AGENT_BUCKET_SIZE for d in span}
+        bucket_rows = {((center_y + d) % height) // AGENT_BUCKET_SIZE for d in span}
+        buckets = self._agent_buckets
+        positions = self.agent_positions
+        
+        found = []
+        for bucket_y in bucket_rows:
+            for bucket_x in bucket_columns:
+                bucket = buckets.get((bucket_x, bucket_y))
+                if not bucket:
+                    continue
+                for agent in bucket:
+                    x, y = positions[agent]
+                    if x == center_x and y == center_y:
+                        continue
+                    offset_x = (x - center_x + radius) % width - radius
+                    offset_y = (y - center_y + radius) % height - radius
+                    if offset_x <= radius and offset_y <= radius:
+                        found.append((offset_y, offset_x, agent))
+        
+        found.sort(key=lambda entry: (entry[0], entry[1]))
+        return [agent for _, _, agent in found]
+    
+    def generate_terrain(self, terrain_distribution=None, rng=random):
         if terrain_distribution is None:
             terrain_distribution = {
                 TerrainType.EMPTY: 0.50,
@@ -154,7 +263,7 @@ class Grid:
         
         for row in self.cells:
             for cell in row:
-                chosen_terrain = random.choices(terrain_types, weights=weights, k=1)[0]
+                chosen_terrain = rng.choices(terrain_types, weights=weights, k=1)[0]
                 cell.terrain.terrain_type = chosen_terrain
     
     def create_teleport_pair(self, x1, y1, x2, y2):
@@ -178,6 +287,9 @@ class Grid:
         return occupied
     
     def clear_all_occupants(self):
+        self.agent_positions.clear()
+        self._agent_buckets.clear()
+        self.occupancy_version += 1
         for row in self.cells:
             for cell in row:
                 cell.occupant = None
@@ -204,13 +204,12 @@ class SyntheticInteractionManager:
             return []
         
         recipients = []
-        nearby_cells = broadcaster.grid.get_cells_in_radius(
+        nearby_agents = broadcaster.grid.get_agents_in_radius(
             broadcaster.x, broadcaster.y, max_range
         )
         
-        for cell in nearby_cells:
-            if cell.occupant and cell.occupant != broadcaster:
-                target = cell.occupant
+        for target in nearby_agents:
+            if target is not broadcaster:
                 if hasattr(target, 'add_knowledge'):
                     result = self.initiate_interaction(
                         broadcaster, target, 
@@ -0,0 +1,85 @@
+"""
+JSON Streaming Module for Predator: Badlands
+============================================
+Shared JSON encoding for the event log and experiment exports.
+Large documents are written one list item at a time so the full
+document never has to be built in memory.
+
+"""
+
+import json
+from typing import Any, BinaryIO, Iterable, Mapping
+
+# orjson is optional; fall back to the stdlib encoder when missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def encode_json(value: Any, indent: bool = False) -> bytes:
+    """
+    Encode a value as JSON bytes.
+
+    Args:
+        value: JSON-serializable value; non-string dict keys are
+            converted to strings as the stdlib encoder does
+        indent: Use two-space indentation instead of compact output
+
+    Returns:
+        Encoded JSON without a trailing newline
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(value, option=option)
+    if indent:
+        return json.dumps(value, indent=2).encode('utf-8')
+    return json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+
+def write_json_stream(
+    f: BinaryIO,
+    header: Mapping[str, Any],
+    list_key: str,
+    items: Iterable[Any],
+    indent_items: bool = True
+) -> None:
+    """
+    Write a two-space indented JSON object whose last key holds a list.
+
+    The header keys are written first, then each list item is encoded
+    and written as it is produced.
+
+    Args:
+        f: File opened in binary write mode
+        header: Keys written before the list, in order
+        list_key: Key of the streamed list
+        items: Values of the list, in order
+        indent_items: Indent each item like json.dump(indent=2) would;
+            when False each item is written compactly on one line
+    """
+    f.write(b'{')
+    for key, value in header.items():
+        f.write(b'\n  ')
+        f.write(encode_json(key))
+        f.write(b': ')
+        f.write(encode_json(value, indent=True).replace(b'\n', b'\n  '))
+        f.write(b',')
+
+    f.write(b'\n  ')
+    f.write(encode_json(list_key))
+    f.write(b': [')
+
+    wrote_items = False
+    for item in items:
+        f.write(b',\n    ' if wrote_items else b'\n    ')
+        if indent_items:
+            f.write(encode_json(item, indent=True).replace(b'\n', b'\n    '))
+        else:
+            f.write(encode_json(item))
+        wrote_items = True
+
+    f.write(b'\n  ]\n}\n' if wrote_items else b']\n}\n')
@@ -6,6 +6,9 @@ import math
 import json
 
 
+NEIGHBOUR_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
 class StateType(Enum):
     HEALTH = "health"
     DISTANCE = "distance"
@@ -669,6 +672,20 @@ class AdaptiveBossAI:
         
         return action
     
+    def _nearest_to_boss(self, enemies: List) -> Tuple:
+        bx = self.boss.x
+        by = self.boss.y
+        nearest = None
+        best = None
+        for enemy in enemies:
+            dx = enemy.x - bx
+            dy = enemy.y - by
+            distance_sq = dx * dx + dy * dy
+            if best is None or distance_sq < best:
+                best = distance_sq
+                nearest = enemy
+        return nearest, best
+    
     def _aggressive_behavior(self, enemies: List) -> Dict:
         if not enemies:
             return {'type': 'patrol', 'target': None}
@@ -697,8 +714,8 @@ class AdaptiveBossAI:
         if not enemies:
             return {'type': 'regenerate', 'target': None}
         
-        nearest = min(enemies, key=lambda e: math.sqrt((e.x - self.boss.x)**2 + (e.y - self.boss.y)**2))
-        distance = math.sqrt((nearest.x - self.boss.x)**2 + (nearest.y - self.boss.y)**2)
+        nearest, distance_sq = self._nearest_to_boss(enemies)
+        distance = math.sqrt(distance_sq)
         
         if distance <= 1.5:
             return {'type': 'attack', 'target': nearest}
@@ -723,8 +740,8 @@ class AdaptiveBossAI:
                     intruders.append(enemy)
         
         if intruders:
-            target = min(intruders, key=lambda e: math.sqrt((e.x - self.boss.x)**2 + (e.y - self.boss.y)**2))
-            distance = math.sqrt((target.x - self.boss.x)**2 + (target.y - self.boss.y)**2)
+            target, distance_sq = self._nearest_to_boss(intruders)
+            distance = math.sqrt(distance_sq)
             
             if distance <= self.boss.attack_range:
                 return {'type': 'attack', 'target': target}
@@ -758,8 +775,8 @@ class AdaptiveBossAI:
         if not enemies:
             return {'type': 'hide', 'target': None}
         
-        nearest = min(enemies, key=lambda e: math.sqrt((e.x - self.boss.x)**2 + (e.y - self.boss.y)**2))
-        distance = math.sqrt((nearest.x - self.boss.x)**2 + (nearest.y - self.boss.y)**2)
+        nearest, distance_sq = self._nearest_to_boss(enemies)
+        distance = math.sqrt(distance_sq)
         
         if distance <= 2:
             return {'type': 'ambush_attack', 'target': nearest, 'damage_bonus': 1.5}
@@ -846,22 +863,23 @@ class AdaptiveBossAI:
         if not grid:
             return
         
+        wrap = grid.wrap_coordinates
+        target_x = target.x if hasattr(target, 'x') else target[0]
+        target_y = target.y if hasattr(target, 'y') else target[1]
+        
         for _ in range(speed):
             best_move = None
-            best_distance = float('inf')
+            best_d2 = float('inf')
+            bx, by = self.boss.x, self.boss.y
             
-            target_x = target.x if hasattr(target, 'x') else target[0]
-            target_y = target.y if hasattr(target, 'y') else target[1]
-            
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    if dx == 0 and dy == 0:
-                        continue
-                    new_x, new_y = grid.wrap_coordinates(self.boss.x + dx, self.boss.y + dy)
-                    dist = math.sqrt((new_x - target_x)**2 + (new_y - target_y)**2)
-                    if dist < best_distance:
-                        best_distance = dist
-                        best_move = (new_x, new_y)
+            for dx, dy in NEIGHBOUR_OFFSETS:
+                new_x, new_y = wrap(bx + dx, by + dy)
+                ddx = new_x - target_x
+                ddy = new_y - target_y
+                d2 = ddx * ddx + ddy * ddy
+                if d2 < best_d2:
+                    best_d2 = d2
+                    best_move = (new_x, new_y)
             
             if best_move:
                 self.boss.move_to(best_move[0], best_move[1])
@@ -873,18 +891,18 @@ class AdaptiveBossAI:
         if not grid:
             return
         
+        wrap = grid.wrap_coordinates
+        bx, by = self.boss.x, self.boss.y
+        center_x, center_y = self.boss.territory_center
+        radius_sq = self.boss.territory_radius ** 2
+        
         valid_moves = []
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                new_x, new_y = grid.wrap_coordinates(self.boss.x + dx, self.boss.y + dy)
-                dist_to_center = math.sqrt(
-                    (new_x - self.boss.territory_center[0])**2 + 
-                    (new_y - self.boss.territory_center[1])**2
-                )
-                if dist_to_center <= self.boss.territory_radius:
-                    valid_moves.append((new_x, new_y))
+        for dx, dy in NEIGHBOUR_OFFSETS:
+            new_x, new_y = wrap(bx + dx, by + dy)
+            ddx = new_x - center_x
+            ddy = new_y - center_y
+            if ddx * ddx + ddy * ddy <= radius_sq:
+                valid_moves.append((new_x, new_y))
         
         if valid_moves:
             target = random.choice(valid_moves)
@@ -470,6 +470,7 @@ class SimulationEngine:
     
     def _initialize_phase9_systems(self):
         self.coordination = self.CoordinationProtocol()
+        self.coordination.set_rng(self.dek.rng)
         self.coordination.initialize(self.dek, self.thia)
         
         self.learning = self.LearningSystem()
@@ -509,7 +510,7 @@ class SimulationEngine:
         enemies = []
         for agent in self.agents:
             if agent.is_alive and agent != self.dek and agent != self.thia:
-                if hasattr(agent, 'aggression_level') or hasattr(agent, 'phase'):
+                if agent.is_creature:
                     enemies.append(agent)
         return enemies
     
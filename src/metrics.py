@@ -8,6 +8,7 @@ Author: Predator Badlands Team
 Phase: 10 - Experiments & Data Collection
 """
 
+from array import array
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 from enum import Enum
@@ -15,6 +16,15 @@ import time
 import statistics
 
 
+# Typecode for per-step honour values: unboxed 64-bit C ints, since honour
+# is always awarded in whole points (record_honour rejects anything else)
+HONOUR_HISTORY_TYPECODE = 'q'
+
+
+def _new_honour_history() -> array:
+    return array(HONOUR_HISTORY_TYPECODE)
+
+
 class MetricType(Enum):
     """Types of metrics that can be collected."""
     SURVIVAL_TIME = "survival_time"
@@ -35,7 +45,7 @@ class AgentMetrics:
         agent_id: Unique identifier for the agent
         agent_type: Type of agent (predator, prey, etc.)
         survival_time: How long the agent survived (in steps)
-        honour_history: List of honour values over time
+        honour_history: Packed array of honour values over time
         kills: Number of kills made
         deaths: Number of deaths
         resources_collected: Total resources gathered
@@ -48,7 +58,7 @@ class AgentMetrics:
     agent_id: str
     agent_type: str
     survival_time: int = 0
-    honour_history: List[float] = field(default_factory=list)
+    honour_history: array = field(default_factory=_new_honour_history)
     kills: int = 0
     deaths: int = 0
     resources_collected: int = 0
@@ -231,14 +241,18 @@ class MetricsCollector:
         if self.current_run:
             self.current_run.total_steps = step
             
-    def record_honour(self, agent_id: str, honour: float, step: int = None) -> None:
+    def record_honour(self, agent_id: str, honour: int, step: int = None) -> None:
         """
         Record an agent's honour value.
         
         Args:
             agent_id: The agent's identifier
-            honour: Current honour value
+            honour: Current honour value; must be a whole number, though
+                integral floats such as 100.0 are accepted
             step: Optional step number (uses current step if not provided)
+            
+        Raises:
+            ValueError: If honour has a fractional part
         """
         if self.current_run is None:
             return
@@ -246,8 +260,12 @@ class MetricsCollector:
         if agent_id not in self.current_run.agent_metrics:
             return
             
+        whole = int(honour)
+        if whole != honour:
+            raise ValueError(f"Honour must be a whole number, got {honour!r}")
+            
         metrics = self.current_run.agent_metrics[agent_id]
-        metrics.honour_history.append(honour)
+        metrics.honour_history.append(whole)
         metrics.final_honour = honour
         
     def record_combat(self, agent_id: str, opponent_id: str, won: bool) -> None:
@@ -1,9 +1,10 @@
 from agent import Agent
-import random
 
 
 class PredatorAgent(Agent):
     
+    is_wildlife_threat = True
+    
     def __init__(self, name, x=0, y=0, max_health=150, max_stamina=120):
         super().__init__(name, x, y, max_health, max_stamina)
         self.honour = 0
@@ -52,12 +53,10 @@ class PredatorAgent(Agent):
         if not self.grid:
             return None
         
-        nearby_cells = self.grid.get_cells_in_radius(self.x, self.y, 8)
         prey_targets = []
         
-        for cell in nearby_cells:
-            if cell.occupant and cell.occupant != self:
-                occupant = cell.occupant
+        for occupant in self.grid.get_agents_in_radius(self.x, self.y, 8):
+            if occupant is not self:
                 # Include wildlife, boss, and any aggressive enemies
                 if hasattr(occupant, 'is_prey') and occupant.is_prey:
                     prey_targets.append(occupant)
@@ -84,7 +83,7 @@ class PredatorAgent(Agent):
     def patrol_movement(self):
         valid_moves = self.get_valid_moves()
         if valid_moves:
-            target_x, target_y = random.choice(valid_moves)
+            target_x, target_y = self.rng.choice(valid_moves)
             return self.move_to(target_x, target_y)
         return False
     
@@ -106,8 +105,8 @@ class PredatorAgent(Agent):
     def hunt_behavior(self):
         prey = self.hunt_nearby_prey()
         if prey:
-            target = min(prey, key=lambda p: self.distance_to(p))
-            if self.distance_to(target) == 1:
+            target, distance = self.nearest_agent(prey)
+            if distance == 1:
                 self.attack_target(target)
             else:
                 self.move_towards(target)
@@ -127,7 +126,7 @@ class PredatorAgent(Agent):
     
     def attack_target(self, target):
         if self.distance_to(target) == 1:
-            damage = random.randint(35, 55)
+            damage = self.roll(35, 55)
             target.take_damage(damage)
             # Track damage for stats
             if hasattr(self, 'total_damage_dealt'):
@@ -141,6 +140,8 @@ class PredatorAgent(Agent):
 
 class Dek(PredatorAgent):
     
+    is_boss_target = True
+    
     def __init__(self, x=0, y=0):
         super().__init__("Dek", x, y, max_health=180, max_stamina=150)
         self.is_exiled = True
@@ -175,7 +176,7 @@ class Dek(PredatorAgent):
         return base_cost
     
     def perform_action(self, action_type, direction=None, target=None):
-        from actions import ActionResult, ActionType, Direction, CombatResult, Trophy
+        from actions import ActionResult, ActionType, CombatResult, Trophy
         
         if not self.can_act():
             return ActionResult(action_type, False, 0, "Cannot act - not alive")
@@ -206,12 +207,13 @@ class Dek(PredatorAgent):
         return ActionResult(action_type, False, 0, "Unknown action type")
     
     def perform_move(self, direction):
-        from actions import ActionResult, ActionType, Direction
+        from actions import ActionResult, ActionType, DIRECTION_OFFSETS
         
-        if direction not in Direction:
+        offset = DIRECTION_OFFSETS.get(direction)
+        if offset is None:
             return ActionResult(ActionType.MOVE, False, 0, "Invalid direction")
         
-        dx, dy = direction.value
+        dx, dy = offset
         new_x = self.x + dx
         new_y = self.y + dy
         
@@ -233,7 +235,6 @@ class Dek(PredatorAgent):
     
     def perform_attack(self, target):
         from actions import ActionResult, ActionType, CombatResult, Trophy
-        import random
         
         if not target or not target.is_alive:
             return ActionResult(ActionType.ATTACK, False, 0, "No valid target")
@@ -244,7 +245,7 @@ class Dek(PredatorAgent):
         if not self.consume_stamina(15):
             return ActionResult(ActionType.ATTACK, False, 0, "Insufficient stamina for attack")
         
-        base_damage = random.randint(35, 55)
+        base_damage = self.roll(35, 55)
         if self.stealth_active:
             base_damage = int(base_damage * 2.0)
             self.deactivate_stealth()
@@ -411,7 +412,6 @@ class Dek(PredatorAgent):
     
     def create_trophy_from_kill(self, target):
         from actions import Trophy
-        import random
         
         trophy_types = {
             'WildlifeAgent': [('claw', 2), ('skull', 3)],
@@ -422,7 +422,7 @@ class Dek(PredatorAgent):
         target_class = target.__class__.__name__
         if target_class in trophy_types:
             trophy_options = trophy_types[target_class]
-            trophy_name, trophy_value = random.choice(trophy_options)
+            trophy_name, trophy_value = self.rng.choice(trophy_options)
             
             return Trophy(
                 f"{target.name} {trophy_name}",
@@ -490,7 +490,7 @@ class Dek(PredatorAgent):
                 unexplored_moves.append((x, y))
         
         if unexplored_moves:
-            target_x, target_y = random.choice(unexplored_moves)
+            target_x, target_y = self.rng.choice(unexplored_moves)
             self.move_to(target_x, target_y)
         else:
             self.patrol_movement()
@@ -929,7 +929,7 @@ class PredatorBrother(PredatorAgent):
     
     def attack_threat(self, threat):
         if self.distance_to(threat) == 1:
-            damage = random.randint(20, 35)
+            damage = self.roll(20, 35)
             threat.take_damage(damage)
             
             if not threat.is_alive:
@@ -943,26 +943,24 @@ class PredatorBrother(PredatorAgent):
             return []
         
         threats = []
-        nearby_cells = self.grid.get_cells_in_radius(self.dek_reference.x, self.dek_reference.y, self.protection_range)
+        nearby_agents = self.grid.get_agents_in_radius(self.dek_reference.x, self.dek_reference.y, self.protection_range)
         
-        for cell in nearby_cells:
-            if cell.occupant and cell.occupant != self and cell.occupant != self.dek_reference:
-                agent = cell.occupant
-                if hasattr(agent, 'hostile') and agent.hostile:
+        for agent in nearby_agents:
+            if agent is not self and agent is not self.dek_reference:
+                if agent.hostile:
+                    threats.append(agent)
+                elif getattr(agent, 'IS_BOSS', False):
                     threats.append(agent)
-                elif 'Boss' in agent.__class__.__name__:
+                elif agent.is_creature and agent.aggression_level > 0.5:
                     threats.append(agent)
-                elif 'Wildlife' in agent.__class__.__name__ and hasattr(agent, 'aggression_level'):
-                    if agent.aggression_level > 0.5:
-                        threats.append(agent)
         
         return threats
     
     def competitive_hunting(self):
         prey = self.hunt_nearby_prey()
         if prey:
-            target = min(prey, key=lambda p: self.distance_to(p))
-            if self.distance_to(target) == 1:
+            target, distance = self.nearest_agent(prey)
+            if distance == 1:
                 self.attack_target(target)
                 if not target.is_alive:
                     self.record_own_kill()
@@ -979,7 +977,7 @@ class PredatorBrother(PredatorAgent):
         threats = self.find_nearby_threats()
         
         if threats:
-            nearest_threat = min(threats, key=lambda t: self.dek_reference.distance_to(t))
+            nearest_threat, _ = self.dek_reference.nearest_agent(threats)
             
             if self.distance_to(nearest_threat) == 1:
                 self.attack_threat(nearest_threat)
@@ -997,7 +995,7 @@ class PredatorBrother(PredatorAgent):
             return
         
         if self.distance_to(self.dek_reference) == 1:
-            damage = random.randint(15, 25)
+            damage = self.roll(15, 25)
             self.dek_reference.take_damage(damage)
             self.rivalry_with_dek -= 5
         else:
@@ -1111,7 +1109,7 @@ class PredatorClan(PredatorAgent):
     
     def aggressive_patrol(self):
         self.patrol_movement()
-        if random.random() < 0.3:
+        if self.rng.random() < 0.3:
             self.gain_honour(1)
     
     def dignified_patrol(self):
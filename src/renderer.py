@@ -28,20 +28,17 @@ class GridRenderer:
         
         lines.append('  +' + '-' * self.grid.width + '+')
         
-        for y in range(self.grid.height):
-            row_str = f'{y:2d}|'
-            for x in range(self.grid.width):
-                cell = self.grid.get_cell(x, y)
-                symbol = cell.get_display_symbol()
-                
-                if use_colors:
-                    color = self.TERRAIN_COLORS.get(cell.terrain.terrain_type, self.RESET)
-                    row_str += f'{color}{symbol}{self.RESET}'
-                else:
-                    row_str += symbol
-            
-            row_str += '|'
-            lines.append(row_str)
+        colors = self.TERRAIN_COLORS
+        reset = self.RESET
+        for y, row in enumerate(self.grid.cells):
+            if use_colors:
+                symbols = [
+                    f'{colors.get(cell.terrain.terrain_type, reset)}{cell.get_display_symbol()}{reset}'
+                    for cell in row
+                ]
+            else:
+                symbols = [cell.get_display_symbol() for cell in row]
+            lines.append(f'{y:2d}|' + ''.join(symbols) + '|')
         
         lines.append('  +' + '-' * self.grid.width + '+')
         
@@ -1,9 +1,10 @@
 from agent import Agent
-import random
 
 
 class SyntheticAgent(Agent):
     
+    is_boss_target = True
+    
     def __init__(self, name, model, x=0, y=0, max_health=80, max_stamina=200):
         super().__init__(name, x, y, max_health, max_stamina)
         self.model = model
@@ -76,7 +77,7 @@ class SyntheticAgent(Agent):
         if self.battery_level < 20:
             return "conserve_power"
         
-        if random.random() < self.malfunction_chance:
+        if self.rng.random() < self.malfunction_chance:
             return "malfunction"
         
         return "operate"
@@ -97,12 +98,12 @@ class SyntheticAgent(Agent):
     
     def random_malfunction(self):
         malfunctions = ["move_random", "stutter", "shutdown_brief"]
-        malfunction = random.choice(malfunctions)
+        malfunction = self.rng.choice(malfunctions)
         
         if malfunction == "move_random":
             valid_moves = self.get_valid_moves()
             if valid_moves:
-                x, y = random.choice(valid_moves)
+                x, y = self.rng.choice(valid_moves)
                 self.move_to(x, y)
         elif malfunction == "stutter":
             self.consume_battery(5)
@@ -300,7 +301,7 @@ class Thia(SyntheticAgent):
         if hasattr(agent, 'health') and agent.health > 100:
             threat_factors += 2
         
-        if 'Boss' in agent.__class__.__name__:
+        if getattr(agent, 'IS_BOSS', False):
             threat_factors += 10
         elif 'Predator' in agent.__class__.__name__:
             threat_factors += 3
@@ -414,9 +415,7 @@ class Thia(SyntheticAgent):
                         safe_moves.append((x, y))
                 
                 if safe_moves:
-                    from actions import Direction
-                    import random
-                    target_x, target_y = random.choice(safe_moves)
+                    target_x, target_y = self.rng.choice(safe_moves)
                     if self.attempt_independent_movement(None):
                         self.move_to(target_x, target_y)
     
@@ -531,20 +530,18 @@ class SyntheticScout(SyntheticAgent):
     def patrol_and_observe(self):
         valid_moves = self.get_valid_moves()
         if valid_moves:
-            import random
-            self.move_to(*random.choice(valid_moves))
+            self.move_to(*self.rng.choice(valid_moves))
     
     def seek_and_assist_allies(self):
         if not self.grid:
             return
         
         nearby_agents = []
-        nearby_cells = self.grid.get_cells_in_radius(self.x, self.y, 4)
         
-        for cell in nearby_cells:
-            if cell.occupant and cell.occupant != self:
-                if hasattr(cell.occupant, 'name') and cell.occupant.name in ['Dek', 'Thia']:
-                    nearby_agents.append(cell.occupant)
+        for agent in self.grid.get_agents_in_radius(self.x, self.y, 4):
+            if agent is not self:
+                if hasattr(agent, 'name') and agent.name in ['Dek', 'Thia']:
+                    nearby_agents.append(agent)
         
         if nearby_agents:
             target = nearby_agents[0]
@@ -639,12 +636,9 @@ class SyntheticMedic(SyntheticAgent):
             return []
         
         patients = []
-        nearby_cells = self.grid.get_cells_in_radius(self.x, self.y, 5)
         
-        for cell in nearby_cells:
-            if cell.occupant and cell.occupant != self:
-                agent = cell.occupant
-                
+        for agent in self.grid.get_agents_in_radius(self.x, self.y, 5):
+            if agent is not self:
                 needs_help = False
                 if hasattr(agent, 'health') and hasattr(agent, 'max_health'):
                     if agent.health < agent.max_health * 0.7:
@@ -695,8 +689,7 @@ class SyntheticMedic(SyntheticAgent):
     def patrol_movement(self):
         valid_moves = self.get_valid_moves()
         if valid_moves:
-            import random
-            self.move_to(*random.choice(valid_moves))
+            self.move_to(*self.rng.choice(valid_moves))
 
 
 class SyntheticEnemy(SyntheticAgent):
@@ -722,11 +715,9 @@ class SyntheticEnemy(SyntheticAgent):
         
         targets = []
         scan_range = 6 if self.combat_mode == "aggressive" else 4
-        nearby_cells = self.grid.get_cells_in_radius(self.x, self.y, scan_range)
         
-        for cell in nearby_cells:
-            if cell.occupant and cell.occupant != self:
-                agent = cell.occupant
+        for agent in self.grid.get_agents_in_radius(self.x, self.y, scan_range):
+            if agent is not self:
                 for priority_type in self.target_priority:
                     if priority_type.lower() in agent.__class__.__name__.lower() or agent.name == priority_type:
                         targets.append((agent, self.target_priority.index(priority_type)))
@@ -792,5 +783,4 @@ class SyntheticEnemy(SyntheticAgent):
     def search_and_patrol(self):
         valid_moves = self.get_valid_moves()
         if valid_moves:
-            import random
-            self.move_to(*random.choice(valid_moves))
\ No newline at end of file
+            self.move_to(*self.rng.choice(valid_moves))
\ No newline at end of file
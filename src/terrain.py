@@ -47,16 +47,15 @@ class Terrain:
         self.terrain_type = terrain_type
     
     @property
-    def movement_cost(self):
-        return self.MOVEMENT_COSTS[self.terrain_type]
+    def terrain_type(self):
+        return self._terrain_type
     
-    @property
-    def damage(self):
-        return self.DAMAGE_VALUES[self.terrain_type]
-    
-    @property
-    def symbol(self):
-        return self.SYMBOLS[self.terrain_type]
+    @terrain_type.setter
+    def terrain_type(self, terrain_type):
+        self._terrain_type = terrain_type
+        self.movement_cost = self.MOVEMENT_COSTS[terrain_type]
+        self.damage = self.DAMAGE_VALUES[terrain_type]
+        self.symbol = self.SYMBOLS[terrain_type]
     
     @property
     def is_passable(self):
@@ -26,9 +26,10 @@ class WeatherSystem:
         self.turns_in_state += 1
         p = 0.05 if self.current.name == "Calm" else 0.12
         if self.random.random() < p:
-            self.current = self.random.choice([
-                self._calm(), self._sandstorm(), self._acid_rain(), self._electrical_storm()
-            ])
+            make_state = self.random.choice(
+                (self._calm, self._sandstorm, self._acid_rain, self._electrical_storm)
+            )
+            self.current = make_state()
             self.turns_in_state = 0
             return True
         return False
@@ -13,10 +13,14 @@ Author: Predator Badlands Team
 import unittest
 import os
 import sys
+import csv
+import io
 import json
 import tempfile
+import time
 import shutil
 from pathlib import Path
+from unittest.mock import patch
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -26,6 +30,8 @@ from metrics import (
     MetricType, calculate_survival_curve, calculate_honour_progression
 )
 from data_collector import DataCollector, ExperimentLogger
+import json_stream
+from json_stream import write_json_stream
 from experiment_runner import (
     ExperimentRunner, ExperimentConfig, HeadlessSimulation,
     DifficultyLevel, EXPERIMENT_CONFIGS
@@ -200,6 +206,21 @@ class TestMetricsCollector(unittest.TestCase):
         history = self.collector.current_run.agent_metrics["dek"].honour_history
         self.assertEqual(len(history), 3)
         self.assertEqual(history[-1], 150.0)
+        self.assertEqual(history.typecode, 'q')
+        self.assertEqual(self.collector.current_run.agent_metrics["dek"].get_honour_growth(), 50.0)
+        
+    def test_record_honour_rejects_fractional_values(self):
+        """Test honour history never silently truncates a value."""
+        self.collector.start_simulation(1, "test")
+        self.collector.register_agent("dek", "predator")
+        self.collector.record_honour("dek", 2 ** 40)
+        
+        with self.assertRaises(ValueError):
+            self.collector.record_honour("dek", 100.5)
+            
+        metrics = self.collector.current_run.agent_metrics["dek"]
+        self.assertEqual(list(metrics.honour_history), [2 ** 40])
+        self.assertEqual(metrics.final_honour, 2 ** 40)
         
     def test_record_combat(self):
         """Test recording combat events."""
@@ -348,6 +369,23 @@ class TestDataCollector(unittest.TestCase):
             self.assertIn("config_name", content)
             self.assertIn("total_steps", content)
             
+    def test_load_simulation_results_csv_round_trip(self):
+        """Test loaded results come back with typed columns."""
+        results = [
+            SimulationMetrics(run_id=1, config_name="test", total_steps=100, boss_defeated=True),
+            SimulationMetrics(run_id=2, config_name="test", total_steps=150, duration_seconds=1.5),
+        ]
+        filepath = self.collector.save_simulation_results_csv(results)
+        
+        loaded = self.collector.load_simulation_results_csv(filepath)
+        
+        self.assertEqual([row['run_id'] for row in loaded], [1, 2])
+        self.assertEqual(loaded[0]['total_steps'], 100)
+        self.assertIs(loaded[0]['boss_defeated'], True)
+        self.assertIs(loaded[1]['boss_defeated'], False)
+        self.assertEqual(loaded[1]['duration_seconds'], 1.5)
+        self.assertEqual(loaded[0]['config_name'], "test")
+        
     def test_save_agent_metrics_csv(self):
         """Test saving agent metrics to CSV."""
         metrics = [
@@ -359,6 +397,48 @@ class TestDataCollector(unittest.TestCase):
         
         self.assertTrue(os.path.exists(filepath))
         
+    def test_save_honour_progression_csv(self):
+        """Test one honour row is written per recorded step."""
+        run = SimulationMetrics(run_id=3, config_name="test")
+        run.agent_metrics['dek'] = AgentMetrics(
+            agent_id="dek", agent_type="predator", honour_history=[0, 5, 12]
+        )
+        run.agent_metrics['thia'] = AgentMetrics(agent_id="thia", agent_type="synthetic")
+        
+        filepath = self.collector.save_honour_progression_csv([run])
+        
+        with open(filepath, 'r', newline='') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], ['run_id', 'config_name', 'agent_id', 'agent_type', 'step', 'honour'])
+        self.assertEqual(rows[1:], [
+            ['3', 'test', 'dek', 'predator', '0', '0'],
+            ['3', 'test', 'dek', 'predator', '1', '5'],
+            ['3', 'test', 'dek', 'predator', '2', '12'],
+        ])
+        
+    def test_recorded_honour_exports_as_integers(self):
+        """Test recorded honour is written without a decimal point."""
+        metrics = MetricsCollector()
+        metrics.start_simulation(4, "test")
+        metrics.register_agent("dek", "predator")
+        for honour in (0, 5, 12):
+            metrics.record_honour("dek", honour)
+        run = metrics.current_run
+        
+        filepath = self.collector.save_honour_progression_csv([run])
+        
+        with open(filepath, 'r', newline='') as f:
+            honours = [row[-1] for row in list(csv.reader(f))[1:]]
+        self.assertEqual(honours, ['0', '5', '12'])
+        self.assertEqual(repr(run.agent_metrics['dek'].get_honour_growth()), '12')
+        
+    def test_save_honour_progression_csv_without_history(self):
+        """Test no file is written when no honour was recorded."""
+        run = SimulationMetrics(run_id=1, config_name="test")
+        run.agent_metrics['dek'] = AgentMetrics(agent_id="dek", agent_type="predator")
+        
+        self.assertEqual(self.collector.save_honour_progression_csv([run]), "")
+        
     def test_save_experiment_json(self):
         """Test saving experiment data as JSON."""
         runs = [SimulationMetrics(run_id=1, config_name="test")]
@@ -375,6 +455,46 @@ class TestDataCollector(unittest.TestCase):
             self.assertIn('runs', data)
             self.assertEqual(len(data['runs']), 1)
 
+    def test_save_experiment_json_streams_every_run(self):
+        """Test streamed runs load back in order with their agent details."""
+        runs = [SimulationMetrics(run_id=i, config_name="test") for i in (1, 2, 3)]
+        runs[1].agent_metrics['dek'] = AgentMetrics(agent_id="dek", agent_type="predator")
+        
+        with open(self.collector.save_experiment_json(runs, {"name": "test"}), 'r') as f:
+            data = json.load(f)
+        self.assertEqual([run['run_id'] for run in data['runs']], [1, 2, 3])
+        self.assertEqual(list(data['runs'][1]['agent_details']), ['dek'])
+        
+        with open(self.collector.save_experiment_json([], {}, filename="empty.json"), 'r') as f:
+            self.assertEqual(json.load(f)['runs'], [])
+
+
+class TestJsonStream(unittest.TestCase):
+    """Test the shared streaming JSON writer."""
+    
+    HEADER = {'session_id': 's1', 'config': {'name': 'test', 'seeds': [1, 2], 3: 'x'}}
+    ITEMS = [{'run_id': 1, 'nested': {'a': [1, 2]}}, {'run_id': 2, 'nested': {}}]
+    
+    def _stream(self, items, indent_items=True):
+        buffer = io.BytesIO()
+        write_json_stream(buffer, self.HEADER, 'runs', iter(items), indent_items)
+        return buffer.getvalue().decode('utf-8')
+    
+    def test_indented_layout_matches_json_dump(self):
+        """Test streamed output is byte-identical to json.dumps(indent=2)."""
+        for orjson_available in {False, json_stream.ORJSON_AVAILABLE}:
+            with patch.object(json_stream, 'ORJSON_AVAILABLE', orjson_available):
+                for items in (self.ITEMS, []):
+                    expected = json.dumps(dict(self.HEADER, runs=items), indent=2) + '\n'
+                    self.assertEqual(self._stream(items), expected)
+    
+    def test_compact_items_one_per_line(self):
+        """Test compact mode writes each item on its own line."""
+        text = self._stream(self.ITEMS, indent_items=False)
+        
+        self.assertEqual(json.loads(text)['runs'], self.ITEMS)
+        self.assertIn('\n    {"run_id":2,"nested":{}}\n  ]', text)
+
 
 class TestExperimentLogger(unittest.TestCase):
     """Test ExperimentLogger class."""
@@ -395,6 +515,48 @@ class TestExperimentLogger(unittest.TestCase):
         self.assertIn("ERROR", logs[2])
         self.assertIn("SUCCESS", logs[3])
         
+    def test_log_file_written_through_open_handle(self):
+        """Test file logging keeps lines across flush and close."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            log_file = os.path.join(temp_dir, "logs", "experiment.log")
+            logger = ExperimentLogger(log_file=log_file, verbose=False)
+            logger.info("first")
+            logger.flush()
+            with open(log_file, 'r', encoding='utf-8') as f:
+                self.assertIn("[INFO] first", f.read())
+                
+            logger.error("second")
+            logger.close()
+            logger.info("after close")
+            with open(log_file, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+            self.assertEqual(len(lines), 2)
+            self.assertIn("[ERROR] second", lines[1])
+            self.assertEqual(len(logger.get_logs()), 3)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        
+    def test_timestamp_formatted_once_per_second(self):
+        """Test messages within one second share the cached timestamp."""
+        logger = ExperimentLogger(verbose=False)
+        
+        with patch('data_collector.time') as fake_time:
+            fake_time.time.return_value = 1000.2
+            fake_time.localtime = time.localtime
+            fake_time.strftime.side_effect = time.strftime
+            logger.info("one")
+            fake_time.time.return_value = 1000.9
+            logger.info("two")
+            self.assertEqual(fake_time.strftime.call_count, 1)
+            
+            fake_time.time.return_value = 1001.0
+            logger.info("three")
+            self.assertEqual(fake_time.strftime.call_count, 2)
+            
+        expected = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(1000))
+        self.assertTrue(logger.get_logs()[1].startswith(f"[{expected}] [INFO]"))
+        
     def test_experiment_logging(self):
         """Test experiment-specific logging."""
         logger = ExperimentLogger(verbose=False)
@@ -470,6 +632,60 @@ class TestExperimentRunner(unittest.TestCase):
         self.assertIn("quick_test", results)
         self.assertEqual(len(results["quick_test"]), 2)
         
+    def test_run_parallel_experiment(self):
+        """Test running experiments across worker processes."""
+        self.runner.add_config(ExperimentConfig(name="par_a", num_runs=3, max_turns=10))
+        self.runner.add_config(ExperimentConfig(name="par_b", num_runs=2, max_turns=10))
+
+        progress = []
+        self.runner.set_progress_callback(lambda cur, total, msg: progress.append((cur, total)))
+        results = self.runner.run_all_experiments(parallel=True, max_workers=2)
+
+        self.assertEqual([r.run_id for r in results["par_a"]], [1, 2, 3])
+        self.assertEqual([r.run_id for r in results["par_b"]], [1, 2])
+        self.assertEqual(progress[-1], (5, 5))
+
+    def test_parallel_run_logs_experiment_events(self):
+        """Test the parallel path logs each experiment's start and completion."""
+        self.runner.add_config(ExperimentConfig(name="log_a", num_runs=2, max_turns=10))
+        self.runner.add_config(ExperimentConfig(name="log_b", num_runs=1, max_turns=10))
+        self.runner.add_config(ExperimentConfig(name="log_empty", num_runs=0))
+        self.runner.run_all_experiments(parallel=True, max_workers=2)
+
+        logs = "\n".join(self.runner.logger.get_logs())
+        for name, runs in (("log_a", 2), ("log_b", 1), ("log_empty", 0)):
+            self.assertIn(f"Starting experiment: {name} ({runs} runs)", logs)
+            self.assertEqual(logs.count(f"Experiment {name} complete in"), 1)
+            for run_id in range(1, runs + 1):
+                self.assertIn(f"{name} run {run_id} complete:", logs)
+
+    def test_stream_parallel_runs_into_csv(self):
+        """Test completed worker runs can be written as they arrive."""
+        self.runner.add_config(ExperimentConfig(name="stream", num_runs=3, max_turns=10))
+        
+        filepath = self.runner.data_collector.save_simulation_results_csv(
+            metrics for _, _, metrics in self.runner.iter_runs_parallel(max_workers=2)
+        )
+        
+        rows = self.runner.data_collector.load_simulation_results_csv(filepath)
+        self.assertEqual(sorted(row['run_id'] for row in rows), [1, 2, 3])
+        self.assertEqual(self.runner.data_collector.save_simulation_results_csv(iter([])), "")
+
+    def test_seeded_runs_are_reproducible(self):
+        """Test that a seeded config replays identically, serial or parallel."""
+        config = ExperimentConfig(name="seeded", num_runs=2, max_turns=30, random_seed=7)
+        serial = self.runner.run_experiment(config)
+
+        other = ExperimentRunner(self.temp_dir)
+        other.add_config(config)
+        parallel = other.run_all_experiments(parallel=True, max_workers=2)["seeded"]
+
+        for a, b in zip(serial, parallel):
+            self.assertEqual(
+                {k: m.to_dict() for k, m in a.agent_metrics.items()},
+                {k: m.to_dict() for k, m in b.agent_metrics.items()}
+            )
+
     def test_save_results(self):
         """Test saving experiment results."""
         config = ExperimentConfig(name="test", num_runs=2, max_turns=10)
@@ -83,6 +83,13 @@ class TestTerrain(unittest.TestCase):
         self.assertEqual(terrain.damage, 0)
         self.assertEqual(terrain.symbol, 'O')
         self.assertFalse(terrain.is_hazardous)
+    
+    def test_terrain_properties_follow_type_change(self):
+        terrain = Terrain(TerrainType.EMPTY)
+        terrain.terrain_type = TerrainType.TRAP
+        self.assertEqual(terrain.movement_cost, 5)
+        self.assertEqual(terrain.damage, 15)
+        self.assertEqual(terrain.symbol, 'X')
 
 
 class TestCell(unittest.TestCase):
@@ -344,6 +351,33 @@ class TestGridAgentPlacement(unittest.TestCase):
         self.assertEqual(agent.x, 5)
         self.assertEqual(agent.y, 10)
     
+    def test_distances_from_matches_calculate_distance(self):
+        agents = []
+        for x, y in [(0, 0), (19, 0), (5, 7), (12, 18)]:
+            agent = self.MockAgent()
+            agent.x, agent.y = x, y
+            agents.append(agent)
+        distances = self.grid.distances_from(1, 1, agents)
+        self.assertEqual(distances, [self.grid.calculate_distance(1, 1, a.x, a.y) for a in agents])
+    
+    def test_nearest_agent_uses_wrapped_distance_and_first_tie(self):
+        agents = []
+        for x, y in [(10, 10), (19, 0), (0, 2), (18, 19)]:
+            agent = self.MockAgent()
+            agent.x, agent.y = x, y
+            agents.append(agent)
+        nearest, distance = self.grid.nearest_agent(0, 0, agents)
+        self.assertIs(nearest, agents[1])
+        self.assertEqual(distance, 1)
+        self.assertEqual(self.grid.nearest_agent(0, 0, []), (None, None))
+    
+    def test_best_move_nearest_and_farthest(self):
+        moves = [(4, 4), (5, 4), (6, 6), (19, 0)]
+        self.assertEqual(self.grid.best_move(moves, 7, 7), (6, 6))
+        self.assertEqual(self.grid.best_move(moves, 0, 0), (19, 0))
+        self.assertEqual(self.grid.best_move(moves, 7, 7, farthest=True), (19, 0))
+        self.assertIsNone(self.grid.best_move([], 0, 0))
+    
     def test_place_agent_random_position(self):
         agent = self.MockAgent()
         result = self.grid.place_agent(agent)
@@ -383,6 +417,33 @@ class TestGridAgentPlacement(unittest.TestCase):
         self.assertTrue(result)
         self.assertEqual(agent.x, 0)
         self.assertEqual(agent.y, 0)
+    
+    def test_agents_in_radius_matches_cell_scan(self):
+        agents = []
+        for x, y in [(5, 5), (6, 7), (19, 4), (12, 12), (0, 5)]:
+            agent = self.MockAgent()
+            self.grid.place_agent(agent, x, y)
+            agents.append(agent)
+        self.grid.move_agent(agents[3], 13, 13)
+        
+        for radius in (1, 2, 6, 15):
+            expected = [
+                cell.occupant for cell in self.grid.get_cells_in_radius(5, 5, radius)
+                if cell.occupant is not None
+            ]
+            expected = list(dict.fromkeys(expected))
+            self.assertEqual(self.grid.get_agents_in_radius(5, 5, radius), expected)
+    
+    def test_agents_in_radius_follows_moves(self):
+        agent = self.MockAgent()
+        self.grid.place_agent(agent, 19, 19)
+        self.grid.move_agent(agent, 20, 20)
+        
+        self.assertEqual(self.grid.get_agents_in_radius(1, 1, 1), [agent])
+        self.assertEqual(self.grid.get_agents_in_radius(18, 18, 1), [])
+        
+        self.grid.clear_all_occupants()
+        self.assertEqual(self.grid.get_agents_in_radius(1, 1, 1), [])
 
 
 class TestGridTeleportation(unittest.TestCase):
@@ -401,9 +462,10 @@ class TestGridTeleportation(unittest.TestCase):
     def test_teleport_on_move(self):
         agent = self.MockAgent()
         self.grid.place_agent(agent, 1, 0)
-        self.grid.move_agent(agent, 0, 0)
+        landing_cell = self.grid.move_agent(agent, 0, 0)
         self.assertEqual(agent.x, 10)
         self.assertEqual(agent.y, 10)
+        self.assertIs(landing_cell, self.grid.get_cell(10, 10))
     
     def test_teleport_destination_occupied(self):
         agent1 = self.MockAgent()
@@ -147,6 +147,14 @@ class TestAgentMovement(unittest.TestCase):
         agent.set_grid(grid)
         self.assertEqual(agent.grid, grid)
     
+    def test_roll_stays_in_range(self):
+        import random
+        agent = MockAgent("Test", 5, 5)
+        agent.set_rng(random.Random(3))
+        rolls = [agent.roll(5, 15) for _ in range(5000)]
+        self.assertEqual(min(rolls), 5)
+        self.assertEqual(max(rolls), 15)
+    
     def test_get_adjacent_positions(self):
         agent = MockAgent("Test", 5, 5)
         grid = Grid(20, 20)
@@ -162,6 +170,30 @@ class TestAgentMovement(unittest.TestCase):
         moves = agent.get_valid_moves()
         self.assertEqual(len(moves), 8)
     
+    def test_get_valid_moves_refreshes_after_grid_change(self):
+        agent = MockAgent("Test", 5, 5)
+        other = MockAgent("Other", 0, 0)
+        grid = Grid(20, 20)
+        grid.place_agent(agent, 5, 5)
+        agent.set_grid(grid)
+        moves = agent.get_valid_moves()
+        self.assertEqual(agent.get_valid_moves(), moves)
+        
+        grid.place_agent(other, 6, 5)
+        self.assertNotIn((6, 5), agent.get_valid_moves())
+        
+        agent.move_to(4, 4)
+        self.assertIn((5, 5), agent.get_valid_moves())
+    
+    def test_get_valid_moves_returns_independent_list(self):
+        agent = MockAgent("Test", 5, 5)
+        grid = Grid(20, 20)
+        grid.place_agent(agent, 5, 5)
+        agent.set_grid(grid)
+        moves = agent.get_valid_moves()
+        moves.clear()
+        self.assertEqual(len(agent.get_valid_moves()), 8)
+    
     def test_distance_to(self):
         agent1 = MockAgent("Agent1", 5, 5)
         agent2 = MockAgent("Agent2", 7, 7)
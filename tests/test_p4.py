@@ -3,7 +3,7 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from actions import ActionType, Direction, CombatResult, Trophy, ActionResult
+from actions import ActionType, Direction, DIRECTION_OFFSETS, CombatResult, Trophy, ActionResult
 from items import Item, Medkit, EnergyPack, RepairKit, WeaponItem, random_item
 
 
@@ -42,6 +42,11 @@ class TestDirection(unittest.TestCase):
     def test_direction_count(self):
         directions = list(Direction)
         self.assertEqual(len(directions), 8)
+    
+    def test_direction_offsets(self):
+        self.assertEqual(len(DIRECTION_OFFSETS), 8)
+        for direction in Direction:
+            self.assertEqual(DIRECTION_OFFSETS[direction], direction.value)
 
 
 class TestCombatResult(unittest.TestCase):
@@ -5,6 +5,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from creatures import WildlifeAgent, BossAdversary
 from synthetic import SyntheticAgent, Thia
+from predator import Dek
 from grid import Grid
 
 
@@ -18,6 +19,12 @@ class TestWildlifeAgent(unittest.TestCase):
         self.assertEqual(wildlife.x, 5)
         self.assertEqual(wildlife.y, 10)
     
+    def test_creature_flags(self):
+        self.assertTrue(WildlifeAgent("Beast", "herbivore").is_creature)
+        self.assertTrue(BossAdversary().is_creature)
+        self.assertFalse(Dek().is_creature)
+        self.assertFalse(Thia().is_creature)
+    
     def test_wildlife_default_stats(self):
         wildlife = WildlifeAgent("Beast", "herbivore")
         
@@ -57,6 +64,9 @@ class TestWildlifeAgent(unittest.TestCase):
         
         self.assertIn(wildlife2, wildlife1.pack_members)
         self.assertIn(wildlife1, wildlife2.pack_members)
+        
+        wildlife2.add_pack_member(wildlife1)
+        self.assertEqual(len(wildlife1.pack_members), 1)
 
 
 class TestWildlifeBehavior(unittest.TestCase):
@@ -70,6 +80,32 @@ class TestWildlifeBehavior(unittest.TestCase):
         threats = wildlife.detect_threats()
         self.assertEqual(threats, [])
     
+    def test_detect_threats_finds_predators_only(self):
+        wildlife = WildlifeAgent("Beast", "herbivore")
+        other = WildlifeAgent("Other", "herbivore")
+        dek = Dek()
+        grid = Grid(20, 20)
+        wildlife.set_grid(grid)
+        grid.place_agent(wildlife, 10, 10)
+        grid.place_agent(other, 11, 10)
+        grid.place_agent(dek, 12, 12)
+        
+        self.assertEqual(wildlife.detect_threats(), [dek])
+        
+        grid.move_agent(dek, 13, 13)
+        self.assertEqual(wildlife.detect_threats(), [])
+    
+    def test_flee_moves_away_from_threat(self):
+        wildlife = WildlifeAgent("Beast", "herbivore")
+        dek = Dek()
+        grid = Grid(20, 20)
+        wildlife.set_grid(grid)
+        grid.place_agent(wildlife, 10, 10)
+        grid.place_agent(dek, 11, 11)
+        
+        wildlife.flee_behavior()
+        self.assertEqual(grid.calculate_distance(wildlife.x, wildlife.y, dek.x, dek.y), 2)
+    
     def test_decide_action_rest_low_stamina(self):
         wildlife = WildlifeAgent("Beast", "herbivore")
         wildlife.stamina = 15
@@ -131,6 +167,22 @@ class TestBossAdversary(unittest.TestCase):
         self.assertIn("energy_blast", boss.special_abilities)
         self.assertIn("regeneration", boss.special_abilities)
     
+    def test_special_attack_table_matches_ability_names(self):
+        boss = BossAdversary()
+        
+        self.assertEqual(
+            [attack.__name__ for attack in boss._special_attacks],
+            ["earthquake_attack", "energy_blast_attack", "regenerate_health"]
+        )
+        self.assertEqual(len(boss._special_attacks), len(boss.special_abilities))
+    
+    def test_update_dispatches_rest(self):
+        boss = BossAdversary()
+        boss.is_alive = False
+        boss.stamina = 100
+        boss.update()
+        self.assertEqual(boss.stamina, 115)
+    
     def test_boss_initial_state(self):
         boss = BossAdversary()
         
@@ -215,6 +267,54 @@ class TestBossActions(unittest.TestCase):
         
         action = boss.decide_action()
         self.assertEqual(action, "regenerate")
+    
+    def test_detect_enemies_targets_allies_only(self):
+        boss = BossAdversary()
+        grid = Grid(30, 30)
+        boss.set_grid(grid)
+        grid.place_agent(boss, 15, 15)
+        
+        dek = Dek()
+        thia = Thia()
+        beast = WildlifeAgent("Beast", "carnivore")
+        grid.place_agent(thia, 25, 15)
+        grid.place_agent(dek, 16, 15)
+        grid.place_agent(beast, 14, 15)
+        
+        self.assertEqual(boss.detect_enemies(), [dek, thia])
+    
+    def test_earthquake_hits_agents_in_radius_only(self):
+        boss = BossAdversary()
+        grid = Grid(30, 30)
+        boss.set_grid(grid)
+        grid.place_agent(boss, 15, 15)
+        near = WildlifeAgent("Near", "carnivore")
+        far = WildlifeAgent("Far", "carnivore")
+        grid.place_agent(near, 18, 12)
+        grid.place_agent(far, 25, 15)
+        
+        boss.earthquake_attack()
+        
+        self.assertLess(near.health, near.max_health)
+        self.assertEqual(far.health, far.max_health)
+        self.assertEqual(boss.health, boss.max_health)
+    
+    def test_detect_enemies_reused_until_grid_changes(self):
+        boss = BossAdversary()
+        grid = Grid(60, 60)
+        boss.set_grid(grid)
+        grid.place_agent(boss, 15, 15)
+        dek = Dek()
+        grid.place_agent(dek, 16, 15)
+        
+        enemies = boss.detect_enemies()
+        self.assertIs(boss.detect_enemies(), enemies)
+        
+        boss.rage_level = 50
+        self.assertIsNot(boss.detect_enemies(), enemies)
+        
+        grid.move_agent(dek, 45, 45)
+        self.assertEqual(boss.detect_enemies(), [])
 
 
 class TestSyntheticAgent(unittest.TestCase):
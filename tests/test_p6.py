@@ -6,35 +6,37 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 from clan_code import (
     ClanCodeViolation, HonourableAction, ClanCodeRule, HonourReward,
     YautjaClanCode, ClanRelationship, ClanReaction, HonourTracker,
-    ClanTrialType, ClanTrial
+    ClanTrialType, ClanTrial, ClanTrialManager, HONOUR_HISTORY_LIMIT
 )
 from predator import PredatorAgent
+from creatures import WildlifeAgent
+from actions import ActionResult, ActionType, CombatResult
 
 
 class TestClanCodeViolation(unittest.TestCase):
     
     def test_violation_values(self):
-        self.assertEqual(ClanCodeViolation.HUNT_UNWORTHY.value, "hunting_unworthy")
-        self.assertEqual(ClanCodeViolation.UNFAIR_ADVANTAGE.value, "unfair_advantage")
-        self.assertEqual(ClanCodeViolation.TERRITORY_VIOLATION.value, "territory_violation")
-        self.assertEqual(ClanCodeViolation.TROPHY_THEFT.value, "trophy_theft")
-        self.assertEqual(ClanCodeViolation.HARM_INNOCENT.value, "harm_innocent")
+        self.assertEqual(ClanCodeViolation.HUNT_UNWORTHY, "hunting_unworthy")
+        self.assertEqual(ClanCodeViolation.UNFAIR_ADVANTAGE, "unfair_advantage")
+        self.assertEqual(ClanCodeViolation.TERRITORY_VIOLATION, "territory_violation")
+        self.assertEqual(ClanCodeViolation.TROPHY_THEFT, "trophy_theft")
+        self.assertEqual(ClanCodeViolation.HARM_INNOCENT, "harm_innocent")
     
     def test_all_violations_exist(self):
-        violations = list(ClanCodeViolation)
+        violations = ClanCodeViolation.VALUES
         self.assertEqual(len(violations), 10)
 
 
 class TestHonourableAction(unittest.TestCase):
     
     def test_honourable_action_values(self):
-        self.assertEqual(HonourableAction.WORTHY_KILL.value, "worthy_kill")
-        self.assertEqual(HonourableAction.PROTECT_ALLY.value, "protect_ally")
-        self.assertEqual(HonourableAction.FACE_SUPERIOR_FOE.value, "face_superior_foe")
-        self.assertEqual(HonourableAction.DEFEAT_BOSS.value, "defeat_boss")
+        self.assertEqual(HonourableAction.WORTHY_KILL, "worthy_kill")
+        self.assertEqual(HonourableAction.PROTECT_ALLY, "protect_ally")
+        self.assertEqual(HonourableAction.FACE_SUPERIOR_FOE, "face_superior_foe")
+        self.assertEqual(HonourableAction.DEFEAT_BOSS, "defeat_boss")
     
     def test_all_actions_exist(self):
-        actions = list(HonourableAction)
+        actions = HonourableAction.VALUES
         self.assertEqual(len(actions), 10)
 
 
@@ -108,6 +110,12 @@ class TestYautjaClanCodeRules(unittest.TestCase):
         self.assertIn(ClanCodeViolation.UNFAIR_ADVANTAGE, YautjaClanCode.RULES)
         self.assertIn(ClanCodeViolation.HARM_INNOCENT, YautjaClanCode.RULES)
     
+    def test_rule_tables_are_read_only(self):
+        with self.assertRaises(TypeError):
+            YautjaClanCode.RULES[ClanCodeViolation.HUNT_UNWORTHY] = None
+        with self.assertRaises(TypeError):
+            YautjaClanCode.REWARDS[HonourableAction.WORTHY_KILL] = None
+    
     def test_hunt_unworthy_penalty(self):
         rule = YautjaClanCode.RULES[ClanCodeViolation.HUNT_UNWORTHY]
         self.assertEqual(rule.honour_penalty, 15)
@@ -166,6 +174,7 @@ class TestYautjaClanCodeMethods(unittest.TestCase):
     
     def test_assess_target_strength_boss(self):
         class BossAdversary:
+            IS_BOSS = True
             max_health = 500
             weapons = []
             special_abilities = ["earthquake", "blast"]
@@ -173,6 +182,55 @@ class TestYautjaClanCodeMethods(unittest.TestCase):
         strength = YautjaClanCode.assess_target_strength(BossAdversary())
         self.assertEqual(strength, 10)
     
+    def test_assess_target_strength_tracks_new_weapons(self):
+        class Target:
+            max_health = 120
+            weapons = ["claws"]
+        
+        target = Target()
+        self.assertEqual(YautjaClanCode.assess_target_strength(target), 3)
+        target.weapons = ["claws", "spear"]
+        self.assertEqual(YautjaClanCode.assess_target_strength(target), 4)
+    
+    def test_assess_target_strength_slotted_target(self):
+        class SlottedTarget:
+            __slots__ = ('max_health', 'weapons')
+            
+            def __init__(self):
+                self.max_health = 250
+                self.weapons = ["claws"]
+        
+        self.assertEqual(YautjaClanCode.assess_target_strength(SlottedTarget()), 4)
+    
+    def test_evaluate_action_penalises_innocent_target(self):
+        predator = PredatorAgent("Hunter")
+        predator.honour = 50
+        target = WildlifeAgent("Fawn", "deer")
+        target.is_innocent = True
+        
+        result = ActionResult(ActionType.ATTACK, True)
+        result.combat_result = CombatResult(predator, target, 10)
+        messages = YautjaClanCode.evaluate_action(predator, result)
+        
+        self.assertEqual(len(messages), 1)
+        self.assertIn(ClanCodeViolation.HARM_INNOCENT, messages[0])
+        self.assertEqual(predator.honour, 20)
+    
+    def test_evaluate_action_plain_target_without_flags(self):
+        predator = PredatorAgent("Hunter")
+        predator.honour = 50
+        predator.stealth_active = True
+        
+        class PlainTarget:
+            name = "Dummy"
+            health = 10
+        
+        result = ActionResult(ActionType.ATTACK, True)
+        result.combat_result = CombatResult(predator, PlainTarget(), 10)
+        
+        self.assertEqual(YautjaClanCode.evaluate_action(predator, result), [])
+        self.assertEqual(predator.honour, 50)
+    
     def test_get_clan_judgment_legendary(self):
         predator = PredatorAgent("Hunter")
         predator.honour = 120
@@ -210,6 +268,13 @@ class TestYautjaClanCodeMethods(unittest.TestCase):
         self.assertEqual(YautjaClanCode.get_honour_tier(10), 1)
         self.assertEqual(YautjaClanCode.get_honour_tier(-10), 0)
     
+    def test_get_honour_tier_boundaries(self):
+        self.assertEqual(YautjaClanCode.get_honour_tier(100), 6)
+        self.assertEqual(YautjaClanCode.get_honour_tier(80), 5)
+        self.assertEqual(YautjaClanCode.get_honour_tier(20), 2)
+        self.assertEqual(YautjaClanCode.get_honour_tier(0), 1)
+        self.assertEqual(YautjaClanCode.get_honour_tier(-0.5), 0)
+    
     def test_can_challenge_for_rank_same_tier(self):
         result = YautjaClanCode.can_challenge_for_rank(65, 65)
         self.assertTrue(result)
@@ -226,12 +291,12 @@ class TestYautjaClanCodeMethods(unittest.TestCase):
 class TestClanRelationship(unittest.TestCase):
     
     def test_relationship_values(self):
-        self.assertEqual(ClanRelationship.FATHER.value, "father")
-        self.assertEqual(ClanRelationship.BROTHER.value, "brother")
-        self.assertEqual(ClanRelationship.ELDER.value, "elder")
-        self.assertEqual(ClanRelationship.RIVAL.value, "rival")
-        self.assertEqual(ClanRelationship.MENTOR.value, "mentor")
-        self.assertEqual(ClanRelationship.OUTCAST.value, "outcast")
+        self.assertEqual(ClanRelationship.FATHER, "father")
+        self.assertEqual(ClanRelationship.BROTHER, "brother")
+        self.assertEqual(ClanRelationship.ELDER, "elder")
+        self.assertEqual(ClanRelationship.RIVAL, "rival")
+        self.assertEqual(ClanRelationship.MENTOR, "mentor")
+        self.assertEqual(ClanRelationship.OUTCAST, "outcast")
 
 
 class TestClanReaction(unittest.TestCase):
@@ -271,7 +336,7 @@ class TestHonourTracker(unittest.TestCase):
     
     def test_tracker_creation(self):
         self.assertEqual(self.tracker.agent, self.predator)
-        self.assertEqual(self.tracker.honour_history, [])
+        self.assertEqual(len(self.tracker.honour_history), 0)
         self.assertEqual(self.tracker.violation_count, 0)
         self.assertEqual(self.tracker.reward_count, 0)
     
@@ -301,6 +366,16 @@ class TestHonourTracker(unittest.TestCase):
         
         self.assertEqual(self.tracker.clan_standing, "exemplary")
     
+    def test_clan_standing_drops_with_violations(self):
+        self.predator.honour = 85
+        for _ in range(8):
+            self.tracker.record_change('reward', 10, "Action")
+        self.tracker.record_change('violation', -5, "Action")
+        self.assertEqual(self.tracker.clan_standing, "respected")
+        
+        self.tracker.record_change('violation', -5, "Action")
+        self.assertEqual(self.tracker.clan_standing, "accepted")
+    
     def test_get_summary(self):
         self.predator.honour = 40
         self.tracker.record_change('reward', 10, "Action")
@@ -318,16 +393,25 @@ class TestHonourTracker(unittest.TestCase):
         
         recent = self.tracker.get_recent_history(3)
         self.assertEqual(len(recent), 3)
+        self.assertEqual(recent[-1]['reason'], "Action 9")
+    
+    def test_history_is_bounded(self):
+        for i in range(HONOUR_HISTORY_LIMIT + 10):
+            self.tracker.record_change('reward', 1, f"Action {i}")
+        
+        self.assertEqual(len(self.tracker.honour_history), HONOUR_HISTORY_LIMIT)
+        self.assertEqual(self.tracker.honour_history[-1]['timestamp'], HONOUR_HISTORY_LIMIT + 9)
+        self.assertEqual(self.tracker.get_summary()['history_length'], HONOUR_HISTORY_LIMIT + 10)
 
 
 class TestClanTrialType(unittest.TestCase):
     
     def test_trial_type_values(self):
-        self.assertEqual(ClanTrialType.COMBAT_TRIAL.value, "combat_trial")
-        self.assertEqual(ClanTrialType.HUNT_TRIAL.value, "hunt_trial")
-        self.assertEqual(ClanTrialType.ENDURANCE_TRIAL.value, "endurance_trial")
-        self.assertEqual(ClanTrialType.HONOUR_TRIAL.value, "honour_trial")
-        self.assertEqual(ClanTrialType.RETRIEVAL_TRIAL.value, "retrieval_trial")
+        self.assertEqual(ClanTrialType.COMBAT_TRIAL, "combat_trial")
+        self.assertEqual(ClanTrialType.HUNT_TRIAL, "hunt_trial")
+        self.assertEqual(ClanTrialType.ENDURANCE_TRIAL, "endurance_trial")
+        self.assertEqual(ClanTrialType.HONOUR_TRIAL, "honour_trial")
+        self.assertEqual(ClanTrialType.RETRIEVAL_TRIAL, "retrieval_trial")
 
 
 class TestClanTrial(unittest.TestCase):
@@ -403,6 +487,37 @@ class TestClanTrial(unittest.TestCase):
         self.assertTrue(status['is_active'])
 
 
+class TestClanTrialManager(unittest.TestCase):
+    
+    def setUp(self):
+        self.manager = ClanTrialManager()
+        self.elder = PredatorAgent("Elder")
+        self.hunter = PredatorAgent("Hunter")
+        self.rival = PredatorAgent("Rival")
+    
+    def test_notify_only_updates_matching_agent_and_type(self):
+        endurance = self.manager.create_endurance_trial(self.elder, self.hunter, survival_turns=5)
+        rival_endurance = self.manager.create_endurance_trial(self.elder, self.rival, survival_turns=5)
+        hunt = self.manager.create_hunt_trial(self.elder, self.hunter)
+        
+        self.manager.notify_survival(self.hunter)
+        
+        self.assertEqual(endurance.progress, 1)
+        self.assertEqual(rival_endurance.progress, 0)
+        self.assertEqual(hunt.progress, 0)
+    
+    def test_finished_trials_stop_receiving_notifications(self):
+        trial = self.manager.create_endurance_trial(self.elder, self.hunter, survival_turns=1)
+        self.manager.notify_survival(self.hunter)
+        self.manager.update_trials()
+        
+        self.assertEqual(self.manager.completed_trials, [trial])
+        self.assertEqual(self.manager.get_active_trials_for(self.hunter), [])
+        
+        self.manager.notify_survival(self.hunter)
+        self.assertEqual(trial.progress, 1)
+
+
 class TestYautjaClanCodeRetreat(unittest.TestCase):
     
     def test_retreat_allowed_low_health_high_threat(self):
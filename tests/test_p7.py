@@ -1,9 +1,13 @@
 import unittest
 import sys
 import os
+import json
+import pickle
+import tempfile
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from weather import WeatherState, WeatherSystem
+import event_logger
 from event_logger import EventLogger
 from predator import PredatorAgent
 
@@ -152,6 +156,17 @@ class TestEventLogger(unittest.TestCase):
         self.assertEqual(logger.statistics['combat'], 2)
         self.assertEqual(logger.statistics['movement'], 1)
     
+    def test_statistics_counted_from_type_rows(self):
+        logger = EventLogger()
+        predator = PredatorAgent("Hunter")
+        
+        logger.log_event('combat', predator)
+        logger.log_event('weather_change', None)
+        
+        self.assertEqual(dict(logger.statistics), {'combat': 1, 'weather_change': 1})
+        self.assertEqual(logger.statistics['never_logged'], 0)
+        self.assertNotIn('system', logger.agent_stats)
+    
     def test_log_event_agent_stats(self):
         logger = EventLogger()
         predator = PredatorAgent("Hunter")
@@ -161,6 +176,19 @@ class TestEventLogger(unittest.TestCase):
         
         self.assertEqual(logger.agent_stats['Hunter']['combat'], 2)
     
+    def test_log_event_without_details_gets_fresh_dict(self):
+        logger = EventLogger()
+        predator = PredatorAgent("Hunter")
+        
+        logger.log_event('movement', predator)
+        logger.log_event('movement', predator)
+        
+        self.assertIsNone(logger._details[0])
+        first, second = logger.events
+        first['details']['note'] = 'changed'
+        self.assertEqual(second['details'], {})
+        self.assertEqual(logger.events[0]['details'], {})
+    
     def test_log_event_no_agent(self):
         logger = EventLogger()
         
@@ -363,6 +391,22 @@ class TestEventLoggerAction(unittest.TestCase):
         
         stamina_events = logger.get_events_by_type('stamina_change')
         self.assertEqual(len(stamina_events), 1)
+    
+    def test_log_action_with_combat_and_trophy(self):
+        logger = EventLogger()
+        predator = PredatorAgent("Hunter")
+        victim = PredatorAgent("Victim")
+        
+        from actions import ActionResult, ActionType, CombatResult, Trophy
+        action_result = ActionResult(ActionType.ATTACK, True, 0)
+        action_result.add_combat_result(CombatResult(predator, victim, 40, kill=True))
+        action_result.add_trophy(Trophy("Skull", 'skull', 5))
+        
+        logger.log_action(predator, action_result)
+        
+        self.assertEqual([e['type'] for e in logger.events],
+                         ['action', 'combat', 'kill', 'trophy_collected'])
+        self.assertEqual(logger.get_events_by_type('combat')[0]['details']['damage'], 40)
 
 
 class TestWeatherSystemWithSeed(unittest.TestCase):
@@ -424,6 +468,220 @@ class TestEventLoggerIntegration(unittest.TestCase):
         
         event = logger.events[0]
         self.assertEqual(event['timestamp'], 2)
+    
+    def test_events_view_rebuilt_from_columns(self):
+        logger = EventLogger()
+        predator = PredatorAgent("Hunter")
+        predator.x = 3
+        predator.y = 4
+        
+        logger.log_event('movement', predator, {'to': (3, 4)})
+        logger.increment_step()
+        logger.log_event('system_event', None)
+        
+        self.assertEqual(logger.events, [
+            {'timestamp': 0, 'type': 'movement', 'agent': 'Hunter',
+             'position': (3, 4), 'details': {'to': (3, 4)}},
+            {'timestamp': 1, 'type': 'system_event', 'agent': 'system',
+             'position': None, 'details': {}}
+        ])
+        self.assertEqual(logger.get_agent_events('Hunter'), logger.events[:1])
+    
+    def test_indexed_lookups_follow_log_order(self):
+        logger = EventLogger()
+        hunter = PredatorAgent("Hunter")
+        scout = PredatorAgent("Scout")
+        hunter.honour = 0
+        scout.honour = 0
+        
+        logger.log_honour_change(hunter, 5, "first")
+        logger.log_honour_change(scout, 7, "other")
+        logger.log_event('movement', hunter)
+        logger.log_honour_change(hunter, 3, "second")
+        
+        progression = logger.get_honour_progression('Hunter')
+        self.assertEqual([p['honour'] for p in progression], [5, 8])
+        self.assertEqual(len(logger.get_agent_events('Hunter')), 3)
+        self.assertEqual(logger.get_events_by_type('unknown'), [])
+        self.assertNotIn('unknown', logger._type_ids)
+    
+    def test_honour_progression_running_total(self):
+        logger = EventLogger()
+        hunter = PredatorAgent("Hunter")
+        hunter.honour = 0
+        
+        logger.log_honour_change(hunter, 10, "kill")
+        logger.increment_step()
+        logger.log_honour_change(hunter, -4, "dishonour")
+        
+        self.assertEqual(logger.get_honour_progression('Hunter'), [
+            {'timestamp': 0, 'honour': 10, 'change': 10, 'reason': "kill"},
+            {'timestamp': 1, 'honour': 6, 'change': -4, 'reason': "dishonour"}
+        ])
+        self.assertEqual(logger.get_honour_progression('Nobody'), [])
+    
+    def test_honour_progression_from_either_posting_list(self):
+        logger = EventLogger()
+        hunter = PredatorAgent("Hunter")
+        elder = PredatorAgent("Elder")
+        hunter.honour = 0
+        elder.honour = 0
+        
+        logger.log_honour_change(hunter, 2, "a")
+        for _ in range(5):
+            logger.log_honour_change(elder, 1, "b")
+            logger.log_event('movement', hunter)
+        logger.log_honour_change(hunter, 3, "c")
+        
+        self.assertEqual([p['honour'] for p in logger.get_honour_progression('Hunter')], [2, 5])
+        self.assertEqual([p['honour'] for p in logger.get_honour_progression('Elder')],
+                         [1, 2, 3, 4, 5])
+    
+    def test_simulation_summary_reused_until_log_changes(self):
+        logger = EventLogger()
+        predator = PredatorAgent("Hunter")
+        
+        logger.log_event('combat', predator, {'damage': 5})
+        summary = logger.get_simulation_summary()
+        self.assertEqual(logger.get_simulation_summary(), summary)
+        
+        # Edits and defaultdict lookups on a returned summary stay local
+        summary['total_events'] = 99
+        summary['combat_stats']['kills_by_agent']['Nobody']
+        summary['combat_stats']['damage_by_agent']['Hunter'].append(100)
+        cached = logger.get_simulation_summary()
+        self.assertEqual(cached['total_events'], 1)
+        self.assertNotIn('Nobody', cached['combat_stats']['kills_by_agent'])
+        self.assertEqual(cached['combat_stats']['damage_by_agent']['Hunter'], [5])
+        
+        logger.log_event('combat', predator, {'damage': 15})
+        updated = logger.get_simulation_summary()
+        self.assertEqual(updated['combat_stats']['average_damage'], 10)
+        
+        logger.increment_step()
+        self.assertEqual(logger.get_simulation_summary()['total_steps'], 1)
+    
+    def test_logger_pickles_with_agent_stats(self):
+        logger = EventLogger()
+        predator = PredatorAgent("Hunter")
+        logger.log_event('combat', predator, {'damage': 5})
+        
+        restored = pickle.loads(pickle.dumps(logger))
+        
+        self.assertEqual(restored.agent_stats['Hunter']['combat'], 1)
+        self.assertEqual(restored.agent_stats['Nobody']['combat'], 0)
+        self.assertEqual(restored.events, logger.events)
+    
+    def test_positions_packed_into_short_arrays(self):
+        logger = EventLogger()
+        predator = PredatorAgent("Hunter", x=0, y=0)
+        
+        logger.log_event('movement', predator)
+        logger.log_event('weather_change', None)
+        
+        self.assertEqual(logger._pos_x.typecode, 'h')
+        self.assertEqual([e['position'] for e in logger.events], [(0, 0), None])
+    
+    def test_event_types_interned_once(self):
+        logger = EventLogger()
+        predator = PredatorAgent("Hunter")
+        
+        for event_type in ('combat', 'movement', 'combat', 'combat'):
+            logger.log_event(event_type, predator)
+        
+        self.assertEqual(logger._type_names, ['combat', 'movement'])
+        self.assertEqual(list(logger._type_col), [0, 1, 0, 0])
+        self.assertEqual([e['type'] for e in logger.events],
+                         ['combat', 'movement', 'combat', 'combat'])
+    
+    def test_export_events_json_streams_valid_document(self):
+        logger = EventLogger()
+        predator = PredatorAgent("Hunter")
+        predator.x = 2
+        predator.y = 7
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            empty_path = os.path.join(tmp, 'empty.json')
+            logger.export_events_json(empty_path)
+            with open(empty_path) as f:
+                self.assertEqual(json.load(f)['events'], [])
+            
+            logger.log_event('combat', predator, {'damage': 12})
+            logger.increment_step()
+            logger.log_event('system_event', None)
+            
+            path = os.path.join(tmp, 'nested', 'events.json')
+            logger.export_events_json(path)
+            with open(path) as f:
+                data = json.load(f)
+        
+        self.assertEqual(data['metadata']['total_events'], 2)
+        self.assertEqual(data['statistics'], {'combat': 1, 'system_event': 1})
+        self.assertEqual(data['agent_statistics'], {'Hunter': {'combat': 1}})
+        self.assertEqual(data['events'][0], {
+            'timestamp': 0, 'type': 'combat', 'agent': 'Hunter',
+            'position': [2, 7], 'details': {'damage': 12}
+        })
+        self.assertIsNone(data['events'][1]['position'])
+    
+    @unittest.skipUnless(event_logger.PYARROW_AVAILABLE, "pyarrow not installed")
+    def test_export_events_parquet(self):
+        import pyarrow.parquet
+        logger = EventLogger()
+        predator = PredatorAgent("Hunter")
+        predator.x = 2
+        predator.y = 7
+        
+        logger.log_event('combat', predator, {'damage': 12})
+        logger.log_event('system_event', None)
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'events.parquet')
+            self.assertTrue(logger.export_events_parquet(path))
+            table = pyarrow.parquet.read_table(path).to_pydict()
+        
+        self.assertEqual(table['type'], ['combat', 'system_event'])
+        self.assertEqual(table['x'], [2, None])
+        self.assertEqual(table['damage'], [12, None])
+        self.assertEqual(json.loads(table['details'][0]), {'damage': 12})
+    
+    @unittest.skipIf(event_logger.PYARROW_AVAILABLE, "pyarrow installed")
+    def test_export_events_parquet_without_pyarrow(self):
+        logger = EventLogger()
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'events.parquet')
+            self.assertFalse(logger.export_events_parquet(path))
+            self.assertFalse(os.path.exists(path))
+    
+    def test_running_statistics(self):
+        logger = EventLogger()
+        hunter = PredatorAgent("Hunter")
+        
+        logger.log_event('combat', hunter, {'damage': 10})
+        logger.log_event('combat', hunter, {'damage': 30})
+        logger.log_event('kill', hunter, {'victim': 'Beast', 'damage': 30})
+        logger.log_event('stamina_change', hunter, {'change': -15})
+        logger.log_event('stamina_change', hunter, {'change': 5})
+        logger.log_event('action', hunter, {'action': 'attack', 'stamina_cost': 15})
+        logger.log_event('trophy_collected', hunter, {'type': 'skull', 'honour_value': 8})
+        
+        combat = logger.get_combat_statistics()
+        self.assertEqual(combat['total_combats'], 2)
+        self.assertEqual(combat['average_damage'], 20)
+        self.assertEqual(combat['kills_by_agent']['Hunter'], 1)
+        self.assertEqual(combat['damage_by_agent']['Hunter'], [10, 30])
+        
+        stamina = logger.get_stamina_statistics()
+        self.assertEqual(stamina['total_stamina_spent'], 15)
+        self.assertEqual(stamina['actions_by_cost']['attack(15)'], 1)
+        
+        trophies = logger.get_trophy_collection_summary()
+        self.assertEqual(trophies['total_trophies'], 1)
+        self.assertEqual(trophies['total_honour_value'], 8)
+        
+        combat['damage_by_agent']['Hunter'].append(99)
+        self.assertEqual(logger.get_combat_statistics()['damage_by_agent']['Hunter'], [10, 30])
 
 
 if __name__ == '__main__':
@@ -1,6 +1,8 @@
 import unittest
 import sys
 import os
+import json
+import tempfile
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from config import GameConfig, DEFAULT_CONFIG
@@ -72,12 +74,33 @@ class TestGameConfig(unittest.TestCase):
         config.set("grid", "width", 50)
         value = config.get("grid", "width", 0)
         self.assertEqual(value, 50)
+        self.assertEqual(config.grid_width, 50)
     
     def test_set_new_section(self):
         config = GameConfig(config_path="test_nonexistent.json")
         config.set("new_section", "new_key", "new_value")
         value = config.get("new_section", "new_key", None)
         self.assertEqual(value, "new_value")
+    
+    def test_reload_picks_up_file_changes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "config.json")
+            with open(path, 'w') as f:
+                json.dump({"simulation": {"max_turns": 120}, "extra": {"seed": 7}}, f)
+            
+            first = GameConfig(config_path=path)
+            first.set("extra", "seed", 99)
+            second = GameConfig(config_path=path)
+            self.assertEqual(second.max_turns, 120)
+            self.assertEqual(second.get("extra", "seed"), 7)
+            
+            with open(path, 'w') as f:
+                json.dump({"simulation": {"max_turns": 250, "turn_delay_ms": 100}}, f)
+            os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1))
+            
+            third = GameConfig(config_path=path)
+            self.assertEqual(third.max_turns, 250)
+            self.assertEqual(third.turn_delay, 100)
 
 
 class TestGameConfigProperties(unittest.TestCase):
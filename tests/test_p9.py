@@ -6,6 +6,7 @@ import unittest
 from unittest.mock import Mock, MagicMock, patch
 import random
 import math
+import gc
 
 
 from coordination import (
@@ -13,6 +14,7 @@ from coordination import (
     ThreatAssessment, SharedGoalPlanner, RoleManager, FormationManager,
     CoordinationProtocol
 )
+from grid import Grid
 
 from learning import (
     StateType, ActionSpace, State, Experience, RewardCalculator,
@@ -105,7 +107,17 @@ class TestThreatAssessment(unittest.TestCase):
         threat_level = self.threat.assess_threat(boss, (0, 0))
         
         self.assertGreater(threat_level, 0)
-        self.assertIn(id(boss), self.threat.threat_levels)
+        self.assertIn(boss, self.threat.threat_levels)
+    
+    def test_threat_levels_drop_collected_enemies(self):
+        boss = MockBoss()
+        self.threat.assess_threat(boss, (0, 0))
+        self.assertEqual(len(self.threat.threat_levels), 1)
+        
+        del boss
+        gc.collect()
+        
+        self.assertEqual(len(self.threat.threat_levels), 0)
     
     def test_assess_threat_wildlife(self):
         wildlife = MockAgent("Wildlife", 5, 5)
@@ -127,6 +139,7 @@ class TestThreatAssessment(unittest.TestCase):
         
         self.assertIsNotNone(highest)
         self.assertEqual(highest.name, "Boss")
+        self.assertEqual(list(self.threat.threat_history), [(id(highest), level)])
     
     def test_danger_zones(self):
         self.threat.mark_danger_zone((5, 5), radius=2)
@@ -144,6 +157,13 @@ class TestThreatAssessment(unittest.TestCase):
         threat_level = self.threat.assess_threat(dead_enemy, (0, 0))
         
         self.assertEqual(threat_level, 0)
+    
+    def test_threat_history_is_bounded(self):
+        enemy = MockAgent("Wildlife", 2, 2)
+        for _ in range(150):
+            self.threat.assess_threat(enemy, (0, 0))
+        
+        self.assertEqual(len(self.threat.threat_history), 100)
 
 
 class TestSharedGoalPlanner(unittest.TestCase):
@@ -181,6 +201,36 @@ class TestSharedGoalPlanner(unittest.TestCase):
         
         self.assertEqual(self.planner.goals[0].priority, ActionPriority.CRITICAL)
     
+    def test_goal_priority_upgrade_moves_goal_to_front(self):
+        survive = SharedGoal(GoalType.SURVIVE, ActionPriority.LOW)
+        self.planner.add_goal(SharedGoal(GoalType.DEFEAT_BOSS, ActionPriority.HIGH))
+        self.planner.add_goal(SharedGoal(GoalType.HUNT_TARGET, ActionPriority.MEDIUM))
+        self.planner.add_goal(survive)
+        
+        self.planner.add_goal(SharedGoal(GoalType.SURVIVE, ActionPriority.CRITICAL))
+        
+        self.assertEqual(len(self.planner.goals), 3)
+        self.assertIs(self.planner.goals[0], survive)
+        self.assertEqual(survive.priority, ActionPriority.CRITICAL)
+    
+    def test_active_goals_in_priority_order(self):
+        goals = [
+            SharedGoal(GoalType.SURVIVE, ActionPriority.LOW),
+            SharedGoal(GoalType.DEFEAT_BOSS, ActionPriority.HIGH),
+            SharedGoal(GoalType.HUNT_TARGET, ActionPriority.MEDIUM),
+            SharedGoal(GoalType.ESCAPE_DANGER, ActionPriority.CRITICAL),
+            SharedGoal(GoalType.HEAL_ALLY, ActionPriority.MEDIUM)
+        ]
+        for goal in goals:
+            self.planner.add_goal(goal)
+        self.planner.remove_goal(goals[3])
+        
+        priorities = [g.priority for g in self.planner.get_active_goals()]
+        
+        self.assertEqual(priorities, [ActionPriority.HIGH, ActionPriority.MEDIUM,
+                                      ActionPriority.MEDIUM, ActionPriority.LOW])
+        self.assertIs(self.planner.get_active_goals()[1], goals[2])
+    
     def test_evaluate_situation_low_health(self):
         self.planner.register_agent(self.dek, Role.LEADER)
         self.dek.health = 20
@@ -199,6 +249,15 @@ class TestSharedGoalPlanner(unittest.TestCase):
         
         self.assertIn("Dek", goal.assigned_agents)
     
+    def test_assign_goal_ignores_duplicates(self):
+        goal = SharedGoal(GoalType.HUNT_TARGET, ActionPriority.MEDIUM, assigned_agents=["Thia"])
+        
+        self.planner.assign_goal(goal, "Thia")
+        self.planner.assign_goal(goal, "Dek")
+        self.planner.assign_goal(goal, "Dek")
+        
+        self.assertEqual(goal.assigned_agents, ["Thia", "Dek"])
+    
     def test_update_goal_progress(self):
         goal = SharedGoal(GoalType.HUNT_TARGET, ActionPriority.MEDIUM)
         self.planner.add_goal(goal)
@@ -227,7 +286,8 @@ class TestRoleManager(unittest.TestCase):
         
         capabilities = self.role_manager.get_capabilities("Dek")
         
-        self.assertTrue(capabilities.get('can_command', False))
+        self.assertTrue(capabilities.can_command)
+        self.assertFalse(self.role_manager.get_capabilities("Nobody").can_command)
     
     def test_stat_bonus(self):
         self.role_manager.assign_role(self.thia, Role.SUPPORT)
@@ -235,6 +295,15 @@ class TestRoleManager(unittest.TestCase):
         healing_bonus = self.role_manager.get_stat_bonus("Thia", "healing")
         
         self.assertGreater(healing_bonus, 1.0)
+        self.assertEqual(self.role_manager.get_stat_bonus("Thia", "armor"), 1.0)
+    
+    def test_role_tables_are_read_only(self):
+        with self.assertRaises(TypeError):
+            RoleManager.ROLE_CAPABILITIES[Role.SCOUT] = None
+        with self.assertRaises(TypeError):
+            RoleManager.ROLE_CAPABILITIES[Role.SUPPORT].stat_bonus['healing'] = 9.0
+        with self.assertRaises(TypeError):
+            FormationManager.FORMATIONS['defensive'] = None
     
     def test_recommend_action(self):
         self.role_manager.assign_role(self.thia, Role.SUPPORT)
@@ -297,6 +366,29 @@ class TestFormationManager(unittest.TestCase):
         recommended = self.formation.recommend_formation(situation)
         
         self.assertIn(recommended, ['flanking', 'surround'])
+    
+    def test_recommend_formation_keeps_threshold_boundaries(self):
+        def recommend(**overrides):
+            situation = {'leader_health': 80, 'support_health': 80, 'enemy_count': 1,
+                         'enemy_distance': 10.0, 'boss_present': False}
+            situation.update(overrides)
+            return self.formation.recommend_formation(situation)
+        
+        self.assertEqual(recommend(leader_health=29.9), 'retreat')
+        self.assertEqual(recommend(leader_health=30.0), 'defensive')
+        self.assertEqual(recommend(enemy_distance=4.99), 'aggressive')
+        self.assertEqual(recommend(enemy_distance=5.0), 'defensive')
+        self.assertEqual(recommend(enemy_distance=2.99, boss_present=True), 'flanking')
+        self.assertEqual(recommend(enemy_distance=3.0, boss_present=True), 'surround')
+        self.assertEqual(recommend(enemy_count=7, enemy_distance=1.0), 'defensive')
+    
+    def test_recommend_formation_with_no_enemy_visible(self):
+        situation = {'leader_health': 80, 'support_health': 80, 'enemy_count': 0,
+                     'enemy_distance': float('inf'), 'boss_present': False}
+        
+        self.assertEqual(self.formation.recommend_formation(situation), 'defensive')
+        situation['boss_present'] = True
+        self.assertEqual(self.formation.recommend_formation(situation), 'surround')
 
 
 class TestCoordinationProtocol(unittest.TestCase):
@@ -320,6 +412,13 @@ class TestCoordinationProtocol(unittest.TestCase):
         self.assertEqual(comm['receiver'], 'Thia')
         self.assertEqual(len(self.protocol.communication_log), 1)
     
+    def test_communication_log_is_bounded(self):
+        for i in range(60):
+            self.protocol.communicate(self.dek, self.thia, 'status', {'turn': i})
+        
+        self.assertEqual(len(self.protocol.communication_log), 50)
+        self.assertEqual(self.protocol.communication_log[0]['data'], {'turn': 10})
+    
     def test_request_help(self):
         self.protocol.initialize(self.dek, self.thia)
         
@@ -327,6 +426,9 @@ class TestCoordinationProtocol(unittest.TestCase):
         
         self.assertEqual(action.action_type, 'request_help')
         self.assertTrue(action.requires_sync)
+        
+        self.protocol.coordinate_attack([self.dek, self.thia], MockAgent("Enemy", 12, 10))
+        self.assertEqual(self.protocol.get_coordination_stats()['synced_actions_pending'], 3)
     
     def test_provide_cover(self):
         action = self.protocol.provide_cover(self.thia, self.dek)
@@ -352,6 +454,70 @@ class TestCoordinationProtocol(unittest.TestCase):
         self.protocol.plan_coordinated_turn(self.dek, self.thia, enemies, self.grid)
         
         self.assertGreaterEqual(self.protocol.coordination_score, 0)
+    
+    def test_scan_enemies_finds_nearest_and_boss(self):
+        near = MockAgent("Near", 11, 11)
+        boss = MockBoss(15, 15)
+        far = MockAgent("Far", 20, 20)
+        
+        scan = self.protocol._scan_enemies(self.dek, [far, boss, near])
+        
+        self.assertIs(scan.nearest, near)
+        self.assertEqual(scan.nearest_distance_sq, 2)
+        self.assertIs(scan.boss, boss)
+        self.assertEqual(scan.boss_distance_sq, 50)
+    
+    def test_retreat_uses_planned_enemies_in_range(self):
+        grid = Grid(30, 30)
+        enemies = [MockAgent("Near", 12, 10), MockAgent("Far", 25, 25)]
+        enemies[0].aggression_level = 0.5
+        enemies[1].aggression_level = 0.5
+        self.protocol.plan_coordinated_turn(self.dek, self.thia, enemies, grid)
+        
+        action = CoordinatedAction(agent_name="Dek", action_type='retreat')
+        
+        self.assertTrue(self.protocol.execute_coordinated_action(action, self.dek, grid, {}))
+        self.assertEqual((self.dek.x, self.dek.y), (9, 9))
+    
+    def test_retreat_rescans_grid_after_occupants_change(self):
+        from creatures import WildlifeAgent
+        grid = Grid(30, 30)
+        self.protocol.plan_coordinated_turn(self.dek, self.thia, [MockAgent("Far", 25, 25)], grid)
+        
+        grid.place_agent(WildlifeAgent("Spawned", "predator", 12, 10), 12, 10)
+        action = CoordinatedAction(agent_name="Dek", action_type='retreat')
+        
+        self.assertTrue(self.protocol.execute_coordinated_action(action, self.dek, grid, {}))
+        self.assertEqual((self.dek.x, self.dek.y), (9, 9))
+        self.assertIsNone(self.protocol._last_enemies)
+    
+    def test_move_to_steps_towards_position(self):
+        action = CoordinatedAction(agent_name="Dek", action_type='move_to', position=(15, 12))
+        
+        self.assertTrue(self.protocol.execute_coordinated_action(action, self.dek, self.grid, {}))
+        self.assertEqual((self.dek.x, self.dek.y), (11, 11))
+    
+    def test_move_to_wraps_around_grid_edge(self):
+        agent = MockAgent("Dek", 0, 0)
+        action = CoordinatedAction(agent_name="Dek", action_type='move_to', position=(29, 0))
+        
+        self.protocol.execute_coordinated_action(action, agent, self.grid, {})
+        self.assertEqual((agent.x, agent.y), (29, 0))
+    
+    def test_attack_damage_reproducible_from_run_rng(self):
+        def attack_damage(seed):
+            protocol = CoordinationProtocol()
+            protocol.set_rng(random.Random(seed))
+            dealt = []
+            for _ in range(5):
+                target = MockAgent("Target", 11, 10, health=1000, max_health=1000)
+                protocol._execute_attack(self.dek, target)
+                protocol._execute_support_attack(self.thia, target)
+                dealt.append(1000 - target.health)
+            return dealt
+        
+        self.assertEqual(attack_damage(7), attack_damage(7))
+        self.assertTrue(all(45 <= d <= 75 for d in attack_damage(3)))
 
 
 class TestState(unittest.TestCase):